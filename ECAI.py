@@ -6,8 +6,8 @@ from package.restricted_lorenz.solving.contribution_algo import (
 from package.restricted_lorenz.solving.optimum import FILE_NAME as r_optim_file
 from package.plot.expermiment_comparisons import (
     experiment_comparison,
-    experiment_pairwise_comparison,
-    pairwise_generator_timedout,
+    experiment_pairwise_comparisons,
+    pairwise_selection_timedout,
 )
 from explanation import explain_float, explain_int_fixed
 from generation import process_int_fixed
@@ -22,25 +22,25 @@ def restricted_lorenz_comparison(exp_path: str):
     experiment_comparison(exp_path, hlp_file, True)
     experiment_comparison(exp_path, contrib_file, True)
     experiment_comparison(exp_path, r_optim_file, True)
-    experiment_pairwise_comparison(
-        exp_path, contrib_file, hlp_file, pairwise_generator_timedout
-    )
-    experiment_pairwise_comparison(
-        exp_path, r_optim_file, contrib_file, pairwise_generator_timedout
-    )
-    experiment_pairwise_comparison(
-        exp_path, r_optim_file, hlp_file, pairwise_generator_timedout
+    experiment_pairwise_comparisons(
+        exp_path,
+        [
+            (contrib_file, hlp_file),
+            (r_optim_file, contrib_file),
+            (r_optim_file, hlp_file),
+        ],
+        pairwise_selection_timedout,
     )
 
 
 if __name__ == "__main__":
-    generation_example(".\\ECAI\\Paper_Example")
-    explain_float(".\\ECAI\\Paper_Example", ".\\ECAI\\Paper_Example\\output.txt")
+    generation_example("./ECAI/Paper_Example")
+    explain_float("./ECAI/Paper_Example", "./ECAI/Paper_Example/output.txt")
 
     # for n in [5, 10, 20, 50]:
     for n in [5]:
         print(f"Restricted Lorenz dominance for n={n} :")
-        EXP_PATH = f".\\ECAI\\Int_{n}cri_{n*200}sum_10_cand"
+        EXP_PATH = f"./ECAI/Int_{n}cri_{n*200}sum_10_cand"
         process_int_fixed(
             path=EXP_PATH,
             nb_fold=10,
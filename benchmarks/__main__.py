@@ -0,0 +1,21 @@
+"""Runs the benchmark suite.
+
+Usage:
+    python -m benchmarks <folder> [<baseline benchmark.csv>]
+Saves <folder>/benchmark.csv and, with a baseline,
+<folder>/benchmark_comparison.csv (non zero exit status on regression).
+"""
+from sys import argv, exit as sysexit, stderr
+from .suite import run_benchmarks, compare_benchmarks
+
+if __name__ == "__main__":
+    if len(argv) < 2:
+        print(__doc__, file=stderr)
+        sysexit(2)
+    run_benchmarks(argv[1])
+    if len(argv) > 2:
+        comparison = compare_benchmarks(argv[1], argv[2])
+        regressions = [row for row in comparison if row[-1] == "regression"]
+        for row in regressions:
+            print("Regression:", *row[:5], f"P50 x{row[7]:.2f}", file=stderr)
+        sysexit(1 if regressions else 0)
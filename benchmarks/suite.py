@@ -0,0 +1,287 @@
+"""Benchmark suite of the explanation methods :
+    - generating reproducible instances for a grid of (nb_var, nb_cand, nb_pi, ndigits)
+    - running every method of the kind of each instance on its dominances, with warmup
+    and repetitions
+    - summarizing the latencies (mean and percentiles) and the throughput by method
+    - comparing a benchmark to a stored baseline to detect regressions
+"""
+from csv import reader
+from math import fsum
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+from numpy import percentile
+from package.data.layout import ExperimentLayout
+from package.data.generation import generation_process
+from package.data.save import save_data_analysis
+from package.timing import PHASES
+from package.tasks import DOMINANCES, KINDS, METHODS, collect_row, load_fold
+
+# (nb_var, nb_cand, nb_pi, ndigits)
+GRID = [
+    (4, 20, 2, 0),
+    (6, 20, 2, 0),
+    (4, 20, 2, 3),
+    (6, 20, 2, 3),
+    (6, 20, 5, 3),
+]
+
+BENCHMARK_HEADER = [
+    "nb_var",
+    "nb_cand",
+    "nb_pi",
+    "ndigits",
+    "method",
+    "#Runs",
+    "#Timeout",
+    "Throughput",
+    "Mean",
+    "P50",
+    "P90",
+    "P99",
+    "Max",
+    "Solve mean",
+]
+
+COMPARISON_HEADER = [
+    "nb_var",
+    "nb_cand",
+    "nb_pi",
+    "ndigits",
+    "method",
+    "Baseline P50",
+    "P50",
+    "P50 ratio",
+    "Baseline throughput",
+    "Throughput",
+    "Status",
+]
+
+
+def instance_path(root: str, nb_var: int, nb_cand: int, nb_pi: int, ndigits: int):
+    """Returns the path of the experiment folder of an instance of the grid.
+
+    Args:
+        root (str): Path to the benchmark folder.
+        nb_var (int): Number of criteria.
+        nb_cand (int): Number of candidates.
+        nb_pi (int): Number of preferential information statements.
+        ndigits (int): Precision (number of digit after the coma).
+    """
+    return Path(root) / f"{nb_var}cri_{nb_cand}cand_{nb_pi}pi_{ndigits}digits"
+
+
+def generate_instance(
+    root: str, nb_var: int, nb_cand: int, nb_pi: int, ndigits: int, seed: int = 404
+):
+    """Generates (once) the instance of the grid with a single fold, with integer
+    candidates in [0, 100] when ndigits is 0 and continuous candidates in [0, 1]
+    otherwise. Returns the path of its experiment folder.
+
+    Args:
+        root (str): Path to the benchmark folder.
+        nb_var (int): Number of criteria.
+        nb_cand (int): Number of candidates.
+        nb_pi (int): Number of preferential information statements.
+        ndigits (int): Precision (number of digit after the coma).
+        seed (int, optional): Seed value for fixing randomness. The default value is 404.
+    """
+    path = instance_path(root, nb_var, nb_cand, nb_pi, ndigits)
+    if not ExperimentLayout(path).meta.exists():
+        low, high, epsilon = (0, 100, 1) if ndigits == 0 else (0.0, 1.0, 1e-3)
+        generation_process(
+            path=str(path),
+            nb_fold=1,
+            nb_var=nb_var,
+            nb_cand=nb_cand,
+            nb_pi=nb_pi,
+            low=low,
+            high=high,
+            epsilon=epsilon,
+            ndigits=ndigits,
+            seed=seed,
+        )
+    return path
+
+
+def instance_methods(nb_pi: int, ndigits: int) -> List[str]:
+    """Returns the methods benchmarked on an instance: restricted and generalized
+    Lorenz methods, and robust redistributive OWA methods for continuous candidates
+    with preferential information (as explain_int and explain_float).
+
+    Args:
+        nb_pi (int): Number of preferential information statements.
+        ndigits (int): Precision (number of digit after the coma).
+    """
+    groups = KINDS["int" if ndigits == 0 or nb_pi == 0 else "float"]
+    return [method for method, (group, _, _) in METHODS.items() if group in groups]
+
+
+def benchmark_method(
+    exp_path: str, method: str, warmup: int = 1, repetitions: int = 3, max_pairs=20
+):
+    """Runs a method on the first max_pairs dominances of the first fold of
+    an experiment, warmup times without measure then repetitions times.
+    Returns the latency (compute time) and the solving time of each run.
+
+    Args:
+        exp_path (str): Path to the root of the experiment folder.
+        method (str): Name of the method (its results file name, see METHODS).
+        warmup (int, optional): Number of runs on the first pair before measuring.
+        The default value is 1.
+        repetitions (int, optional): Number of measured runs by pair.
+        The default value is 3.
+        max_pairs (int, optional): Maximum number of pairs. The default value is 20.
+    """
+    meta, data, pi_statements = load_fold(exp_path, 0)
+    group, _, arguments = METHODS[method]
+    pairs = list(DOMINANCES[group](ExperimentLayout(exp_path).fold(0).path))
+    pairs = pairs[:max_pairs]
+    latencies, solve_times, nb_timeout = [], [], 0
+    if not pairs:
+        return latencies, solve_times, nb_timeout
+    i, j = pairs[0]
+    for _ in range(warmup):
+        collect_row(
+            *arguments(data[i], data[j], pi_statements, meta[4], meta[5], meta[9])
+        )
+    for i, j in pairs:
+        task = arguments(data[i], data[j], pi_statements, meta[4], meta[5], meta[9])
+        for _ in range(repetitions):
+            row = collect_row(*task)
+            latencies.append(row[1])
+            solve_times.append(row[3 + PHASES.index("solve")])
+            nb_timeout += row[0] == -3
+    return latencies, solve_times, nb_timeout
+
+
+def latency_statistics(latencies: Sequence[float], solve_times: Sequence[float]):
+    """Returns the throughput (runs by second), the mean, the 50th, 90th and 99th
+    percentiles and the maximum of the latencies, and the mean solving time.
+
+    Args:
+        latencies (Sequence[float]): Latency of each run.
+        solve_times (Sequence[float]): Solving time of each run.
+    """
+    if len(latencies) == 0:
+        return "NaN", "NaN", "NaN", "NaN", "NaN", "NaN", "NaN"
+    total = fsum(latencies)
+    p50, p90, p99 = percentile(latencies, [50, 90, 99]).tolist()
+    return (
+        len(latencies) / total if total > 0 else "NaN",
+        total / len(latencies),
+        p50,
+        p90,
+        p99,
+        max(latencies),
+        fsum(solve_times) / len(solve_times),
+    )
+
+
+def run_benchmarks(
+    root: str,
+    grid: Sequence[Tuple[int, int, int, int]] = GRID,
+    warmup: int = 1,
+    repetitions: int = 3,
+    max_pairs: int = 20,
+    seed: int = 404,
+):
+    """Runs the benchmark of every method on every instance of the grid and saves
+    the summary of each (instance, method) in root/benchmark.csv.
+    Returns the rows of the summary.
+
+    Args:
+        root (str): Path to the benchmark folder.
+        grid (Sequence[Tuple[int, int, int, int]], optional): Instances parameters
+        (nb_var, nb_cand, nb_pi, ndigits). The default value is GRID.
+        warmup (int, optional): Number of unmeasured runs by method and instance.
+        The default value is 1.
+        repetitions (int, optional): Number of measured runs by pair.
+        The default value is 3.
+        max_pairs (int, optional): Maximum number of pairs by method and instance.
+        The default value is 20.
+        seed (int, optional): Seed value for fixing randomness. The default value is 404.
+    """
+    Path(root).mkdir(parents=True, exist_ok=True)
+    rows = []
+    for nb_var, nb_cand, nb_pi, ndigits in grid:
+        path = generate_instance(root, nb_var, nb_cand, nb_pi, ndigits, seed)
+        for method in instance_methods(nb_pi, ndigits):
+            latencies, solve_times, nb_timeout = benchmark_method(
+                str(path), method, warmup, repetitions, max_pairs
+            )
+            rows.append(
+                [
+                    nb_var,
+                    nb_cand,
+                    nb_pi,
+                    ndigits,
+                    method,
+                    len(latencies),
+                    nb_timeout,
+                    *latency_statistics(latencies, solve_times),
+                ]
+            )
+    save_data_analysis(root, "benchmark", BENCHMARK_HEADER, rows)
+    return rows
+
+
+def load_benchmark(file_name: str) -> Dict[Tuple, Dict[str, float]]:
+    """Loads a benchmark summary (see run_benchmarks) in a dictionary keyed by
+    (nb_var, nb_cand, nb_pi, ndigits, method).
+
+    Args:
+        file_name (str): Path to the benchmark.csv file.
+    """
+    with open(file_name, "r", newline="", encoding="utf8") as f:
+        lines = reader(f, delimiter=";")
+        header = next(lines)
+        return {
+            (int(x[0]), int(x[1]), int(x[2]), int(x[3]), x[4]): {
+                name: float(value) for name, value in zip(header[5:], x[5:])
+            }
+            for x in lines
+        }
+
+
+def compare_benchmarks(
+    root: str, baseline_file: str, tolerance: float = 0.1
+) -> List[List]:
+    """Compares the benchmark of root/benchmark.csv to a stored baseline and saves
+    the comparison in root/benchmark_comparison.csv. A method of an instance is a
+    regression when its median latency grew by more than the tolerance,
+    an improvement when it decreased by more than the tolerance.
+    Returns the rows of the comparison.
+
+    Args:
+        root (str): Path to the benchmark folder.
+        baseline_file (str): Path to the benchmark.csv file of the baseline.
+        tolerance (float, optional): Relative tolerance on the median latency.
+        The default value is 0.1.
+    """
+    baseline = load_benchmark(baseline_file)
+    current = load_benchmark(str(Path(root) / "benchmark.csv"))
+    rows = []
+    for key, statistics in current.items():
+        if key not in baseline:
+            continue
+        p50, baseline_p50 = statistics["P50"], baseline[key]["P50"]
+        ratio = p50 / baseline_p50 if baseline_p50 > 0 else float("nan")
+        if ratio > 1 + tolerance:
+            status = "regression"
+        elif ratio < 1 - tolerance:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append(
+            [
+                *key,
+                baseline_p50,
+                p50,
+                ratio,
+                baseline[key]["Throughput"],
+                statistics["Throughput"],
+                status,
+            ]
+        )
+    save_data_analysis(root, "benchmark_comparison", COMPARISON_HEADER, rows)
+    return rows
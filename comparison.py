@@ -1,8 +1,8 @@
 from itertools import combinations
 from package.plot.expermiment_comparisons import (
     experiment_comparison,
-    experiment_pairwise_comparison,
-    pairwise_generator_timedout,
+    experiment_pairwise_comparisons,
+    pairwise_selection_timedout,
 )
 
 from package.restricted_lorenz.solving.hlp import FILE_NAME as hlp_file
@@ -32,41 +32,35 @@ from package.robust_owa.solving.ctx.from_farkas_displaced import (
 )
 
 if __name__ == "__main__":
-    EXP_PATH = ".\\Datasets\\Float_5cri_10cand"
+    EXP_PATH = "./Datasets/Float_5cri_10cand"
 
     # Restricted Lorenz comparison
     experiment_comparison(EXP_PATH, hlp_file, True)
     experiment_comparison(EXP_PATH, contrib_file, True)
     experiment_comparison(EXP_PATH, r_optim_file, True)
 
-    experiment_pairwise_comparison(
-        EXP_PATH, contrib_file, hlp_file, pairwise_generator_timedout
-    )
-    experiment_pairwise_comparison(
-        EXP_PATH, r_optim_file, contrib_file, pairwise_generator_timedout
-    )
-    experiment_pairwise_comparison(
-        EXP_PATH, r_optim_file, hlp_file, pairwise_generator_timedout
+    experiment_pairwise_comparisons(
+        EXP_PATH,
+        [
+            (contrib_file, hlp_file),
+            (r_optim_file, contrib_file),
+            (r_optim_file, hlp_file),
+        ],
+        pairwise_selection_timedout,
     )
 
     # Generalized Lorenz comparison
     experiment_comparison(EXP_PATH, gen_optim_file, True)
     experiment_comparison(EXP_PATH, after_contrib_file, True)
     experiment_comparison(EXP_PATH, after_hlp_file, True)
-    experiment_pairwise_comparison(
+    experiment_pairwise_comparisons(
         EXP_PATH,
-        after_contrib_file,
-        after_hlp_file,
-        pairwise_generator_timedout,
-    )
-    experiment_pairwise_comparison(
-        EXP_PATH,
-        gen_optim_file,
-        after_contrib_file,
-        pairwise_generator_timedout,
-    )
-    experiment_pairwise_comparison(
-        EXP_PATH, gen_optim_file, after_hlp_file, pairwise_generator_timedout
+        [
+            (after_contrib_file, after_hlp_file),
+            (gen_optim_file, after_contrib_file),
+            (gen_optim_file, after_hlp_file),
+        ],
+        pairwise_selection_timedout,
     )
 
     # Robust redistributive OWA comparison
@@ -77,10 +71,6 @@ if __name__ == "__main__":
     ]
     for m in methods:
         experiment_comparison(EXP_PATH, m, True)
-    for m1, m2 in combinations(methods, 2):
-        experiment_pairwise_comparison(
-            EXP_PATH,
-            m1,
-            m2,
-            pairwise_generator_timedout,
-        )
+    experiment_pairwise_comparisons(
+        EXP_PATH, list(combinations(methods, 2)), pairwise_selection_timedout
+    )
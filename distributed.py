@@ -0,0 +1,169 @@
+"""Distributed explanation experiments: a coordinator fills a task queue (SQLite database
+on a storage shared by all the nodes) with chunks of pairs of each method of each fold,
+any number of workers on any node compute them, and the results are merged back into
+the results file of each method.
+
+Usage:
+    python distributed.py coordinate <queue.db> <kind> <experiment> [<experiment> ...]
+    python distributed.py work <queue.db>
+    python distributed.py merge <queue.db>
+with kind among int_fixed, int and float (see explain_int_fixed, explain_int and
+explain_float).
+"""
+from os import getpid
+from socket import gethostname
+from sys import argv, stderr
+from typing import List
+from package.data.layout import ExperimentLayout
+from package.data.save import save_experiment_data_factory
+from package.data.load import load_cached_meta_data
+from package.scheduling import expected_cost
+from package.tasks import DOMINANCES, METHODS, KINDS, collect_row, load_fold
+from package.work_queue import (
+    create_queue,
+    add_tasks,
+    connect_queue,
+    claim_task,
+    lease_heartbeat,
+    complete_task,
+    queue_methods,
+    queue_progress,
+    load_queue_results,
+)
+
+CHUNK_SIZE = 50
+
+
+def coordinate(db_path: str, kind: str, exp_paths: List[str], chunk_size=CHUNK_SIZE):
+    """Creates the queue and adds, for each fold of each experiment, the tasks of the
+    methods of the kind of experiment by chunks of chunk_size pairs. The expected cost
+    of a chunk is the sum of the expected costs of its pairs for exact methods.
+
+    Args:
+        db_path (str): Path to the SQLite database.
+        kind (str): Kind of experiments (int_fixed, int or float).
+        exp_paths (List[str]): Paths to the root of the experiment folders.
+        chunk_size (int, optional): Number of pairs by task. The default value is 50.
+    """
+    create_queue(db_path)
+    for exp_path in exp_paths:
+        nb_exp = load_cached_meta_data(exp_path)[0]
+        for fold in range(nb_exp):
+            meta, data, pi_statements = load_fold(exp_path, fold)
+            for group in KINDS[kind]:
+                # The preferential information only weighs on the robust methods
+                nb_pi = len(pi_statements) if group == "robust" else 0
+                pairs = list(
+                    DOMINANCES[group](ExperimentLayout(exp_path).fold(fold).path)
+                )
+                costs = [
+                    expected_cost(data[i], data[j], meta[9], nb_pi) for i, j in pairs
+                ]
+                add_tasks(
+                    db_path,
+                    [
+                        (
+                            exp_path,
+                            fold,
+                            method,
+                            start,
+                            min(start + chunk_size, len(pairs)),
+                            sum(costs[start : start + chunk_size]) if exact else 0.0,
+                        )
+                        for method, (method_group, exact, _) in METHODS.items()
+                        if method_group == group
+                        for start in range(0, len(pairs), chunk_size)
+                    ],
+                )
+
+
+def work(db_path: str, worker: str = ""):
+    """Claims and computes tasks of the queue until none is left.
+
+    Args:
+        db_path (str): Path to the SQLite database.
+        worker (str, optional): Name of the worker. Defaults to host:pid.
+    """
+    worker = worker or f"{gethostname()}:{getpid()}"
+    folds = {}
+    connection = connect_queue(db_path)
+    try:
+        while True:
+            task = claim_task(connection, worker)
+            if task is None:
+                return
+            _, exp_path, fold, method, start, stop = task
+            if (exp_path, fold) not in folds:
+                folds[(exp_path, fold)] = (*load_fold(exp_path, fold), {})
+            meta, data, pi_statements, dominances = folds[(exp_path, fold)]
+            group, _, arguments = METHODS[method]
+            if group not in dominances:
+                dominances[group] = list(
+                    DOMINANCES[group](ExperimentLayout(exp_path).fold(fold).path)
+                )
+            rows = []
+            with lease_heartbeat(db_path, task, worker):
+                for i, j in dominances[group][start:stop]:
+                    rows.append(
+                        (
+                            i,
+                            j,
+                            *collect_row(
+                                *arguments(
+                                    data[i],
+                                    data[j],
+                                    pi_statements,
+                                    meta[4],
+                                    meta[5],
+                                    meta[9],
+                                )
+                            ),
+                        )
+                    )
+            complete_task(connection, task, rows)
+    finally:
+        connection.close()
+
+
+def merge(db_path: str):
+    """Writes the results file of each method of each fold whose tasks are all done,
+    in the order of the dominances (as explain_int_fixed, explain_int
+    and explain_float do). The results files of the methods missing the results
+    of some pairs (e.g. dominances changed since the coordination) are not written.
+    Returns the missing pairs of each of these (experiment, fold, method).
+
+    Args:
+        db_path (str): Path to the SQLite database.
+    """
+    missing = {}
+    for exp_path, fold, method in queue_methods(db_path):
+        fold_path = ExperimentLayout(exp_path).fold(fold).path
+        results = load_queue_results(db_path, exp_path, fold, method)
+        pairs = list(DOMINANCES[METHODS[method][0]](fold_path))
+        absent = [(i, j) for i, j in pairs if (i, j) not in results]
+        if absent:
+            missing[(exp_path, fold, method)] = absent
+            continue
+        writer = save_experiment_data_factory(fold_path, method)
+        for i, j in pairs:
+            writer.send(results[(i, j)])
+        writer.close()
+    return missing
+
+
+if __name__ == "__main__":
+    if len(argv) < 3 or argv[1] not in ("coordinate", "work", "merge"):
+        print(__doc__, file=stderr)
+    elif argv[1] == "coordinate":
+        coordinate(argv[2], argv[3], argv[4:])
+        print(queue_progress(argv[2]), file=stderr)
+    elif argv[1] == "work":
+        work(argv[2])
+    else:
+        for (experiment, fold, method), pairs in merge(argv[2]).items():
+            print(
+                f"{experiment} fold {fold} {method}: {len(pairs)} missing pairs"
+                f" {pairs}",
+                file=stderr,
+            )
+        print(queue_progress(argv[2]), file=stderr)
@@ -1,14 +1,34 @@
 """Main example aiming at generating explanations from previously generated data."""
-from time import perf_counter, strftime, localtime, sleep
-from multiprocessing.context import TimeoutError as TimedOut
-from package.plot.types import PREFERENTIAL_INFORMATION
-from package.data.save import save_experiment_data_factory
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from time import strftime, localtime, sleep
+from itertools import islice
+from typing import Tuple
+from package.data.layout import ExperimentLayout
+from package.profiling import PROFILE_HEADER, reset_profile, profile_summary
+from package.run_options import run_options, enable_run_options
+from package.tasks import (
+    save_with_perf,
+    save_with_perf_farkas,
+    collect_row,
+    collect_explained_row,
+)
+from package.data.save import (
+    save_data_analysis,
+    save_experiment_data_factory,
+    save_checkpoint_factory,
+    save_explanations_factory,
+)
+from package.scheduling import expected_cost, longest_expected_job_first_results
 from package.data.load import (
+    load_checkpoint,
     load_dataset,
     load_meta_data,
     load_restricted_lorenz_dominances,
     load_generalized_lorenz_dominances,
     load_robust_redistributive_owa_dominances,
+    prefetched,
 )
 
 from package.restricted_lorenz import (
@@ -55,88 +75,144 @@ from package.robust_owa.solving.ctx.from_farkas_displaced import (
     file_name as ctx_displaced_file,
 )
 
+# Number of tasks held in memory (and scheduled together when parallel)
+TASKS_BATCH = 1 << 12
 
-def save_with_perf(writer, computation_func, args, output_file=None):
-    """Executes the given explanation computation and saves its length and compute time.
+
+def checkpointed_writer(writer, checkpoint, key):
+    """Generator object which sends the received experiment data to the writer
+    and to the checkpoint with its key (method, i, j).
 
     Args:
         writer (Generator): Data saver.
-        computation_func (Callable): Explanation function to compute.
-        args (Tuple): Explanation function arguments.
+        checkpoint (Generator): Checkpoint saver.
+        key (Tuple[str, int, int]): Method and pair of the results.
     """
-    start_compute = perf_counter()
-    try:
-        l, ex, sy = computation_func(*args)
-        if output_file:
-            print(
-                ex,
-                sy,
-                file=open(output_file, "a", encoding="utf8"),
-            )
-    except TimedOut:
-        l = -3
-        end_compute = perf_counter()
-        writer.send([l, end_compute - start_compute, l])
-        return
-    end_compute = perf_counter()
-    writer.send([l, end_compute - start_compute, sy.count(PREFERENTIAL_INFORMATION)])
-
-
-def save_with_perf_farkas(
-    writer,
-    computation_func,
-    farkas_func,
-    args_computation,
-    args_farkas,
-    output_file=None,
-):
-    """Executes the given explanation computation and the given farkas certificate
-    computation it requires and saves its length and compute time.
-    If the Farkas function did not find a certificate, saves -2 as legnth and
-    if explanation method did not find an explanation, saves -1 as length instead.
+    while True:
+        data = yield None
+        writer.send(data)
+        checkpoint.send([*key, *data])
+
+
+def labelled_explanations(sink, key, label: str):
+    """Generator object which sends the received explanations (steps, symbols)
+    to the explanation sink with the key (method, i, j) and the label of the method.
 
     Args:
-        writer (Generator): Data saver.
-        computation_func (Callable): Explanation function to compute.
-        farkas_func (Callable): Farkas certificate function to compute.
-        args_computation (Tuple): Explanation function arguments.
-        args_farkas (Tuple): Farkas certificate function arguments.
+        sink (Generator): Explanation saver (see save_explanations_factory).
+        key (Tuple[str, int, int]): Method and pair of the explanation.
+        label (str): Label of the method.
     """
-    start_compute = perf_counter()
-    try:
-        nu_minus, nu_plus, mu, lmbd = farkas_func(*args_farkas)
-    except StopIteration:
-        l = -2
-        end_compute = perf_counter()
-        writer.send([l, end_compute - start_compute, l])
-        return
-    except TimedOut:
-        l = -3
-        end_compute = perf_counter()
-        writer.send([l, end_compute - start_compute, l])
-        return
-    try:
-        l, ex, sy = computation_func(*args_computation, nu_minus, nu_plus, mu, lmbd)
-        end_compute = perf_counter()
-        if output_file:
-            print(
-                ex,
-                sy,
-                file=open(output_file, "a", encoding="utf8"),
-            )
-        writer.send(
-            [l, end_compute - start_compute, sy.count(PREFERENTIAL_INFORMATION)]
-        )
-        return
-    except StopIteration:
-        l = -1
-    except TimedOut:
-        l = -3
-    end_compute = perf_counter()
-    writer.send([l, end_compute - start_compute, l])
+    while True:
+        steps, symbols = yield None
+        sink.send([*key, label, steps, symbols])
 
 
-def restricted_explain(path: str, data, low, high, precision: int, output_file=None):
+def resumable_save_factory(
+    path: str,
+    resume: bool = False,
+    sink=None,
+    nb_process: int = 1,
+    options: Tuple = (),
+):
+    """Builds the resumable_save function of a fold. Results already in the
+    checkpoint of the fold are sent again to the writers instead of being computed.
+
+    Args:
+        path (str): Path to the fold folder.
+        resume (bool, optional): Reuses the results of the checkpoint.
+        Otherwise the checkpoint is cleaned. The default value is False.
+        sink (Generator, optional): Explanation saver receiving the explanations
+        computed by the run (see save_explanations_factory).
+        Defaults to no explanation output.
+        nb_process (int, optional): Number of processes computing the tasks, by longest
+        expected job first (see longest_expected_job_first_results). The default value is 1.
+        options (Tuple, optional): Options of the run enabled in each process
+        (arguments of enable_run_options). Defaults to none.
+    """
+    done = load_checkpoint(path) if resume else {}
+    checkpoint = save_checkpoint_factory(path, resume)
+
+    def save_batch(tasks):
+        """Saves the results of a batch of tasks (see resumable_save)."""
+        explained = {}
+        computed = {}
+        if nb_process > 1:
+            pending = [t for t in tasks if (t[1], t[2], t[3]) not in done]
+            # Length of the shortest heuristic explanation of each pair
+            lengths = {}
+
+            def compute(pool, group, costs):
+                """Computes the tasks of the group in the pool."""
+                results = longest_expected_job_first_results(
+                    pool,
+                    collect_explained_row if sink is not None else collect_row,
+                    [t[6:] for t in group],
+                    costs,
+                )
+                for k, result in results:
+                    key = (group[k][1], group[k][2], group[k][3])
+                    row, explained[key] = result if sink is not None else (result, None)
+                    computed[key] = row
+                    checkpoint.send([*key, *row])
+                    if row[0] > 0:
+                        lengths[key[1:]] = min(row[0], lengths.get(key[1:], row[0]))
+
+            # The heuristics run first, their lengths bounding the cost of the
+            # exact methods of the same pair
+            heuristics = [t for t in pending if not callable(t[5])]
+            exacts = [t for t in pending if callable(t[5])]
+            with ProcessPoolExecutor(
+                max_workers=nb_process,
+                initializer=enable_run_options,
+                initargs=options,
+            ) as pool:
+                compute(pool, heuristics, [t[5] for t in heuristics])
+                compute(pool, exacts, [t[5](lengths.get(t[2:4])) for t in exacts])
+        for writer, method, i, j, label, _, save, *args in tasks:
+            key = (method, i, j)
+            if key in done or key in computed:
+                writer.send(done[key] if key in done else computed[key])
+                if explained.get(key) is not None:
+                    sink.send([*key, label, *explained[key]])
+                continue
+            checkpointed = checkpointed_writer(writer, checkpoint, key)
+            checkpointed.send(None)
+            if sink is None:
+                save(checkpointed, *args)
+                continue
+            labelled = labelled_explanations(sink, key, label)
+            labelled.send(None)
+            save(checkpointed, *args, sink=labelled)
+
+    def resumable_save(tasks):
+        """Saves the results of each task (writer, method, i, j, label, cost, save, *args)
+        with save(writer, *args), unless they are already in the checkpoint.
+        The results and the explanations are sent to the writers and to the sink
+        in the order of the tasks. The tasks are read lazily by batches of
+        TASKS_BATCH, the parallel computation being scheduled within each batch.
+
+        Args:
+            tasks (Iterable[Tuple]): Tasks, with the writer, the name of the method
+            (its results file name), the indexes of the dominated and dominating
+            candidates, the label of the method in the explanation output, the expected
+            cost (a fixed cost for the heuristics, or for the exact methods a function of
+            the length of the shortest heuristic explanation of the pair, see
+            expected_cost), save_with_perf or save_with_perf_farkas and its arguments
+            after the writer.
+        """
+        tasks = iter(tasks)
+        batch = list(islice(tasks, TASKS_BATCH))
+        while batch:
+            save_batch(batch)
+            batch = list(islice(tasks, TASKS_BATCH))
+
+    return resumable_save
+
+
+def restricted_explain(
+    path: str, data, low, high, precision: int, sink=None, resumable_save=None
+):
     """Saves explanation length and compute times for methods :
         - [Hardy, Littlewood, Poly, 1934]
         - contribution algorithm
@@ -149,7 +225,13 @@ def restricted_explain(path: str, data, low, high, precision: int, output_file=N
         low (int | float): Lower boundary of the definition domain.
         high (int | float): Upper boundary of the definition domain.
         precision (int): Precision (number of digit after the coma).
+        sink (Generator, optional): Explanation saver (see save_explanations_factory),
+        used when resumable_save is not given. Defaults to no explanation output.
+        resumable_save (Callable, optional): Checkpointed saving of the fold
+        (see resumable_save_factory). Defaults to a new checkpoint of the fold.
     """
+    if resumable_save is None:
+        resumable_save = resumable_save_factory(path, sink=sink)
     restricted_lorenz_dom = load_restricted_lorenz_dominances(path)
 
     save_hlp = save_experiment_data_factory(path, hlp_file)
@@ -157,40 +239,52 @@ def restricted_explain(path: str, data, low, high, precision: int, output_file=N
 
     save_optim = save_experiment_data_factory(path, r_optim_file)
 
-    for i, j in restricted_lorenz_dom:
-        if output_file:
-            print(
-                "HLP :",
-                file=open(output_file, "a", encoding="utf8"),
-            )
-        save_with_perf(
-            save_hlp, hardy_littlewood_polya, (data[i], data[j], precision), output_file
-        )
-        if output_file:
-            print(
-                "Contrib :",
-                file=open(output_file, "a", encoding="utf8"),
-            )
-        save_with_perf(
-            save_contrib,
-            contribution_heuristics,
-            (data[i], data[j], precision),
-            output_file,
-        )
-        if output_file:
-            print(
-                "Optim L*",
-                file=open(output_file, "a", encoding="utf8"),
-            )
-        save_with_perf(
-            save_optim,
-            restricted_optimum,
-            (data[i], data[j], low, high, precision),
-            output_file,
-        )
-
-
-def generalized_explain(path: str, data, low, high, precision: int, output_file=None):
+    def restricted_tasks():
+        """Yields the tasks of each pair, read in advance (see prefetched)."""
+        for i, j in prefetched(restricted_lorenz_dom):
+            cost = partial(expected_cost, data[i], data[j], precision, 0)
+            yield from [
+                (
+                    save_hlp,
+                    hlp_file,
+                    i,
+                    j,
+                    "HLP :",
+                    0.0,
+                    save_with_perf,
+                    hardy_littlewood_polya,
+                    (data[i], data[j], precision),
+                ),
+                (
+                    save_contrib,
+                    contrib_file,
+                    i,
+                    j,
+                    "Contrib :",
+                    0.0,
+                    save_with_perf,
+                    contribution_heuristics,
+                    (data[i], data[j], precision),
+                ),
+                (
+                    save_optim,
+                    r_optim_file,
+                    i,
+                    j,
+                    "Optim L*",
+                    cost,
+                    save_with_perf,
+                    restricted_optimum,
+                    (data[i], data[j], low, high, precision),
+                ),
+            ]
+
+    resumable_save(restricted_tasks())
+
+
+def generalized_explain(
+    path: str, data, low, high, precision: int, sink=None, resumable_save=None
+):
     """Saves explanation length and compute times for methods :
         - [Hardy, Littlewood, Poly, 1934] with Gift afterwards
         - contribution algorithm with Gift afterwards
@@ -203,51 +297,71 @@ def generalized_explain(path: str, data, low, high, precision: int, output_file=
         low (int | float): Lower boundary of the definition domain.
         high (int | float): Upper boundary of the definition domain.
         precision (int): Precision (number of digit after the coma).
+        sink (Generator, optional): Explanation saver (see save_explanations_factory),
+        used when resumable_save is not given. Defaults to no explanation output.
+        resumable_save (Callable, optional): Checkpointed saving of the fold
+        (see resumable_save_factory). Defaults to a new checkpoint of the fold.
     """
+    if resumable_save is None:
+        resumable_save = resumable_save_factory(path, sink=sink)
     generalized_lorenz_dom = load_generalized_lorenz_dominances(path)
 
     save_hlp = save_experiment_data_factory(path, after_hlp_file)
     save_contrib = save_experiment_data_factory(path, after_contrib_file)
     save_optim = save_experiment_data_factory(path, g_optim_file)
 
-    for i, j in generalized_lorenz_dom:
-        if output_file:
-            print(
-                "HLP after :",
-                file=open(output_file, "a", encoding="utf8"),
-            )
-        save_with_perf(
-            save_hlp,
-            gift_after_hardy_littlewood_polya,
-            (data[i], data[j], precision),
-            output_file,
-        )
-        if output_file:
-            print(
-                "Contrib after :",
-                file=open(output_file, "a", encoding="utf8"),
-            )
-        save_with_perf(
-            save_contrib,
-            gift_after_contribution_heuristics,
-            (data[i], data[j], precision),
-            output_file,
-        )
-        if output_file:
-            print(
-                "Optim L :",
-                file=open(output_file, "a", encoding="utf8"),
-            )
-        save_with_perf(
-            save_optim,
-            generalized_optimum,
-            (data[i], data[j], low, high, precision),
-            output_file,
-        )
+    def generalized_tasks():
+        """Yields the tasks of each pair, read in advance (see prefetched)."""
+        for i, j in prefetched(generalized_lorenz_dom):
+            cost = partial(expected_cost, data[i], data[j], precision, 0)
+            yield from [
+                (
+                    save_hlp,
+                    after_hlp_file,
+                    i,
+                    j,
+                    "HLP after :",
+                    0.0,
+                    save_with_perf,
+                    gift_after_hardy_littlewood_polya,
+                    (data[i], data[j], precision),
+                ),
+                (
+                    save_contrib,
+                    after_contrib_file,
+                    i,
+                    j,
+                    "Contrib after :",
+                    0.0,
+                    save_with_perf,
+                    gift_after_contribution_heuristics,
+                    (data[i], data[j], precision),
+                ),
+                (
+                    save_optim,
+                    g_optim_file,
+                    i,
+                    j,
+                    "Optim L :",
+                    cost,
+                    save_with_perf,
+                    generalized_optimum,
+                    (data[i], data[j], low, high, precision),
+                ),
+            ]
+
+    resumable_save(generalized_tasks())
 
 
 def robust_explain(
-    path: str, data, pi_statements, low, high, precision: int, output_file=None
+    path: str,
+    data,
+    pi_statements,
+    low,
+    high,
+    precision: int,
+    sink=None,
+    resumable_save=None,
 ):
     """_summary_
 
@@ -257,7 +371,13 @@ def robust_explain(
         low (int | float): Lower boundary of the definition domain.
         high (int | float): Upper boundary of the definition domain.
         precision (int): Precision (number of digit after the coma).
+        sink (Generator, optional): Explanation saver (see save_explanations_factory),
+        used when resumable_save is not given. Defaults to no explanation output.
+        resumable_save (Callable, optional): Checkpointed saving of the fold
+        (see resumable_save_factory). Defaults to a new checkpoint of the fold.
     """
+    if resumable_save is None:
+        resumable_save = resumable_save_factory(path, sink=sink)
     rowa_dom = load_robust_redistributive_owa_dominances(path)
 
     save_optim = save_experiment_data_factory(path, atx_optim_file)
@@ -269,52 +389,130 @@ def robust_explain(
         path, ctx_displaced_file(first_farkas_name)
     )
 
-    for i, j in rowa_dom:
-        # print(i, j, strftime("%H:%M:%S", localtime()))
-        if output_file:
-            print(
-                "Optim ATX :",
-                file=open(output_file, "a", encoding="utf8"),
-            )
-        save_with_perf(
-            save_optim,
-            robust_optimum,
-            (data[i], data[j], low, high, precision, pi_statements),
-            output_file,
-        )
-        if output_file:
-            print(
-                "Optim CTX displaced :",
-                file=open(output_file, "a", encoding="utf8"),
+    def robust_tasks():
+        """Yields the tasks of each pair, read in advance (see prefetched)."""
+        for i, j in prefetched(rowa_dom):
+            cost = partial(
+                expected_cost, data[i], data[j], precision, len(pi_statements)
             )
-        save_with_perf_farkas(
-            save_ctx_farkas_displaced_min,
-            ctx_from_farkas_displaced,
-            minimum_length_farkas,
-            (data[i], data[j], pi_statements, low, high, precision),
-            (data[i], data[j], precision, pi_statements),
-            output_file,
-        )
-        if output_file:
-            print(
-                "CTX displaced with fast Farkas :",
-                file=open(output_file, "a", encoding="utf8"),
-            )
-        save_with_perf_farkas(
-            save_ctx_farkas_displaced_first,
-            ctx_from_farkas_displaced,
-            first_farkas,
-            (data[i], data[j], pi_statements, low, high, precision),
-            (data[i], data[j], precision, pi_statements),
-            output_file,
+            yield from [
+                (
+                    save_optim,
+                    atx_optim_file,
+                    i,
+                    j,
+                    "Optim ATX :",
+                    cost,
+                    save_with_perf,
+                    robust_optimum,
+                    (data[i], data[j], low, high, precision, pi_statements),
+                ),
+                (
+                    save_ctx_farkas_displaced_min,
+                    ctx_displaced_file(min_farkas_name),
+                    i,
+                    j,
+                    "Optim CTX displaced :",
+                    cost,
+                    save_with_perf_farkas,
+                    ctx_from_farkas_displaced,
+                    minimum_length_farkas,
+                    (data[i], data[j], pi_statements, low, high, precision),
+                    (data[i], data[j], precision, pi_statements),
+                ),
+                (
+                    save_ctx_farkas_displaced_first,
+                    ctx_displaced_file(first_farkas_name),
+                    i,
+                    j,
+                    "CTX displaced with fast Farkas :",
+                    cost,
+                    save_with_perf_farkas,
+                    ctx_from_farkas_displaced,
+                    first_farkas,
+                    (data[i], data[j], pi_statements, low, high, precision),
+                    (data[i], data[j], precision, pi_statements),
+                ),
+            ]
+
+    resumable_save(robust_tasks())
+
+
+@contextmanager
+def explanation_run(
+    output_file=None,
+    resume: bool = False,
+    nb_process: int = 1,
+    profile: bool = False,
+    cache: bool = False,
+    cache_path=None,
+    solver_profiles=None,
+):
+    """Context manager of an explanation run: yields the explanation sink (None
+    without output file) and the options of the run, enabled (see run_options),
+    and closes the sink and disables the options when the run ends or is interrupted.
+    The options are also enabled in the processes computing the explanations.
+
+    Args:
+        output_file (str, optional): File receiving the explanations as JSON lines
+        (see save_explanations_factory). Defaults to no explanation output.
+        resume (bool, optional): Appends to the explanations of an interrupted run.
+        The default value is False.
+        nb_process (int, optional): Number of processes computing the explanations.
+        The default value is 1.
+        profile (bool, optional): Enables the profile. The default value is False.
+        cache (bool, optional): Enables the cache. The default value is False.
+        cache_path (str, optional): Folder of the on-disk cache (enables the cache).
+        Defaults to a cache in memory only.
+        solver_profiles (str, optional): Folder of the solver parameter profiles.
+        Defaults to the parameters of the model builders.
+    """
+    if profile and nb_process > 1:
+        raise ValueError(
+            "The profile is only available for explanations computed in the main "
+            f"process, not with {nb_process} processes"
         )
+    sink = save_explanations_factory(output_file, resume) if output_file else None
+    try:
+        with run_options(profile, cache, cache_path, solver_profiles) as options:
+            yield sink, options
+    finally:
+        if sink is not None:
+            sink.close()
 
 
-def explain_int_fixed(exp_path: str, output_file=None):
+def explain_int_fixed(
+    exp_path: str,
+    output_file=None,
+    resume: bool = False,
+    nb_process: int = 1,
+    profile: bool = False,
+    cache: bool = False,
+    cache_path=None,
+    solver_profiles=None,
+):
     """Launch the explanation computation for Restricted dominances.
 
     Args:
         exp_path (str): Path to the root of the experiment folder.
+        output_file (str, optional): File receiving the explanations as JSON lines
+        (see save_explanations_factory). Defaults to no explanation output.
+        resume (bool, optional): Restarts an interrupted run, skipping the pairs
+        already in the checkpoint of each fold. The default value is False.
+        nb_process (int, optional): Number of processes computing the explanations
+        of a fold. The default value is 1.
+        profile (bool, optional): Profiles the steps of the heuristics and of the CTX
+        and saves the profile of each fold in its profile.csv (explanations computed
+        in the main process only, raises ValueError if nb_process > 1).
+        The default value is False.
+        cache (bool, optional): Reuses the results of the explanation methods already
+        computed for the same arguments (see enable_explanation_cache); the compute
+        times of the reused results are those of the cache. The default value is False.
+        cache_path (str, optional): Folder of the on-disk cache, shared by the runs
+        (enables the cache). Defaults to a cache in memory only.
+        solver_profiles (str, optional): Folder of the solver parameter profiles
+        applied by the MILP model builders (see tuning.py). Defaults to the
+        parameters of the model builders.
     """
     (
         nb_exp,
@@ -328,21 +526,60 @@ def explain_int_fixed(exp_path: str, output_file=None):
         _,
         precision,
     ) = load_meta_data(exp_path)
+    with explanation_run(
+        output_file, resume, nb_process, profile, cache, cache_path, solver_profiles
+    ) as (sink, options):
+        for f in range(nb_exp):
+            print(f"Fold {f}: {strftime('%H:%M:%S', localtime())}")
+            reset_profile()
+            fold_path = ExperimentLayout(exp_path).fold(f).path
+            data, _ = load_dataset(fold_path, precision)
+            resumable_save = resumable_save_factory(
+                fold_path, resume, sink, nb_process, options
+            )
 
-    for f in range(nb_exp):
-        print(f"Fold {f}: {strftime('%H:%M:%S', localtime())}")
-        fold_path = f"{exp_path}\\{f}"
-        data, _ = load_dataset(fold_path, precision)
-
-        restricted_explain(fold_path, data, low, high, precision, output_file)
-        sleep(0.01)
+            restricted_explain(
+                fold_path, data, low, high, precision, sink, resumable_save
+            )
+            if profile:
+                save_data_analysis(
+                    fold_path, "profile", PROFILE_HEADER, profile_summary()
+                )
+            sleep(0.01)
 
 
-def explain_int(exp_path: str, output_file=None):
+def explain_int(
+    exp_path: str,
+    output_file=None,
+    resume: bool = False,
+    nb_process: int = 1,
+    profile: bool = False,
+    cache: bool = False,
+    cache_path=None,
+    solver_profiles=None,
+):
     """Launch the explanation computation for Generalized and Restricted dominances.
 
     Args:
         exp_path (str): Path to the root of the experiment folder.
+        output_file (str, optional): File receiving the explanations as JSON lines
+        (see save_explanations_factory). Defaults to no explanation output.
+        resume (bool, optional): Restarts an interrupted run, skipping the pairs
+        already in the checkpoint of each fold. The default value is False.
+        nb_process (int, optional): Number of processes computing the explanations
+        of a fold. The default value is 1.
+        profile (bool, optional): Profiles the steps of the heuristics and of the CTX
+        and saves the profile of each fold in its profile.csv (explanations computed
+        in the main process only, raises ValueError if nb_process > 1).
+        The default value is False.
+        cache (bool, optional): Reuses the results of the explanation methods already
+        computed for the same arguments (see enable_explanation_cache); the compute
+        times of the reused results are those of the cache. The default value is False.
+        cache_path (str, optional): Folder of the on-disk cache, shared by the runs
+        (enables the cache). Defaults to a cache in memory only.
+        solver_profiles (str, optional): Folder of the solver parameter profiles
+        applied by the MILP model builders (see tuning.py). Defaults to the
+        parameters of the model builders.
     """
     (
         nb_exp,
@@ -356,22 +593,63 @@ def explain_int(exp_path: str, output_file=None):
         _,
         precision,
     ) = load_meta_data(exp_path)
+    with explanation_run(
+        output_file, resume, nb_process, profile, cache, cache_path, solver_profiles
+    ) as (sink, options):
+        for f in range(nb_exp):
+            print(f"Fold {f}: {strftime('%H:%M:%S', localtime())}")
+            reset_profile()
+            fold_path = ExperimentLayout(exp_path).fold(f).path
+            data, _ = load_dataset(fold_path, precision)
+            resumable_save = resumable_save_factory(
+                fold_path, resume, sink, nb_process, options
+            )
 
-    for f in range(nb_exp):
-        print(f"Fold {f}: {strftime('%H:%M:%S', localtime())}")
-        fold_path = f"{exp_path}\\{f}"
-        data, _ = load_dataset(fold_path, precision)
-
-        restricted_explain(fold_path, data, low, high, precision, output_file)
-        generalized_explain(fold_path, data, low, high, precision, output_file)
-        sleep(0.01)
+            restricted_explain(
+                fold_path, data, low, high, precision, sink, resumable_save
+            )
+            generalized_explain(
+                fold_path, data, low, high, precision, sink, resumable_save
+            )
+            if profile:
+                save_data_analysis(
+                    fold_path, "profile", PROFILE_HEADER, profile_summary()
+                )
+            sleep(0.01)
 
 
-def explain_float(exp_path: str, output_file=None):
+def explain_float(
+    exp_path: str,
+    output_file=None,
+    resume: bool = False,
+    nb_process: int = 1,
+    profile: bool = False,
+    cache: bool = False,
+    cache_path=None,
+    solver_profiles=None,
+):
     """Launch the explanation computation for ROWA, Generalized and Restricted dominances.
 
     Args:
         exp_path (str): Path to the root of the experiment folder.
+        output_file (str, optional): File receiving the explanations as JSON lines
+        (see save_explanations_factory). Defaults to no explanation output.
+        resume (bool, optional): Restarts an interrupted run, skipping the pairs
+        already in the checkpoint of each fold. The default value is False.
+        nb_process (int, optional): Number of processes computing the explanations
+        of a fold. The default value is 1.
+        profile (bool, optional): Profiles the steps of the heuristics and of the CTX
+        and saves the profile of each fold in its profile.csv (explanations computed
+        in the main process only, raises ValueError if nb_process > 1).
+        The default value is False.
+        cache (bool, optional): Reuses the results of the explanation methods already
+        computed for the same arguments (see enable_explanation_cache); the compute
+        times of the reused results are those of the cache. The default value is False.
+        cache_path (str, optional): Folder of the on-disk cache, shared by the runs
+        (enables the cache). Defaults to a cache in memory only.
+        solver_profiles (str, optional): Folder of the solver parameter profiles
+        applied by the MILP model builders (see tuning.py). Defaults to the
+        parameters of the model builders.
     """
     (
         nb_exp,
@@ -385,18 +663,39 @@ def explain_float(exp_path: str, output_file=None):
         _,
         precision,
     ) = load_meta_data(exp_path)
+    with explanation_run(
+        output_file, resume, nb_process, profile, cache, cache_path, solver_profiles
+    ) as (sink, options):
+        for f in range(nb_exp):
+            print(f"Fold {f}: {strftime('%H:%M:%S', localtime())}")
+            reset_profile()
+            fold_path = ExperimentLayout(exp_path).fold(f).path
+            data, pi_statements = load_dataset(fold_path, precision)
+            resumable_save = resumable_save_factory(
+                fold_path, resume, sink, nb_process, options
+            )
 
-    for f in range(nb_exp):
-        print(f"Fold {f}: {strftime('%H:%M:%S', localtime())}")
-        fold_path = f"{exp_path}\\{f}"
-        data, pi_statements = load_dataset(fold_path, precision)
-
-        restricted_explain(fold_path, data, low, high, precision, output_file)
-        generalized_explain(fold_path, data, low, high, precision, output_file)
-        robust_explain(
-            fold_path, data, pi_statements, low, high, precision, output_file
-        )
-        sleep(0.01)
+            restricted_explain(
+                fold_path, data, low, high, precision, sink, resumable_save
+            )
+            generalized_explain(
+                fold_path, data, low, high, precision, sink, resumable_save
+            )
+            robust_explain(
+                fold_path,
+                data,
+                pi_statements,
+                low,
+                high,
+                precision,
+                sink,
+                resumable_save,
+            )
+            if profile:
+                save_data_analysis(
+                    fold_path, "profile", PROFILE_HEADER, profile_summary()
+                )
+            sleep(0.01)
 
 
 if __name__ == "__main__":
@@ -404,12 +703,12 @@ if __name__ == "__main__":
     NB_FOLD = 1
     NB_CAND = 10
     NB_PI = 2
-    EXP_PATH = f".\\Datasets\\Int_{NB_VAR}cri_{NB_CAND}cand"
+    EXP_PATH = f"./Datasets/Int_{NB_VAR}cri_{NB_CAND}cand"
     explain_int(EXP_PATH)
 
     FIXED_SUM = NB_VAR * 20
-    EXP_PATH = f".\\Datasets\\Int_{NB_VAR}cri_{FIXED_SUM}sum_{NB_CAND}cand"
+    EXP_PATH = f"./Datasets/Int_{NB_VAR}cri_{FIXED_SUM}sum_{NB_CAND}cand"
     explain_int_fixed(EXP_PATH)
 
-    EXP_PATH = f".\\Datasets\\Float_{NB_VAR}cri_{NB_CAND}cand"
+    EXP_PATH = f"./Datasets/Float_{NB_VAR}cri_{NB_CAND}cand"
     explain_float(EXP_PATH)
@@ -161,13 +161,13 @@ if __name__ == "__main__":
     NB_CAND = 10
     NB_PI = 2
 
-    EXP_PATH = f".\\Datasets\\Int_{NB_VAR}cri_{NB_CAND}cand"
+    EXP_PATH = f"./Datasets/Int_{NB_VAR}cri_{NB_CAND}cand"
     process_int(
         path=EXP_PATH, nb_fold=NB_FOLD, nb_var=NB_VAR, nb_cand=NB_CAND, nb_pi=NB_PI
     )
 
     FIXED_SUM = NB_VAR * 20
-    EXP_PATH = f".\\Datasets\\Int_{NB_VAR}cri_{FIXED_SUM}sum_{NB_CAND}cand"
+    EXP_PATH = f"./Datasets/Int_{NB_VAR}cri_{FIXED_SUM}sum_{NB_CAND}cand"
     process_int_fixed(
         path=EXP_PATH,
         nb_fold=NB_FOLD,
@@ -177,7 +177,7 @@ if __name__ == "__main__":
         fixed_sum=FIXED_SUM,
     )
 
-    EXP_PATH = f".\\Datasets\\Float_{NB_VAR}cri_{NB_CAND}cand"
+    EXP_PATH = f"./Datasets/Float_{NB_VAR}cri_{NB_CAND}cand"
     process_float(
         path=EXP_PATH,
         nb_fold=NB_FOLD,
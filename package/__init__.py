@@ -1,6 +1,15 @@
+from .timing import *
 from .timeout import *
+from .solver_log import *
+from .solver_profiles import *
+from .profiling import *
+from .explanation_cache import *
+from .run_options import *
 from .data import *
 from .generalized_lorenz import *
 from .plot import *
 from .restricted_lorenz import *
 from .robust_owa import *
+from .dominance_index import *
+from .scheduling import *
+from .work_queue import *
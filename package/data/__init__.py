@@ -1,3 +1,4 @@
+from .layout import *
 from .generation import *
 from .save import *
 from .load import *
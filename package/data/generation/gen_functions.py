@@ -2,12 +2,20 @@
     - integer candidate with and without fixed total sum 
     - float candidate rounded with precision
     - redistributive OWA weights
-Function for pareto dominance checking
+    - blocks of integer (with and without fixed total sum) or float candidates at once
+Functions for pareto dominance checking (one pair or blocks of candidates)
+and Pareto filtered batch generation
 """
+from typing import Callable
 from numpy import sort as npsort
 from numpy import all as npall
+from numpy import any as npany
 from numpy import round as npround
-from numpy import zeros
+from numpy import sum as npsum
+from numpy import zeros, ones, full, flatnonzero, maximum, minimum
+
+PARETO_CHUNK_ROWS = 1 << 14
+MAX_PARETO_DRAWS = 1 << 24
 
 
 def sorted_fixed_sum_int_candidate_factory(rng, total_sum: int):
@@ -52,6 +60,52 @@ def sorted_fixed_sum_int_candidate_factory(rng, total_sum: int):
     return fixed_sum_int_candidate
 
 
+def sorted_fixed_sum_int_candidates_factory(rng, total_sum: int):
+    """Builds the gen_fixed_sum_int_candidates function
+    from the given numpy random Generator and total sum.
+    Each criterion is drawn at once for a block of candidates, so the random stream
+    is not consumed in the same order as successive fixed_sum_int_candidate calls.
+
+    Args:
+        rng (Generator): Numpy random Generator.
+        total_sum (int): Value of the sum of candidate criteria.
+    """
+
+    def fixed_sum_int_candidates(
+        nb_rows: int, nb_var: int, low: int = 0, high: int = 100, epsilon: int = 1
+    ):
+        """Generates a block of ordered candidates with integer values
+        of fixed sum over criteria.
+
+        Args:
+            nb_rows (int): Number of candidates in the block.
+            nb_var (int): Number of criteria.
+            low (int, optional): Lower boundary of the output interval.
+            All values generated will be greater than or equal to low. The default value is 0.
+            high (int, optional): Upper boundary of the output interval.
+            All values generated will be less than or equal to high.
+            The high limit may be included. The default value is 100.
+            epsilon (float, optional): Minimum separation from interval bounds.
+            The default value is 1.
+        """
+        cands = zeros((nb_rows, nb_var), dtype=int)
+        total_remaining = full(nb_rows, total_sum, dtype=int)
+        effective_low = low + epsilon
+        effective_high = high - epsilon
+        for i in range(nb_var):
+            low_values = maximum(
+                effective_low, total_remaining - (nb_var - i - 1) * effective_high
+            )
+            high_values = minimum(
+                effective_high, total_remaining - (nb_var - i - 1) * effective_low
+            )
+            cands[:, i] = rng.integers(low_values, high_values, endpoint=True)
+            total_remaining -= cands[:, i]
+        return npsort(cands, axis=1)
+
+    return fixed_sum_int_candidates
+
+
 def sorted_uniform_candidate_factory(rng):
     """Builds the gen_sorted_uniform_candidate function from the given numpy random Generator.
 
@@ -118,6 +172,83 @@ def sorted_int_candidate_factory(rng):
     return sorted_int_candidate
 
 
+def sorted_int_candidates_factory(rng):
+    """Builds the gen_sorted_int_candidates function from the given numpy random Generator.
+    Rows are drawn from the same random stream as successive sorted_int_candidate calls.
+
+    Args:
+        rng (Generator): numpy random Generator
+    """
+
+    def sorted_int_candidates(
+        nb_rows: int, nb_var: int, low: int = 0, high: int = 100, epsilon: int = 1
+    ):
+        """Generates a block of ordered candidates with integer values on criteria
+
+        Args:
+            nb_rows (int): Number of candidates in the block.
+            nb_var (int): Number of criteria.
+            low (int, optional): Lower boundary of the output interval.
+            All values generated will be greater than or equal to low. The default value is 0.
+            high (int, optional): Upper boundary of the output interval.
+            All values generated will be less than or equal to high.
+            The high limit may be included. The default value is 100.
+            epsilon (int, optional): Minimum separation from interval bounds.
+            The default value is 1.
+        """
+        return npsort(
+            rng.integers(
+                low + epsilon, high - epsilon, (nb_rows, nb_var), endpoint=True
+            ),
+            axis=1,
+        )
+
+    return sorted_int_candidates
+
+
+def sorted_uniform_candidates_factory(rng):
+    """Builds the gen_sorted_uniform_candidates function from the given numpy random
+    Generator. Rows are drawn from the same random stream as successive
+    sorted_uniform_candidate calls.
+
+    Args:
+        rng (Generator): Numpy random Generator.
+    """
+
+    def sorted_uniform_candidates(
+        nb_rows: int,
+        nb_var: int,
+        low: float = 0.0,
+        high: float = 1.0,
+        epsilon: float = 1e-3,
+        ndigits: int = 3,
+    ):
+        """Generates a block of ordered candidates from uniform distribution.
+
+        Args:
+            nb_rows (int): Number of candidates in the block.
+            nb_var (int): Number of criteria.
+            low (float, optional): Lower boundary of the output interval.
+            All values generated will be greater than or equal to low. The default value is 0.
+            high (float, optional): Upper boundary of the output interval.
+            All values generated will be less than or equal to high.
+            The high limit may be included in the returned array of floats due to floating-point
+            rounding. The default value is 1.0.
+            epsilon (float, optional): Minimum separation from interval bounds.
+            The default value is 1e-3.
+            ndigits (int, optional): Precision (number of digit after the coma).
+            The default value is 3.
+        """
+        return npround(
+            npsort(
+                rng.uniform(low + epsilon, high - epsilon, (nb_rows, nb_var)), axis=1
+            ),
+            ndigits,
+        )
+
+    return sorted_uniform_candidates
+
+
 def pareto_dominance(x1, x2) -> bool:
     """Returns True if x1 (weekly) Pareto dominates x2"""
     if npall(x1 >= x2):
@@ -128,3 +259,96 @@ def pareto_dominance(x1, x2) -> bool:
 def true_rowa(nb_var: int, rng):
     """Returns from the Diriclet distribution a redistributive Ordered Weighted Average"""
     return npsort(rng.dirichlet([nb_var] * nb_var))[::-1]
+
+
+def pareto_comparability(block, candidates):
+    """Returns the boolean matrix whose (k, l) value is True if block[k]
+    (weakly) Pareto dominates or is (weakly) Pareto dominated by candidates[l].
+
+    Args:
+        block (NDArray): Candidates to check, one by row.
+        candidates (NDArray): Candidates to compare with, one by row.
+    """
+    dominating = ones((block.shape[0], candidates.shape[0]), dtype=bool)
+    dominated = ones((block.shape[0], candidates.shape[0]), dtype=bool)
+    for k in range(block.shape[1]):
+        dominating &= block[:, k, None] >= candidates[None, :, k]
+        dominated &= block[:, k, None] <= candidates[None, :, k]
+    return dominating | dominated
+
+
+def pareto_comparable(block, candidates):
+    """Returns for each row of block whether it (weakly) Pareto dominates
+    or is (weakly) Pareto dominated by one of the rows of candidates.
+    The comparisons are broadcast by chunks of candidates to bound the memory.
+
+    Args:
+        block (NDArray): Candidates to check, one by row.
+        candidates (NDArray): Candidates to compare with, one by row.
+    """
+    comparable = zeros(block.shape[0], dtype=bool)
+    for start in range(0, candidates.shape[0], PARETO_CHUNK_ROWS):
+        comparable |= npany(
+            pareto_comparability(block, candidates[start : start + PARETO_CHUNK_ROWS]),
+            axis=1,
+        )
+    return comparable
+
+
+def pareto_filtered_candidates(
+    draw_block: Callable,
+    nb_cand: int,
+    nb_var: int,
+    max_sum,
+    dtype,
+    block_size: int = 1024,
+    max_draws: int = MAX_PARETO_DRAWS,
+):
+    """Generates nb_cand pairwise Pareto incomparable candidates by drawing blocks of
+    candidates. Candidates are accepted in drawing order, as if drawn one by one.
+    Returns the candidates and the rejection rate (rejected / drawn candidates).
+    Raises a ValueError if max_draws candidates were drawn without accepting
+    nb_cand of them (too few Pareto incomparable candidates reachable within the
+    bounds and the maximum sum).
+
+    Args:
+        draw_block (Callable): Function drawing a block of nb_rows candidates.
+        nb_cand (int): Number of candidates to generate.
+        nb_var (int): Number of criteria.
+        max_sum (int | float): Maximum value for the sum of criteria of a candidate.
+        dtype (DTypeLike): Type of the candidates values.
+        block_size (int, optional): Number of candidates drawn at once.
+        The default value is 1024.
+        max_draws (int, optional): Maximum number of candidates drawn.
+        The default value is MAX_PARETO_DRAWS.
+    """
+    candidates = zeros((nb_cand, nb_var), dtype=dtype)
+    nb_accepted = 0
+    nb_drawn = 0
+    while nb_accepted < nb_cand:
+        if nb_drawn >= max_draws:
+            raise ValueError(
+                f"Only {nb_accepted} of {nb_cand} Pareto incomparable candidates"
+                f" accepted after {nb_drawn} drawn candidates"
+                f" (rejection rate {1 - nb_accepted / nb_drawn:.6f})"
+            )
+        block = draw_block(block_size)
+        valid = npsum(block, axis=1) <= max_sum
+        valid[valid] = ~pareto_comparable(block[valid], candidates[:nb_accepted])
+        block = block[valid]
+        positions = flatnonzero(valid)
+        # Greedy acceptance in drawing order among the remaining candidates
+        comparability = pareto_comparability(block, block)
+        blocked = zeros(block.shape[0], dtype=bool)
+        last = block_size - 1
+        for k in range(block.shape[0]):
+            if blocked[k]:
+                continue
+            candidates[nb_accepted] = block[k]
+            nb_accepted += 1
+            if nb_accepted == nb_cand:
+                last = positions[k]
+                break
+            blocked |= comparability[k]
+        nb_drawn += last + 1
+    return candidates, 1 - nb_cand / nb_drawn if nb_drawn > 0 else 0.0
@@ -2,26 +2,49 @@
     - array of integer candidates with and without fixed total sum 
     - array of float candidates rounded with precision
 """
-from os import makedirs
+from gc import collect
+from os import makedirs, remove
 from os.path import exists as pathexists
-from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
 from math import ceil
-from typing import List, Tuple
-from numpy.random import default_rng
-from numpy import zeros, int_, array_equiv, float64
-from numpy import sum as npsum
+from time import perf_counter
+from typing import Callable, Dict, Tuple
+from numpy.random import default_rng, SeedSequence
+from numpy import zeros, int_, float64, argsort, concatenate
+from numpy import arange, asarray, searchsorted, stack, where
+from numpy import cumsum as npcumsum
+from numpy import max as npmax
+from numpy import abs as npabs
 from numpy import array as nparray
 from package.data.generation import (
-    sorted_int_candidate_factory,
     sorted_fixed_sum_int_candidate_factory,
-    sorted_uniform_candidate_factory,
-    pareto_dominance,
+    sorted_fixed_sum_int_candidates_factory,
+    sorted_int_candidates_factory,
+    sorted_uniform_candidates_factory,
+    pareto_filtered_candidates,
     true_rowa,
 )
 from package.generalized_lorenz import generalized_lorenz_dominance
 from package.restricted_lorenz import restricted_lorenz_dominance
-from package.robust_owa import compute_redistributive_owa_dominance
-from package.data.save import save_data, save_meta_data
+from package.robust_owa import (
+    compute_redistributive_owa_dominance,
+    redistributive_owa_dominance_chunks,
+    dominance_keys,
+    dominance_row,
+)
+from package.data.load import owa_dominance_rows, load_spilled_indexes_pairs
+from package.data.layout import ExperimentLayout
+from package.data.save import (
+    save_data,
+    save_indexes_pairs_factory,
+    save_meta_data,
+    save_dataset_bundle,
+    save_data_analysis,
+    indexes_pairs_array,
+)
+
+MAX_FIXED_SUM_DRAWS = 1 << 24
+LORENZ_CHUNK_CANDIDATES = 256
 
 
 def generation_type(
@@ -34,6 +57,8 @@ def generation_type(
     fixed_sum: int = 0,
     ndigits: int = 0,
     seed: int = 404,
+    vectorized: bool = False,
+    return_rejection_rate: bool = False,
 ):
     """Wrapper for calling right generation process given the value of the parameters.
     If the precision does not have its default value, the countinuous generation is called.
@@ -61,17 +86,44 @@ def generation_type(
         ndigits (int, optional): Precision (number of digit after the coma).
         The default value is 3.
         seed (int, optional): Seed value for fixing randomness. The default value is 404.
+        vectorized (bool, optional): Draws the fixed sum candidates by blocks.
+        The default value is False.
+        return_rejection_rate (bool, optional): Also returns the rate of drawn candidates
+        rejected. The default value is False.
     """
     if ndigits == 0:
         if fixed_sum == 0:
             return gen_int_candidates(
-                nb_var, nb_cand, low, high, epsilon, int(max_sum), seed
+                nb_var,
+                nb_cand,
+                low,
+                high,
+                epsilon,
+                int(max_sum),
+                seed,
+                return_rejection_rate=return_rejection_rate,
             )
         return gen_int_candidates_fixed_sum(
-            nb_var, nb_cand, low, high, epsilon, fixed_sum, seed
+            nb_var,
+            nb_cand,
+            low,
+            high,
+            epsilon,
+            fixed_sum,
+            seed,
+            vectorized=vectorized,
+            return_rejection_rate=return_rejection_rate,
         )
     return gen_uniform_candidates(
-        nb_var, nb_cand, low, high, epsilon, ndigits, max_sum, seed
+        nb_var,
+        nb_cand,
+        low,
+        high,
+        epsilon,
+        ndigits,
+        max_sum,
+        seed,
+        return_rejection_rate=return_rejection_rate,
     )
 
 
@@ -88,10 +140,14 @@ def generation_process(
     fixed_sum: int = 0,
     ndigits: int = 0,
     seed: int = 404,
+    vectorized: bool = False,
+    nb_process: int = 1,
+    spawn_seeds: bool = False,
 ):
     """Wrapper for the generation process. Generates for each repetition the
     candidates, the set of Lorenz dominance pairs, the meta data file,
     the redistributive OWA and preferetial information statements and saves them in csv files.
+    The duration of each stage of each fold is saved in generation_timing.csv.
 
     Args:
         path (str): Path to the root of the experiment folder.
@@ -113,6 +169,12 @@ def generation_process(
         ndigits (int, optional): Precision (number of digit after the coma).
         The default value is 3.
         seed (int, optional): Seed value for fixing randomness. The default value is 404.
+        vectorized (bool, optional): Draws the fixed sum candidates by blocks.
+        The default value is False.
+        nb_process (int, optional): Number of folds generated in parallel processes.
+        The default value is 1.
+        spawn_seeds (bool, optional): Seeds the folds with independent streams spawned
+        from the seed instead of seed + fold (see fold_seeds). The default value is False.
     """
     if not pathexists(path):
         makedirs(path)
@@ -131,46 +193,228 @@ def generation_process(
         ndigits,
     )
 
-    for i in range(nb_fold):
-        fold_path = f"{path}\\{i}"
-        if not pathexists(f"{fold_path}\\Restricted"):
-            makedirs(f"{fold_path}\\Restricted")
-        if not pathexists(f"{fold_path}\\Generalized"):
-            makedirs(f"{fold_path}\\Generalized")
-        if not pathexists(f"{fold_path}\\RobustOWA"):
-            makedirs(f"{fold_path}\\RobustOWA")
-
-        data = generation_type(
-            nb_var, nb_cand, low, high, epsilon, max_sum, fixed_sum, ndigits, seed + i
-        )
-        save_data(fold_path, "candidates", data)
-        redistributive_owa = gen_rowa(nb_var, seed + i)
-        save_data(fold_path, "true_owa", redistributive_owa)
-        restricted_lorenz_dom, generalized_lorenz_dom = lorenz_dominances(data)
-        save_data(
-            f"{fold_path}\\Restricted", "restricted_lorenz_dom", restricted_lorenz_dom
-        )
-        save_data(
-            f"{fold_path}\\Generalized",
-            "generalized_lorenz_dom",
-            generalized_lorenz_dom,
-        )
-        owa_dom = owa_dominances(data, redistributive_owa)
-        save_data(fold_path, "owa_dominances", owa_dom)
-        pi, pi_statements = gen_pi_statements(
-            nb_pi,
-            data,
-            redistributive_owa,
-            restricted_lorenz_dom,
-            generalized_lorenz_dom,
-            seed + i,
-        )
-        save_data(fold_path, "pi_indexes", pi)
-        save_data(fold_path, "pi_statements", pi_statements)
-        rowa_dom = compute_redistributive_owa_dominance(
-            data, pi_statements, ndigits, restricted_lorenz_dom, generalized_lorenz_dom
-        )
-        save_data(f"{fold_path}\\RobustOWA", "rowa_dominances", rowa_dom)
+    seeds = fold_seeds(seed, nb_fold, spawn_seeds)
+    args = (nb_fold, nb_var, nb_cand, nb_pi, low, high, epsilon, max_sum, fixed_sum)
+    if nb_process > 1:
+        with ProcessPoolExecutor(max_workers=nb_process) as pool:
+            futures = [
+                pool.submit(
+                    generation_fold, path, i, seeds[i], *args, ndigits, vectorized
+                )
+                for i in range(nb_fold)
+            ]
+            timings = [future.result() for future in futures]
+    else:
+        timings = [
+            generation_fold(path, i, seeds[i], *args, ndigits, vectorized)
+            for i in range(nb_fold)
+        ]
+    save_data_analysis(
+        path,
+        "generation_timing",
+        ["fold", "stage", "time"],
+        [
+            (i, stage, duration)
+            for i, fold_timing in enumerate(timings)
+            for stage, duration in fold_timing.items()
+        ],
+    )
+
+
+def fold_seeds(seed: int, nb_fold: int, spawn_seeds: bool = False):
+    """Returns for each fold the seeds of the candidates, the redistributive OWA
+    and the preferential information generations.
+    By default, all the generations of the fold i are seeded with seed + i.
+    Otherwise, independent streams are spawned from SeedSequence(seed).
+
+    Args:
+        seed (int): Seed value for fixing randomness.
+        nb_fold (int): Number of repeat of the generation process.
+        spawn_seeds (bool, optional): Spawns independent streams for each fold
+        and generation. The default value is False.
+    """
+    if not spawn_seeds:
+        return [(seed + i, seed + i, seed + i) for i in range(nb_fold)]
+    return [tuple(fold.spawn(3)) for fold in SeedSequence(seed).spawn(nb_fold)]
+
+
+def timed(timing: Dict[str, float], stage: str, function: Callable, *args, **kwargs):
+    """Calls function(*args, **kwargs) and records its duration in timing[stage].
+
+    Args:
+        timing (Dict[str, float]): Duration in seconds of each stage.
+        stage (str): Name of the stage.
+        function (Callable): Function called.
+    """
+    start = perf_counter()
+    result = function(*args, **kwargs)
+    timing[stage] = perf_counter() - start
+    return result
+
+
+def generation_fold(
+    path: str,
+    fold: int,
+    seeds: Tuple,
+    nb_fold: int,
+    nb_var: int,
+    nb_cand: int,
+    nb_pi: int,
+    low,
+    high,
+    epsilon,
+    max_sum=0.0,
+    fixed_sum: int = 0,
+    ndigits: int = 0,
+    vectorized: bool = False,
+):
+    """Generates and saves a fold of the experiment (see generation_process).
+    The dominance relations are streamed to their csv files by chunks and read back
+    from memory-mapped spill files, so that they are never held in memory as lists.
+    Returns the duration in seconds of each stage.
+
+    Args:
+        path (str): Path to the root of the experiment folder.
+        fold (int): Index of the fold.
+        seeds (Tuple): Seeds of the candidates, the redistributive OWA
+        and the preferential information generations.
+        nb_fold (int): Number of repeat of the generation process.
+        nb_var (int): Number of criteria.
+        nb_cand (int): Number of candidates to generate.
+        nb_pi (int): Number of preferential information to generate from precise
+        redistributive OWA.
+        low (int | float): Lower boundary of the output interval.
+        high (int | float): Upper boundary of the output interval.
+        epsilon (int | float): Minimum separation from interval bounds.
+        max_sum (int | float): Maximum value for the sum of criteria of a candidate.
+        fixed_sum (int, optional): Value for the total sum of criteria of a candidate.
+        ndigits (int, optional): Precision (number of digit after the coma).
+        vectorized (bool, optional): Draws the fixed sum candidates by blocks.
+        The default value is False.
+    """
+    candidates_seed, rowa_seed, pi_seed = seeds
+    fold_layout = ExperimentLayout(path).fold(fold)
+    fold_layout.make_dirs()
+    fold_path = fold_layout.path
+
+    timing: Dict[str, float] = {}
+    redistributive_owa = timed(timing, "rowa", gen_rowa, nb_var, rowa_seed)
+    data, rejection_rate = timed(
+        timing,
+        "candidates",
+        generation_type,
+        nb_var,
+        nb_cand,
+        low,
+        high,
+        epsilon,
+        max_sum,
+        fixed_sum,
+        ndigits,
+        candidates_seed,
+        vectorized=vectorized,
+        return_rejection_rate=True,
+    )
+    owa_rank = timed(timing, "owa_ranks", owa_ranks, data, redistributive_owa)
+    spills = {
+        name: fold_layout.spill(name)
+        for name in ("restricted_lorenz_dom", "generalized_lorenz_dom", "rowa")
+    }
+    timed(
+        timing,
+        "lorenz_dominances",
+        stream_dominances,
+        lorenz_dominances_chunks(data),
+        [
+            save_indexes_pairs_factory(
+                fold_layout.restricted,
+                "restricted_lorenz_dom",
+                spills["restricted_lorenz_dom"],
+            ),
+            save_indexes_pairs_factory(
+                fold_layout.generalized,
+                "generalized_lorenz_dom",
+                spills["generalized_lorenz_dom"],
+            ),
+        ],
+    )
+    restricted_lorenz_dom = load_spilled_indexes_pairs(spills["restricted_lorenz_dom"])
+    generalized_lorenz_dom = load_spilled_indexes_pairs(
+        spills["generalized_lorenz_dom"]
+    )
+    pi, pi_statements = timed(
+        timing,
+        "pi_statements",
+        gen_pi_statements,
+        nb_pi,
+        data,
+        redistributive_owa,
+        restricted_lorenz_dom,
+        generalized_lorenz_dom,
+        pi_seed,
+    )
+    timed(
+        timing,
+        "rowa_dominances",
+        stream_dominances,
+        (
+            (pairs,)
+            for pairs in redistributive_owa_dominance_chunks(
+                data,
+                pi_statements,
+                ndigits,
+                restricted_lorenz_dom,
+                generalized_lorenz_dom,
+            )
+        ),
+        [
+            save_indexes_pairs_factory(
+                fold_layout.robust, "rowa_dominances", spills["rowa"]
+            )
+        ],
+    )
+    rowa_dom = load_spilled_indexes_pairs(spills["rowa"])
+    start = perf_counter()
+    save_data(fold_path, "candidates", data)
+    save_data(fold_path, "true_owa", redistributive_owa)
+    save_data(fold_path, "owa_ranks", owa_rank)
+    save_data(fold_path, "pi_indexes", pi)
+    save_data(fold_path, "pi_statements", pi_statements)
+    save_dataset_bundle(
+        fold_path,
+        meta=nparray(
+            [
+                nb_fold,
+                nb_cand,
+                nb_pi,
+                nb_var,
+                low,
+                high,
+                epsilon,
+                max_sum,
+                fixed_sum,
+                ndigits,
+            ],
+            dtype=float64,
+        ),
+        candidates=data,
+        rejection_rate=nparray([rejection_rate], dtype=float64),
+        true_owa=redistributive_owa,
+        restricted_lorenz_dom=restricted_lorenz_dom,
+        generalized_lorenz_dom=generalized_lorenz_dom,
+        owa_ranks=owa_rank,
+        pi_indexes=pi,
+        pi_statements=pi_statements,
+        rowa_dominances=rowa_dom,
+    )
+    # The spill files can only be removed (on Windows) once their memory maps
+    # are released, including the ones kept by reference cycles
+    del restricted_lorenz_dom, generalized_lorenz_dom, rowa_dom
+    collect()
+    for spill in spills.values():
+        remove(spill)
+    timing["savings"] = perf_counter() - start
+    return timing
 
 
 def gen_int_candidates(
@@ -181,6 +425,8 @@ def gen_int_candidates(
     epsilon: int = 1,
     max_sum: int = 0,
     seed: int = 404,
+    block_size: int = 1024,
+    return_rejection_rate: bool = False,
 ):
     """Generates a ndarray of non Pareto-dominated candidates with integer values on criteria
 
@@ -198,22 +444,24 @@ def gen_int_candidates(
         Avoids infinite loop when a Pareto dominating candidate is generated in the set.
         Defaults to 2/3 * nb_var * high.
         seed (int, optional): Seed value for fixing randomness. The default value is 404.
+        block_size (int, optional): Number of candidates drawn at once.
+        The default value is 1024.
+        return_rejection_rate (bool, optional): Also returns the rate of drawn candidates
+        rejected. The default value is False.
     """
     rng = default_rng(seed)
     max_sum = ceil(2 / 3 * nb_var * high) if max_sum == 0 else max_sum
-    sorted_int_candidate = sorted_int_candidate_factory(rng)
-    candidates = zeros((nb_cand, nb_var), dtype=int_)
-    for i in range(nb_cand):
-        valid = False
-        while not valid:
-            new_cand = sorted_int_candidate(nb_var, low, high, epsilon)
-            if npsum(new_cand) <= max_sum and not any(
-                pareto_dominance(x, new_cand) or pareto_dominance(new_cand, x)
-                for x in candidates[0:i, :]
-            ):
-                candidates[i] = new_cand
-                valid = True
-
+    sorted_int_candidates = sorted_int_candidates_factory(rng)
+    candidates, rejection_rate = pareto_filtered_candidates(
+        lambda nb_rows: sorted_int_candidates(nb_rows, nb_var, low, high, epsilon),
+        nb_cand,
+        nb_var,
+        max_sum,
+        int_,
+        block_size,
+    )
+    if return_rejection_rate:
+        return candidates, rejection_rate
     return candidates
 
 
@@ -225,8 +473,14 @@ def gen_int_candidates_fixed_sum(
     epsilon: int = 1,
     fixed_sum: int = 50,
     seed: int = 404,
+    vectorized: bool = False,
+    block_size: int = 1024,
+    return_rejection_rate: bool = False,
+    max_draws: int = MAX_FIXED_SUM_DRAWS,
 ):
-    """Generates a ndarray of non Pareto-dominated candidates with integer values on criteria
+    """Generates a ndarray of non Pareto-dominated candidates with integer values on criteria.
+    Raises a ValueError if max_draws candidates were drawn without accepting nb_cand
+    distinct candidates (e.g. fewer distinct candidates with the fixed sum than nb_cand).
 
     Args:
         nb_var (int): Number of criteria.
@@ -240,20 +494,65 @@ def gen_int_candidates_fixed_sum(
         The default value is 1.
         fixed_sum (int, optional): Value for the total sum of criteria of a candidate.
         seed (int, optional): Seed value for fixing randomness. The default value is 404.
+        vectorized (bool, optional): Draws the candidates by blocks. Faster but the
+        candidates differ from the default sampler for the same seed.
+        The default value is False.
+        block_size (int, optional): Number of candidates drawn at once when vectorized.
+        The default value is 1024.
+        return_rejection_rate (bool, optional): Also returns the rate of drawn candidates
+        rejected. The default value is False.
+        max_draws (int, optional): Maximum number of candidates drawn.
+        The default value is MAX_FIXED_SUM_DRAWS.
     """
     rng = default_rng(seed)
-    sorted_fixed_sum_int_candidate = sorted_fixed_sum_int_candidate_factory(
-        rng, fixed_sum
-    )
     candidates = zeros((nb_cand, nb_var), dtype=int_)
-    for i in range(nb_cand):
-        valid = False
-        while not valid:
-            new_cand = sorted_fixed_sum_int_candidate(nb_var, low, high, epsilon)
-            if not any(array_equiv(x, new_cand) for x in candidates[0:i, :]):
-                candidates[i] = new_cand
-                valid = True
+    seen = set()
+    nb_accepted = 0
+    nb_drawn = 0
+
+    def check_draws():
+        """Raises a ValueError once max_draws candidates were drawn."""
+        if nb_drawn >= max_draws:
+            raise ValueError(
+                f"Only {nb_accepted} of {nb_cand} distinct fixed sum candidates"
+                f" accepted after {nb_drawn} drawn candidates"
+                f" (rejection rate {1 - nb_accepted / nb_drawn:.6f})"
+            )
 
+    if vectorized:
+        sorted_fixed_sum_int_candidates = sorted_fixed_sum_int_candidates_factory(
+            rng, fixed_sum
+        )
+        while nb_accepted < nb_cand:
+            check_draws()
+            block = sorted_fixed_sum_int_candidates(
+                block_size, nb_var, low, high, epsilon
+            ).astype(int_, copy=False)
+            for new_cand in block:
+                nb_drawn += 1
+                key = new_cand.tobytes()
+                if key not in seen:
+                    seen.add(key)
+                    candidates[nb_accepted] = new_cand
+                    nb_accepted += 1
+                    if nb_accepted == nb_cand:
+                        break
+    else:
+        sorted_fixed_sum_int_candidate = sorted_fixed_sum_int_candidate_factory(
+            rng, fixed_sum
+        )
+        while nb_accepted < nb_cand:
+            check_draws()
+            new_cand = sorted_fixed_sum_int_candidate(nb_var, low, high, epsilon)
+            nb_drawn += 1
+            key = new_cand.astype(int_, copy=False).tobytes()
+            if key not in seen:
+                seen.add(key)
+                candidates[nb_accepted] = new_cand
+                nb_accepted += 1
+
+    if return_rejection_rate:
+        return candidates, 1 - nb_cand / nb_drawn if nb_drawn > 0 else 0.0
     return candidates
 
 
@@ -266,6 +565,8 @@ def gen_uniform_candidates(
     ndigits: int = 3,
     max_sum: float = 0.0,
     seed: int = 404,
+    block_size: int = 1024,
+    return_rejection_rate: bool = False,
 ):
     """Generates a ndarray of non Pareto-dominated candidates with integer values on criteria
 
@@ -285,48 +586,88 @@ def gen_uniform_candidates(
         Avoids infinite loop when a Pareto dominating candidate is generated in the set.
         Defaults to 2/3 * nb_var * high.
         seed (int, optional): Seed value for fixing randomness. The default value is 404.
+        block_size (int, optional): Number of candidates drawn at once.
+        The default value is 1024.
+        return_rejection_rate (bool, optional): Also returns the rate of drawn candidates
+        rejected. The default value is False.
     """
     rng = default_rng(seed)
     max_sum = 2 / 3 * high * nb_var if max_sum == 0.0 else max_sum
-    sorted_uniform_candidate = sorted_uniform_candidate_factory(rng)
-    candidates = zeros((nb_cand, nb_var), dtype=float64)
-    for i in range(nb_cand):
-        valid = False
-        while not valid:
-            new_cand = sorted_uniform_candidate(nb_var, low, high, epsilon, ndigits)
-            if npsum(new_cand) <= max_sum and not any(
-                pareto_dominance(x, new_cand) or pareto_dominance(new_cand, x)
-                for x in candidates[0:i, :]
-            ):
-                candidates[i] = new_cand
-                valid = True
-
+    sorted_uniform_candidates = sorted_uniform_candidates_factory(rng)
+    candidates, rejection_rate = pareto_filtered_candidates(
+        lambda nb_rows: sorted_uniform_candidates(
+            nb_rows, nb_var, low, high, epsilon, ndigits
+        ),
+        nb_cand,
+        nb_var,
+        max_sum,
+        float64,
+        block_size,
+    )
+    if return_rejection_rate:
+        return candidates, rejection_rate
     return candidates
 
 
+def lorenz_dominances_chunks(data, chunk_size: int = LORENZ_CHUNK_CANDIDATES):
+    """Yields the arrays of pairs (i,j) such that j Restricted and Generalized Lorenz
+    dominates i, by blocks of chunk_size first candidates of the pairs, in the order of
+    lorenz_dominances.
+
+    Args:
+        data (NDArray): Dataset of candidates.
+        chunk_size (int, optional): Number of candidates by block.
+        The default value is LORENZ_CHUNK_CANDIDATES.
+    """
+    nb_cand = data.shape[0]
+    for first in range(0, nb_cand, chunk_size):
+        generalized_dom = []
+        restricted_dom = []
+        for i in range(first, min(first + chunk_size, nb_cand)):
+            for j in range(i + 1, nb_cand):
+                if restricted_lorenz_dominance(data[i], data[j]):
+                    restricted_dom.append((i, j))
+                if restricted_lorenz_dominance(data[j], data[i]):
+                    restricted_dom.append((j, i))
+                if generalized_lorenz_dominance(data[i], data[j]):
+                    generalized_dom.append((i, j))
+                if generalized_lorenz_dominance(data[j], data[i]):
+                    generalized_dom.append((j, i))
+        yield indexes_pairs_array(restricted_dom), indexes_pairs_array(generalized_dom)
+
+
 def lorenz_dominances(data):
     """Returns the list of pairs (i,j) such that j Lorenz dominates i.
 
     Args:
         data (NDArray): Dataset of candidates.
     """
-    nb_cand = data.shape[0]
     generalized_dom = []
     restricted_dom = []
-    for i in range(nb_cand):
-        for j in range(i + 1, nb_cand):
-            if restricted_lorenz_dominance(data[i], data[j]):
-                restricted_dom.append((i, j))
-            if restricted_lorenz_dominance(data[j], data[i]):
-                restricted_dom.append((j, i))
-            if generalized_lorenz_dominance(data[i], data[j]):
-                generalized_dom.append((i, j))
-            if generalized_lorenz_dominance(data[j], data[i]):
-                generalized_dom.append((j, i))
+    for restricted, generalized in lorenz_dominances_chunks(data):
+        restricted_dom += map(tuple, restricted.tolist())
+        generalized_dom += map(tuple, generalized.tolist())
 
     return restricted_dom, generalized_dom
 
 
+def stream_dominances(chunks, savers):
+    """Sends each chunk of pairs of each relation to its saver (see
+    save_indexes_pairs_factory) and closes the savers.
+
+    Args:
+        chunks (Iterable): Tuples of arrays of pairs, one array by relation.
+        savers (List): Generator objects saving the relations.
+    """
+    try:
+        for relations in chunks:
+            for saver, pairs in zip(savers, relations):
+                saver.send(pairs)
+    finally:
+        for saver in savers:
+            saver.close()
+
+
 def gen_rowa(nb_var: int, seed: int = 404):
     """Returns from the Diriclet distribution a redistributive Ordered Weighted Average.
 
@@ -338,76 +679,127 @@ def gen_rowa(nb_var: int, seed: int = 404):
     return true_rowa(nb_var, rng)
 
 
+def eligible_pi_row(u: int, ranks, lorenz_keys):
+    """Returns the candidates v > u such that the pair (u,v) is eligible for a
+    preferential information statement: neither Lorenz comparable nor tied by the
+    redistributive OWA.
+
+    Args:
+        u (int): Index of the first candidate.
+        ranks (NDArray): Rank of each candidate in the precise redistributive OWA
+        preorder (see owa_ranks).
+        lorenz_keys (NDArray): Sorted keys of the Lorenz dominance pairs in both
+        orientations (see dominance_keys).
+    """
+    nb_cand = ranks.shape[0]
+    v = arange(u + 1, nb_cand)
+    lorenz = dominance_row(lorenz_keys, nb_cand, u)[u + 1 :]
+    return v[(ranks[v] != ranks[u]) & ~lorenz]
+
+
 def gen_pi_statements(
     nb_pi: int,
     data,
     redistributive_owa,
-    restricted_dom: List[Tuple[int, int]],
-    generalized_dom: List[Tuple[int, int]],
+    restricted_dom,
+    generalized_dom,
     seed: int = 404,
 ):
     """Generates Preferential Information compatible with the given redistributive OWA.
     Returns the indexes of concerned candidates and the values of the associated statements.
+    The pairs are drawn without replacement among the pairs of candidates that are neither
+    Lorenz comparable nor tied by the redistributive OWA. The eligible pairs are
+    numbered row by row (see eligible_pi_row) and only their number by row is kept
+    in memory, the rows of the drawn pairs being computed again.
 
     Args:
         nb_pi (int): Number of Preferential Information statements to generate.
         data (NDArray): Dataset of candidates.
         redistributive_owa (ArrayLike): Value of the redistributive OWA operator.
-        restricted_dom (List[Tuple[int,int]]): List of Restricted Lorenz statements in data.
-        generalized_dom (List[Tuple[int,int]]): List of Generalized Lorenz statements in data.
+        restricted_dom (ArrayLike): Pairs of Restricted Lorenz statements in data.
+        generalized_dom (ArrayLike): Pairs of Generalized Lorenz statements in data.
         seed (int, optional): Seed value for fixing randomness. The default value is 404.
     """
     rng = default_rng(seed)
-    nb_cand, nb_var = data.shape
-    pi = zeros((nb_pi, 2), dtype=int_)
-    pi_statement = zeros((nb_pi, nb_var))
-    for i in range(nb_pi):
-        valid = False
-        while not valid:
-            (u, v) = rng.integers(0, nb_cand, 2)
-            if (
-                u != v
-                and (u, v) not in pi
-                and (v, u) not in pi
-                and (u, v) not in restricted_dom
-                and (v, u) not in restricted_dom
-                and (u, v) not in generalized_dom
-                and (v, u) not in generalized_dom
-            ):
-                score = (data[v] - data[u]) @ redistributive_owa
-                if score > 0.0:
-                    pi_statement[i] = data[v] - data[u]
-                    pi[i] = (u, v)
-                    valid = True
-                elif score < 0.0:
-                    pi_statement[i] = data[u] - data[v]
-                    pi[i] = (v, u)
-                    valid = True
-
+    nb_cand = data.shape[0]
+    ranks = owa_ranks(data, redistributive_owa)
+    relations = [
+        asarray(dominances, dtype=int_).reshape((-1, 2))
+        for dominances in (restricted_dom, generalized_dom)
+    ]
+    lorenz_keys = dominance_keys(
+        nb_cand, *relations, *(pairs[:, ::-1] for pairs in relations)
+    )
+    ends = npcumsum(
+        nparray(
+            [eligible_pi_row(u, ranks, lorenz_keys).shape[0] for u in range(nb_cand)],
+            dtype=int_,
+        )
+    )
+    nb_eligible = int(ends[-1]) if nb_cand > 0 else 0
+    if nb_eligible < nb_pi:
+        raise ValueError(
+            f"Only {nb_eligible} pairs of candidates are eligible"
+            f" for {nb_pi} preferential information statements"
+        )
+    drawn = rng.choice(nb_eligible, nb_pi, replace=False)
+    u = searchsorted(ends, drawn, "right")
+    rows = {k: eligible_pi_row(k, ranks, lorenz_keys) for k in set(u.tolist())}
+    v = nparray(
+        [rows[k][d - ends[k] + rows[k].shape[0]] for k, d in zip(u.tolist(), drawn)],
+        dtype=int_,
+    )
+    # Orientation by the OWA ranks: the second candidate is the preferred one
+    swap = ranks[u] > ranks[v]
+    u, v = where(swap, v, u), where(swap, u, v)
+    pi = stack((u, v), axis=1).astype(int_)
+    pi_statement = (data[v] - data[u]).astype(float64)
     return pi, pi_statement
 
 
+def owa_ranks(data, redistributive_owa, rtol: float = 1e-9):
+    """Returns the rank of each candidate in the precise redistributive OWA preorder
+    (0 for the worst candidates, equal ranks for equal scores).
+    The complete relation is thus stored with one value by candidate.
+
+    Args:
+        data (NDArray): Dataset of candidates.
+        redistributive_owa (ArrayLike): Weights of the precise redistributive OWA.
+        rtol (float, optional): Relative tolerance under which a score is considered
+        tied with the lowest score of its group (floating point rounding of equal
+        scores). The default value is 1e-9.
+    """
+    scores = data @ redistributive_owa
+    order = argsort(scores, kind="stable")
+    sorted_scores = scores[order]
+    ranks = zeros(data.shape[0], dtype=int_)
+    if data.shape[0] > 1:
+        tolerance = rtol * max(1.0, float(npmax(npabs(sorted_scores))))
+        # Each group starts at the first score above the tolerance from the start
+        # of the previous group, so that ties do not chain
+        group_starts = zeros(data.shape[0], dtype=bool)
+        start = 0
+        while start < data.shape[0]:
+            group_starts[start] = True
+            start = int(
+                searchsorted(sorted_scores, sorted_scores[start] + tolerance, "right")
+            )
+        ranks[order] = npcumsum(group_starts) - 1
+    return ranks
+
+
 def owa_dominances(data, redistributive_owa):
-    """Returns the list of pairs (i,j) such that j owa dominates i.
+    """Returns the array of pairs (i,j) such that j owa dominates i.
     (The relation is complete)
 
     Args:
         data (NDArray): Dataset of candidates.
         redistributive_owa (ArrayLike): Weights of the precise redistributive OWA.
     """
-    nb_cand = data.shape[0]
-    owa_dom = []
-    for i, j in combinations(range(nb_cand), 2):
-        score_diff = (data[j] - data[i]) @ redistributive_owa
-        if score_diff == 0.0:
-            owa_dom.append((i, j))
-            owa_dom.append((j, i))
-        elif score_diff > 0.0:
-            owa_dom.append((i, j))
-        else:
-            owa_dom.append((j, i))
-
-    return owa_dom
+    rows = list(owa_dominance_rows(owa_ranks(data, redistributive_owa)))
+    if not rows:
+        return zeros((0, 2), dtype=int_)
+    return concatenate(rows)
 
 
 def generation_example(path: str):
@@ -453,13 +845,9 @@ def generation_example(path: str):
         0,
     )
 
-    fold_path = f"{path}\\0"
-    if not pathexists(f"{fold_path}\\Restricted"):
-        makedirs(f"{fold_path}\\Restricted")
-    if not pathexists(f"{fold_path}\\Generalized"):
-        makedirs(f"{fold_path}\\Generalized")
-    if not pathexists(f"{fold_path}\\RobustOWA"):
-        makedirs(f"{fold_path}\\RobustOWA")
+    fold_layout = ExperimentLayout(path).fold(0)
+    fold_layout.make_dirs()
+    fold_path = fold_layout.path
 
     data = nparray(
         [
@@ -474,16 +862,14 @@ def generation_example(path: str):
     redistributive_owa = nparray([0.615385, 0.142308, 0.142308, 0.05, 0.05])
     save_data(fold_path, "true_owa", redistributive_owa)
     restricted_lorenz_dom, generalized_lorenz_dom = lorenz_dominances(data)
+    save_data(fold_layout.restricted, "restricted_lorenz_dom", restricted_lorenz_dom)
     save_data(
-        f"{fold_path}\\Restricted", "restricted_lorenz_dom", restricted_lorenz_dom
-    )
-    save_data(
-        f"{fold_path}\\Generalized",
+        fold_layout.generalized,
         "generalized_lorenz_dom",
         generalized_lorenz_dom,
     )
-    owa_dom = owa_dominances(data, redistributive_owa)
-    save_data(fold_path, "owa_dominances", owa_dom)
+    owa_rank = owa_ranks(data, redistributive_owa)
+    save_data(fold_path, "owa_ranks", owa_rank)
     pi = nparray([[1, 3]], dtype=int_)
     pi_statements = nparray([data[3] - data[1]], dtype=float64)
     save_data(fold_path, "pi_indexes", pi)
@@ -491,4 +877,16 @@ def generation_example(path: str):
     rowa_dom = compute_redistributive_owa_dominance(
         data, pi_statements, 0, restricted_lorenz_dom, generalized_lorenz_dom
     )
-    save_data(f"{fold_path}\\RobustOWA", "rowa_dominances", rowa_dom)
+    save_data(fold_layout.robust, "rowa_dominances", rowa_dom)
+    save_dataset_bundle(
+        fold_path,
+        meta=nparray([1, 4, 1, 5, 0, 100, 0, 0, 0, 0], dtype=float64),
+        candidates=data,
+        true_owa=redistributive_owa,
+        restricted_lorenz_dom=indexes_pairs_array(restricted_lorenz_dom),
+        generalized_lorenz_dom=indexes_pairs_array(generalized_lorenz_dom),
+        owa_ranks=owa_rank,
+        pi_indexes=pi,
+        pi_statements=pi_statements,
+        rowa_dominances=indexes_pairs_array(rowa_dom),
+    )
@@ -0,0 +1,128 @@
+"""Classes giving the paths of the files of an experiment on any platform (pathlib) :
+    - root folder: meta data, generation timing, folds and analysis outputs
+    - fold folders: dataset csv files and bundle, dominances, checkpoint and
+    results of each method
+Results files of the methods are named relatively to the fold folder with "/"
+as separator (e.g. "Restricted/hlp.csv"), see method_file.
+"""
+from pathlib import Path, PurePosixPath
+
+RESTRICTED_FOLDER = "Restricted"
+GENERALIZED_FOLDER = "Generalized"
+ROBUST_FOLDER = "RobustOWA"
+
+
+def method_file(folder: str, name: str) -> str:
+    """Returns the name of the results file of a method, relative to the fold folder.
+
+    Args:
+        folder (str): Folder of the dominances explained by the method.
+        name (str): File name of the results.
+    """
+    return str(PurePosixPath(folder, name))
+
+
+class FoldLayout:
+    """Paths of the files of a fold folder."""
+
+    def __init__(self, path) -> None:
+        self.path = Path(path)
+
+    def file(self, name: str, folder: str = "") -> Path:
+        """Returns the path of a csv file of the fold.
+
+        Args:
+            name (str): Name of the data (without extension).
+            folder (str, optional): Subfolder of the fold. Defaults to the fold folder.
+        """
+        return self.path / folder / f"{name}.csv"
+
+    def results(self, method: str) -> Path:
+        """Returns the path of the results file of a method (see method_file).
+
+        Args:
+            method (str): Name of the results file of the method.
+        """
+        return self.path.joinpath(*PurePosixPath(method).parts)
+
+    @property
+    def restricted(self) -> Path:
+        """Folder of the restricted Lorenz dominances and of their explanations."""
+        return self.path / RESTRICTED_FOLDER
+
+    @property
+    def generalized(self) -> Path:
+        """Folder of the generalized Lorenz dominances and of their explanations."""
+        return self.path / GENERALIZED_FOLDER
+
+    @property
+    def robust(self) -> Path:
+        """Folder of the robust redistributive OWA dominances and of their explanations."""
+        return self.path / ROBUST_FOLDER
+
+    @property
+    def bundle(self) -> Path:
+        """Binary bundle of the dataset of the fold."""
+        return self.path / "dataset.npz"
+
+    def spill(self, name: str) -> Path:
+        """Returns the path of the temporary binary file of a relation streamed to disk
+        during the generation (raw pairs of indexes).
+
+        Args:
+            name (str): Name of the relation.
+        """
+        return self.path / f"{name}.pairs"
+
+    @property
+    def checkpoint(self) -> Path:
+        """Checkpoint of the explanation results of the fold."""
+        return self.path / "checkpoint.csv"
+
+    def make_dirs(self):
+        """Creates the fold folder and its subfolders if they do not exist."""
+        for folder in (self.restricted, self.generalized, self.robust):
+            folder.mkdir(parents=True, exist_ok=True)
+
+
+class ExperimentLayout:
+    """Paths of the files of an experiment folder."""
+
+    def __init__(self, root) -> None:
+        self.root = Path(root)
+
+    @property
+    def meta(self) -> Path:
+        """Meta data file of the experiment."""
+        return self.root / "meta.csv"
+
+    @property
+    def generation_timing(self) -> Path:
+        """Duration of the generation stages of each fold."""
+        return self.root / "generation_timing.csv"
+
+    def fold(self, fold: int) -> FoldLayout:
+        """Returns the layout of a fold.
+
+        Args:
+            fold (int): Index of the fold.
+        """
+        return FoldLayout(self.root / str(fold))
+
+    def analysis(self, kind: str, method: str, name: str = "") -> Path:
+        """Returns the folder of the analysis of a method
+        (root/Analysis/kind/<folder of the method>/name).
+
+        Args:
+            kind (str): Kind of analysis (Individual or Pairwise).
+            method (str): Name of the results file of the method.
+            name (str, optional): Name of the analysis. Defaults to the method file stem.
+        """
+        method_path = PurePosixPath(method)
+        return (
+            self.root
+            / "Analysis"
+            / kind
+            / method_path.parts[0]
+            / (name or method_path.stem)
+        )
@@ -1,3 +1,5 @@
+from .cache import *
+from .bundle import *
 from .structural_data import *
 from .dominance_data import *
 from .experiment_data import *
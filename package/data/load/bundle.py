@@ -0,0 +1,57 @@
+"""Functions :
+    - checking if a fold folder contains the binary bundle of its dataset
+    - loading the binary bundle of a fold with memory-mapped arrays
+"""
+from struct import unpack
+from zipfile import ZipFile, ZIP_STORED
+from numpy import load, memmap, zeros
+from numpy.lib.format import read_magic, read_array_header_1_0, read_array_header_2_0
+from ..layout import FoldLayout
+
+
+def has_dataset_bundle(exp_path: str) -> bool:
+    """Returns True if the fold folder contains the binary bundle of its dataset.
+
+    Args:
+        exp_path (str): Path to the experiment's csv folder.
+    """
+    return FoldLayout(exp_path).bundle.exists()
+
+
+def load_dataset_bundle(exp_path: str):
+    """Loads the arrays of the binary bundle of a fold in a dictionary.
+    Arrays stored without compression are memory-mapped (read-only) instead of read.
+
+    Args:
+        exp_path (str): Path to the experiment's csv folder.
+    """
+    file = FoldLayout(exp_path).bundle
+    arrays = {}
+    with ZipFile(file) as archive, open(file, "rb") as f:
+        for info in archive.infolist():
+            name = info.filename[:-4]
+            # Local file header: fixed 30 bytes then file name and extra field
+            f.seek(info.header_offset)
+            name_length, extra_length = unpack("<HH", f.read(30)[26:])
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            version = read_magic(f)
+            if info.compress_type != ZIP_STORED or version not in ((1, 0), (2, 0)):
+                with load(file) as npz:
+                    arrays[name] = npz[name]
+                continue
+            read_array_header = (
+                read_array_header_1_0 if version == (1, 0) else read_array_header_2_0
+            )
+            shape, fortran_order, dtype = read_array_header(f)
+            if 0 in shape:
+                arrays[name] = zeros(shape, dtype=dtype)
+            else:
+                arrays[name] = memmap(
+                    file,
+                    dtype=dtype,
+                    mode="r",
+                    offset=f.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+    return arrays
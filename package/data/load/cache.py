@@ -0,0 +1,69 @@
+"""Functions :
+    - caching in process the data loaded from a file, reloaded only when
+    the file has been modified since, the least recently used data being evicted
+    beyond a memory budget
+    - clearing the cache
+"""
+from collections import OrderedDict
+from os import stat
+from sys import getsizeof
+from typing import Any, Callable, Tuple
+
+FILES_CACHE_MAX_BYTES = 1 << 28
+
+# (file, loader) -> (version, data, size in bytes), least recently used first
+FILES_CACHE: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], Any, int]]" = (
+    OrderedDict()
+)
+FILES_CACHE_BYTES = 0
+
+
+def data_size(data) -> int:
+    """Returns the approximate size in bytes of loaded data (arrays, and tuples or
+    lists of values).
+
+    Args:
+        data (Any): Loaded data.
+    """
+    if hasattr(data, "nbytes"):
+        return int(data.nbytes)
+    if isinstance(data, (tuple, list)):
+        return getsizeof(data) + sum(data_size(value) for value in data)
+    return getsizeof(data)
+
+
+def load_cached(file: str, loader: Callable, *args):
+    """Returns the data loaded by loader(*args) from the given file. The data is
+    kept in process and only loaded again if the modification time or the size
+    of the file changed. The least recently used data are evicted while the cache
+    holds more than FILES_CACHE_MAX_BYTES (the last loaded data is always kept).
+
+    Args:
+        file (str): Path to the file read by the loader.
+        loader (Callable): Function loading the data.
+        args (Any): Loader arguments.
+    """
+    global FILES_CACHE_BYTES
+    status = stat(file)
+    version = (status.st_mtime_ns, status.st_size)
+    key = (str(file), loader.__qualname__)
+    cached = FILES_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        FILES_CACHE.move_to_end(key)
+        return cached[1]
+    if cached is not None:
+        FILES_CACHE_BYTES -= FILES_CACHE.pop(key)[2]
+    data = loader(*args)
+    size = data_size(data)
+    FILES_CACHE[key] = (version, data, size)
+    FILES_CACHE_BYTES += size
+    while FILES_CACHE_BYTES > FILES_CACHE_MAX_BYTES and len(FILES_CACHE) > 1:
+        FILES_CACHE_BYTES -= FILES_CACHE.popitem(last=False)[1][2]
+    return data
+
+
+def clear_cache():
+    """Empties the cache of loaded files."""
+    global FILES_CACHE_BYTES
+    FILES_CACHE.clear()
+    FILES_CACHE_BYTES = 0
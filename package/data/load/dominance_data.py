@@ -1,54 +1,222 @@
-"""Functions loading :
+"""Functions loading from binary bundle or csv file :
     - restricted Lorenz dominance pairs
     - generalized Lorenz dominance pairs
-    - precise redistributive owa dominance pairs
+    - precise redistributive owa dominance pairs (from the ranks of candidates)
     - robust redistributive owa dominance pairs
+    - pairs streamed to a spill file during the generation
+and prefetching pairs in a background thread.
 """
-from csv import reader
+from os.path import exists as pathexists, getsize
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from numpy import loadtxt, int_, arange, where, repeat, stack, cumsum, memmap, zeros
+from .bundle import has_dataset_bundle, load_dataset_bundle
+from ..layout import FoldLayout, RESTRICTED_FOLDER, GENERALIZED_FOLDER, ROBUST_FOLDER
+
+CHUNK_BYTES = 1 << 20
+CHUNK_ROWS = 1 << 16
+PREFETCH_SIZE = 1 << 12
+PREFETCH_POLL = 0.1
+
+
+def load_indexes_pairs_chunks(file: str):
+    """Loads pairs of dominance candidates indexes from csv file by chunks.
+    Yields arrays of pairs (one pair by row).
+
+    Args:
+        file (str): Path to the csv file.
+    """
+    with open(file, "r", newline="", encoding="utf8") as f:
+        while True:
+            lines = f.readlines(CHUNK_BYTES)
+            if not lines:
+                return
+            yield loadtxt(lines, delimiter=";", dtype=int_, ndmin=2)
 
 
 def load_indexes_pairs(file: str):
     """Loads pairs of dominance candidates indexes from csv file.
 
     Args:
-        path (str): Path to the experiment's csv folder.
+        file (str): Path to the csv file.
     """
-    with open(file, "r", newline="", encoding="utf8") as f:
-        for x in reader(f, delimiter=";"):
-            yield (int(x[0]), int(x[1]))
+    for pairs in load_indexes_pairs_chunks(file):
+        yield from zip(pairs[:, 0].tolist(), pairs[:, 1].tolist())
+
+
+def load_spilled_indexes_pairs(spill_file):
+    """Loads the pairs of candidates indexes of a spill file (see
+    save_indexes_pairs_factory) as a read-only memory-mapped array with 2 columns.
+
+    Args:
+        spill_file (str): Path to the binary file of raw pairs.
+    """
+    if getsize(spill_file) == 0:
+        return zeros((0, 2), dtype=int_)
+    return memmap(spill_file, dtype=int_, mode="r").reshape((-1, 2))
+
+
+def prefetched(iterable, buffer_size: int = PREFETCH_SIZE):
+    """Yields the items of the iterable (e.g. pairs of a dominance relation) read in
+    advance by a background thread, at most buffer_size items ahead, so that reading
+    the relation overlaps with the computations on the items already read.
+    When the generator is closed before the end, the thread stops reading
+    and the items read in advance are discarded.
+
+    Args:
+        iterable (Iterable): Items to read.
+        buffer_size (int, optional): Maximum number of items read in advance.
+        The default value is PREFETCH_SIZE.
+    """
+    queue: Queue = Queue(buffer_size)
+    end = object()
+    stop = Event()
+
+    def put(entry) -> bool:
+        """Puts the entry in the queue, waiting for free space until the generator
+        is closed. Returns False if it was closed."""
+        while not stop.is_set():
+            try:
+                queue.put(entry, timeout=PREFETCH_POLL)
+                return True
+            except Full:
+                pass
+        return False
+
+    def read():
+        """Reads the items in the queue, then the end marker and the error if any."""
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+            put((end, None))
+        except Exception as error:
+            put((end, error))
+
+    reader = Thread(target=read, daemon=True)
+    reader.start()
+    try:
+        while True:
+            item, error = queue.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        # Releases a reader waiting for free space
+        try:
+            while True:
+                queue.get_nowait()
+        except Empty:
+            pass
+        reader.join()
+
+
+def load_bundle_indexes_pairs(exp_path: str, name: str):
+    """Loads pairs of dominance candidates indexes from the binary bundle of the fold.
+
+    Args:
+        exp_path (str): Path to the experiment's csv folder.
+        name (str): Name of the dominance relation in the bundle.
+    """
+    pairs = load_dataset_bundle(exp_path)[name]
+    for start in range(0, pairs.shape[0], CHUNK_ROWS):
+        chunk = pairs[start : start + CHUNK_ROWS]
+        yield from zip(chunk[:, 0].tolist(), chunk[:, 1].tolist())
+
+
+def owa_dominance_rows(ranks):
+    """Yields for each candidate i the array of pairs (i,j) or (j,i), for j > i,
+    such that the second candidate owa dominates the first, given the ranks of the
+    candidates in the precise redistributive OWA preorder. Both pairs are yielded
+    when candidates are tied.
+
+    Args:
+        ranks (ArrayLike): Rank of each candidate (equal ranks for equal scores).
+    """
+    nb_cand = len(ranks)
+    for i in range(nb_cand - 1):
+        j = arange(i + 1, nb_cand)
+        diff = ranks[j] - ranks[i]
+        looser = where(diff >= 0, i, j)
+        winner = where(diff >= 0, j, i)
+        tie = diff == 0
+        pairs = repeat(stack((looser, winner), axis=1), 1 + tie, axis=0)
+        # The reversed pair of a tie is placed right after it
+        reversed_ties = (cumsum(1 + tie) - 1)[tie]
+        pairs[reversed_ties] = pairs[reversed_ties, ::-1]
+        yield pairs
+
+
+def load_owa_ranks_indexes_pairs(ranks):
+    """Loads pairs of precise redistributive OWA dominance candidates indexes
+    from the ranks of candidates.
+
+    Args:
+        ranks (ArrayLike): Rank of each candidate (equal ranks for equal scores).
+    """
+    for pairs in owa_dominance_rows(ranks):
+        yield from zip(pairs[:, 0].tolist(), pairs[:, 1].tolist())
 
 
 def load_restricted_lorenz_dominances(exp_path: str):
-    """Loads pairs of restricted Lorenz dominance candidates indexes from csv file.
+    """Loads pairs of restricted Lorenz dominance candidates indexes from the
+    binary bundle of the fold or from csv file.
 
     Args:
         path (str): Path to the experiment's csv folder.
     """
-    return load_indexes_pairs(f"{exp_path}\\Restricted\\restricted_lorenz_dom.csv")
+    if has_dataset_bundle(exp_path):
+        return load_bundle_indexes_pairs(exp_path, "restricted_lorenz_dom")
+    return load_indexes_pairs(
+        FoldLayout(exp_path).file("restricted_lorenz_dom", RESTRICTED_FOLDER)
+    )
 
 
 def load_generalized_lorenz_dominances(exp_path: str):
-    """Loads pairs of generalized Lorenz dominance candidates indexes from csv file.
+    """Loads pairs of generalized Lorenz dominance candidates indexes from the
+    binary bundle of the fold or from csv file.
 
     Args:
         path (str): Path to the experiment's csv folder.
     """
-    return load_indexes_pairs(f"{exp_path}\\Generalized\\generalized_lorenz_dom.csv")
+    if has_dataset_bundle(exp_path):
+        return load_bundle_indexes_pairs(exp_path, "generalized_lorenz_dom")
+    return load_indexes_pairs(
+        FoldLayout(exp_path).file("generalized_lorenz_dom", GENERALIZED_FOLDER)
+    )
 
 
 def load_robust_redistributive_owa_dominances(exp_path: str):
-    """Loads pairs of robust redistributive OWA dominance candidates indexes from csv file.
+    """Loads pairs of robust redistributive OWA dominance candidates indexes from the
+    binary bundle of the fold or from csv file.
 
     Args:
         path (str): Path to the experiment's csv folder.
     """
-    return load_indexes_pairs(f"{exp_path}\\RobustOWA\\rowa_dominances.csv")
+    if has_dataset_bundle(exp_path):
+        return load_bundle_indexes_pairs(exp_path, "rowa_dominances")
+    return load_indexes_pairs(
+        FoldLayout(exp_path).file("rowa_dominances", ROBUST_FOLDER)
+    )
 
 
 def load_redistributive_owa_dominances(exp_path: str):
-    """Loads pairs of robust redistributive OWA dominance candidates indexes from csv file.
+    """Loads pairs of precise redistributive OWA dominance candidates indexes from the
+    candidates ranks of the binary bundle or csv file (pairs csv file for legacy folders).
 
     Args:
         path (str): Path to the experiment's csv folder.
     """
-    return load_indexes_pairs(f"{exp_path}\\owa_dominances.csv")
+    if has_dataset_bundle(exp_path):
+        bundle = load_dataset_bundle(exp_path)
+        if "owa_ranks" in bundle:
+            return load_owa_ranks_indexes_pairs(bundle["owa_ranks"])
+        return load_bundle_indexes_pairs(exp_path, "owa_dominances")
+    if pathexists(FoldLayout(exp_path).file("owa_ranks")):
+        return load_owa_ranks_indexes_pairs(
+            loadtxt(FoldLayout(exp_path).file("owa_ranks"), dtype=int_, ndmin=1)
+        )
+    return load_indexes_pairs(FoldLayout(exp_path).file("owa_dominances"))
@@ -1,17 +1,33 @@
-"""Function reading results from an experiment"""
+"""Function reading results (and phase durations) from an experiment and the checkpoint
+of explanation results"""
 from csv import reader
+from os.path import exists as pathexists
+from warnings import catch_warnings, simplefilter
+from numpy import loadtxt, int_, float64, full, nan, zeros
+from ...timing import PHASES
+from .cache import load_cached
+from ..layout import FoldLayout
 
 
 def load_experiment_results(exp_path: str, file_location: str):
-    """Loads results of explanation experiment from csv file.
+    """Loads results of explanation experiment from csv file, one row at a time:
+    length, compute time, number of preferential information used and the duration
+    of each phase (see PHASES, NaN for results saved without phases).
 
     Args:
         path (str): Path to the experiment's csv folder.
         file_location (str): Csv file name (contains its subfolder also).
     """
-    with open(f"{exp_path}\\{file_location}", "r", newline="", encoding="utf8") as f:
+    with open(
+        FoldLayout(exp_path).results(file_location), "r", newline="", encoding="utf8"
+    ) as f:
         for x in reader(f, delimiter=";"):
-            yield (int(x[0]), float(x[1]), int(x[2]))
+            phases = (
+                tuple(float(v) for v in x[3 : 3 + len(PHASES)])
+                if len(x) >= 3 + len(PHASES)
+                else (nan,) * len(PHASES)
+            )
+            yield (int(x[0]), float(x[1]), int(x[2]), phases)
 
 
 def load_pairwise_length_data(exp_path: str, file_location: str):
@@ -21,6 +37,83 @@ def load_pairwise_length_data(exp_path: str, file_location: str):
         path (str): Path to the experiment's csv folder.
         file_location (str): Csv file name (contains its subfolder also).
     """
-    with open(f"{exp_path}\\{file_location}", "r", newline="", encoding="utf8") as f:
+    with open(
+        FoldLayout(exp_path).results(file_location), "r", newline="", encoding="utf8"
+    ) as f:
         for x in reader(f, delimiter=";"):
             yield (int(x[0]), int(x[1]))
+
+
+def load_experiment_results_array(exp_path: str, file_location: str):
+    """Loads results of explanation experiment from csv file as arrays of
+    lengths, compute times, number of preferential information used and duration
+    of each phase (one column by phase, see PHASES, NaN for results saved
+    without phases).
+
+    Args:
+        path (str): Path to the experiment's csv folder.
+        file_location (str): Csv file name (contains its subfolder also).
+    """
+    with catch_warnings():
+        simplefilter("ignore")
+        results = loadtxt(
+            FoldLayout(exp_path).results(file_location),
+            delimiter=";",
+            dtype=float64,
+            ndmin=2,
+        )
+    if results.shape[0] == 0:
+        results = zeros((0, 3 + len(PHASES)))
+    lengths, times, nb_pi = (
+        results[:, 0].astype(int_),
+        results[:, 1].copy(),
+        results[:, 2].astype(int_),
+    )
+    if results.shape[1] < 3 + len(PHASES):
+        phases = full((results.shape[0], len(PHASES)), nan)
+    else:
+        phases = results[:, 3 : 3 + len(PHASES)].copy()
+    for column in (lengths, times, nb_pi, phases):
+        column.flags.writeable = False
+    return lengths, times, nb_pi, phases
+
+
+def load_cached_experiment_results(exp_path: str, file_location: str):
+    """Loads results of explanation experiment as arrays (see load_experiment_results_array),
+    reading the csv file only if it was modified since its last loading in the process.
+    The returned arrays are shared, thus read-only.
+
+    Args:
+        path (str): Path to the experiment's csv folder.
+        file_location (str): Csv file name (contains its subfolder also).
+    """
+    return load_cached(
+        FoldLayout(exp_path).results(file_location),
+        load_experiment_results_array,
+        exp_path,
+        file_location,
+    )
+
+
+def load_checkpoint(path: str):
+    """Loads the explanation results of the checkpoint file of a fold in a dictionary
+    keyed by (method, i, j). Incomplete lines (interrupted writing) are ignored.
+
+    Args:
+        path (str): Path to the fold folder.
+    """
+    results = {}
+    if not pathexists(FoldLayout(path).checkpoint):
+        return results
+    with open(FoldLayout(path).checkpoint, "r", newline="", encoding="utf8") as f:
+        for line in f:
+            x = line.rstrip("\r\n").split(";")
+            if not line.endswith("\n") or len(x) not in (6, 6 + len(PHASES)):
+                continue
+            results[(x[0], int(x[1]), int(x[2]))] = [
+                int(x[3]),
+                float(x[4]),
+                int(x[5]),
+                *(float(d) for d in x[6:]),
+            ]
+    return results
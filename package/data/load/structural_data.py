@@ -1,25 +1,39 @@
 """Functions loading :
-    - candidates from csv file in ndarray
+    - candidates from binary bundle or csv file in ndarray
     - problem meta parameters
 """
 from csv import reader
 from warnings import catch_warnings, simplefilter
-from numpy import loadtxt, int_, float64
+from numpy import asarray, loadtxt, int_, float64
+from .bundle import has_dataset_bundle, load_dataset_bundle
+from .cache import load_cached
+from ..layout import ExperimentLayout, FoldLayout
 
 
 def load_dataset(exp_path: str, ndigits: int = 0):
-    """Load candidates and Preferential Information statements from csv file.
+    """Load candidates and Preferential Information statements from the binary bundle
+    of the fold (memory-mapped) or from csv files for folders without bundle.
 
     Args:
         exp_path (str): Path to the experiment's csv folder.
         ndigits (int, optional): Precision (number of digit after the coma).
         The default value is 0 (loads integer values).
     """
+    dtype = int_ if ndigits == 0 else float64
+    if has_dataset_bundle(exp_path):
+        bundle = load_dataset_bundle(exp_path)
+        return (
+            asarray(bundle["candidates"], dtype=dtype),
+            asarray(bundle["pi_statements"], dtype=dtype),
+        )
     with catch_warnings():
         simplefilter("ignore")
-        dtype = int_ if ndigits == 0 else float64
-        cand = loadtxt(f"{exp_path}\\candidates.csv", delimiter=";", dtype=dtype)
-        pi = loadtxt(f"{exp_path}\\pi_statements.csv", delimiter=";", dtype=dtype)
+        cand = loadtxt(
+            FoldLayout(exp_path).file("candidates"), delimiter=";", dtype=dtype
+        )
+        pi = loadtxt(
+            FoldLayout(exp_path).file("pi_statements"), delimiter=";", dtype=dtype
+        )
         if len(pi.shape) == 1:
             pi = pi.reshape((1, pi.shape[0]))
     return cand, pi
@@ -31,7 +45,7 @@ def load_meta_data(path: str):
     Args:
         path (str): Path to the experiment's root folder.
     """
-    with open(f"{path}\\meta.csv", "r", newline="", encoding="utf8") as f:
+    with open(ExperimentLayout(path).meta, "r", newline="", encoding="utf8") as f:
         [
             nb_exp,
             nb_cand,
@@ -58,3 +72,13 @@ def load_meta_data(path: str):
             fixed_sum,
             precision,
         )
+
+
+def load_cached_meta_data(path: str):
+    """Load experiment meta data (see load_meta_data), reading the file only if
+    it was modified since its last loading in the process.
+
+    Args:
+        path (str): Path to the experiment's root folder.
+    """
+    return load_cached(ExperimentLayout(path).meta, load_meta_data, path)
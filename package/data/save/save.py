@@ -1,23 +1,115 @@
 """Functions saving :
     - any ndarray in csv file 
+    - relations streamed by chunks of pairs in csv and binary spill files
+    - the arrays of a fold in a binary bundle
     - problem meta parameters
+    - explanation results keyed by method and pair in a checkpoint file
+    - explanations (steps and symbols) as JSON lines
 """
 from csv import writer as csvwriter
-from numpy import savetxt
+from json import dumps
+from os.path import exists as pathexists
+from numpy import savetxt, savez, int_, uint8, integer, issubdtype
+from numpy import array as nparray
+from numpy import asarray, arange, concatenate, full, ones
+from ..layout import ExperimentLayout, FoldLayout
+
+CHUNK_ROWS = 1 << 16
+EXPLANATIONS_BUFFER = 1 << 20
 
 
 def save_data(path: str, name: str, data):
     """Saves the data in csv file.
+    Non negative integer data (e.g. pairs of indexes) is formatted by batches of rows
+    with a vectorized writer, other data with numpy savetxt.
 
     Args:
         path (str): Path to the file to save folder.
         name (str): Name of the data to save. Will be the file name.
         data (ArrayLike): Data to save.
     """
-    with open(f"{path}\\{name}.csv", "w", newline="", encoding="utf8") as f:
+    array = asarray(data)
+    if issubdtype(array.dtype, integer) and array.size and array.min() >= 0:
+        if array.ndim == 1:
+            array = array.reshape((-1, 1))
+        with open(FoldLayout(path).file(name), "wb") as f:
+            for start in range(0, array.shape[0], CHUNK_ROWS):
+                f.write(format_non_negative_int_rows(array[start : start + CHUNK_ROWS]))
+        return
+    with open(FoldLayout(path).file(name), "w", newline="", encoding="utf8") as f:
         savetxt(f, data, delimiter=";", fmt="%s")
 
 
+def format_non_negative_int_rows(array):
+    """Returns the csv bytes of a 2D array of non negative integers, computing the
+    digits of all values at once instead of formatting them one by one.
+
+    Args:
+        array (NDArray): 2D array of non negative integers.
+    """
+    nb_rows, nb_cols = array.shape
+    width = len(str(int(array.max())))
+    powers = 10 ** arange(width - 1, -1, -1, dtype=array.dtype)
+    digits = (array[..., None] // powers % 10).astype(uint8) + ord("0")
+    # Leading zeros are dropped, except for the units
+    significant = array[..., None] >= powers
+    significant[..., -1] = True
+    separators = full((nb_rows, nb_cols, 1), ord(";"), dtype=uint8)
+    separators[:, -1, 0] = ord("\n")
+    chars = concatenate([digits, separators], axis=2)
+    kept = concatenate([significant, ones((nb_rows, nb_cols, 1), dtype=bool)], axis=2)
+    return chars[kept].tobytes()
+
+
+def save_indexes_pairs_factory(path: str, name: str, spill_file):
+    """Cleans the csv file of a relation and returns a generator object which receives
+    arrays of pairs of candidates indexes and appends them to the csv file and, as raw
+    integers, to the spill file (see load_spilled_indexes_pairs), so that the relation
+    is never held in memory. The files are closed when the generator object is closed.
+
+    Args:
+        path (str): Path to the file to save folder.
+        name (str): Name of the relation. Will be the file name.
+        spill_file (str): Path to the binary file receiving the raw pairs.
+    """
+
+    def save_indexes_pairs():
+        """Generator object which receives arrays of pairs and append them to the files."""
+        with open(FoldLayout(path).file(name), "wb") as f, open(
+            spill_file, "wb"
+        ) as spill:
+            while True:
+                pairs = indexes_pairs_array((yield None))
+                if pairs.shape[0]:
+                    f.write(format_non_negative_int_rows(pairs))
+                    pairs.tofile(spill)
+
+    f = save_indexes_pairs()
+    f.send(None)
+    return f
+
+
+def indexes_pairs_array(pairs):
+    """Returns the list of pairs of candidates indexes as an array with 2 columns.
+
+    Args:
+        pairs (List[Tuple[int, int]]): Pairs of candidates indexes.
+    """
+    return nparray(pairs, dtype=int_).reshape((-1, 2))
+
+
+def save_dataset_bundle(path: str, **arrays):
+    """Saves the arrays of a fold in a single uncompressed npz file,
+    so that they can be memory-mapped when loaded.
+
+    Args:
+        path (str): Path to the fold folder.
+        arrays (ArrayLike): Arrays to save, by name.
+    """
+    with open(FoldLayout(path).bundle, "wb") as f:
+        savez(f, **arrays)
+
+
 def save_data_analysis(path: str, name: str, header, data):
     """Saves the analysis in csv file with header.
 
@@ -27,7 +119,7 @@ def save_data_analysis(path: str, name: str, header, data):
         header (list[str]): Header containing colnames.
         data (ArrayLike): Data to save.
     """
-    with open(f"{path}\\{name}.csv", "w", newline="", encoding="utf8") as f:
+    with open(FoldLayout(path).file(name), "w", newline="", encoding="utf8") as f:
         writer = csvwriter(f, delimiter=";")
         writer.writerow(header)
         savetxt(f, data, delimiter=";", fmt="%s")
@@ -55,7 +147,7 @@ def save_meta_data(
         exp_pi (int): Number of Prefential Information by dataset.
         exp_criteria (int): Number of criteria on which candidates are evaluated.
     """
-    with open(f"{path}\\meta.csv", "w", newline="", encoding="utf8") as meta:
+    with open(ExperimentLayout(path).meta, "w", newline="", encoding="utf8") as meta:
         writer = csvwriter(meta, delimiter=";")
         if precision == 0:
             writer.writerows(
@@ -97,11 +189,14 @@ def save_experiment_data_factory(path: str, file_name: str):
         path (str): Path to the file to save folder.
         file_name (str): Name of the data to save. Will be the file name.
     """
-    open(f"{path}\\{file_name}", "w", newline="", encoding="utf8")
+    with open(FoldLayout(path).results(file_name), "w", newline="", encoding="utf8"):
+        pass
 
     def save_experiment_data():
         """Generator object which receives the experiment data and append it to the file."""
-        with open(f"{path}\\{file_name}", "a", newline="", encoding="utf8") as file:
+        with open(
+            FoldLayout(path).results(file_name), "a", newline="", encoding="utf8"
+        ) as file:
             writer = csvwriter(file, delimiter=";")
             count = 0
             while True:
@@ -115,3 +210,84 @@ def save_experiment_data_factory(path: str, file_name: str):
     f = save_experiment_data()
     f.send(None)
     return f
+
+
+def clean_appended_file(file_name, resume: bool = False):
+    """Cleans a file receiving lines, or when resuming keeps its complete lines
+    (dropping an incomplete last line written by an interrupted run).
+
+    Args:
+        file_name (str): Path to the file.
+        resume (bool, optional): Keeps the complete lines of the file.
+        The default value is False.
+    """
+    if resume and pathexists(file_name):
+        with open(file_name, "r+b") as f:
+            content = f.read()
+            f.truncate(content.rfind(b"\n") + 1)
+    else:
+        with open(file_name, "w", newline="", encoding="utf8"):
+            pass
+
+
+def save_checkpoint_factory(path: str, resume: bool = False):
+    """Returns a generator object which receives the explanation results keyed by
+    method and pair ([method, i, j, length, time, nb_pi]) and appends them to the
+    checkpoint file of the fold. Each result is flushed as soon as it is received.
+
+    Args:
+        path (str): Path to the fold folder.
+        resume (bool, optional): Keeps the results already in the checkpoint file
+        (dropping an incomplete last line). Otherwise the file is cleaned.
+        The default value is False.
+    """
+    file_name = FoldLayout(path).checkpoint
+    clean_appended_file(file_name, resume)
+
+    def save_checkpoint():
+        """Generator object which receives the results and append them to the file."""
+        with open(file_name, "a", newline="", encoding="utf8") as file:
+            writer = csvwriter(file, delimiter=";")
+            while True:
+                data = yield None
+                writer.writerow(data)
+                file.flush()
+
+    f = save_checkpoint()
+    f.send(None)
+    return f
+
+
+def save_explanations_factory(file_name: str, resume: bool = False):
+    """Returns a generator object which receives the explanations
+    ([method, i, j, label, steps, symbols]) and writes them as JSON lines
+    through a single buffered file, kept open until the generator object is closed.
+
+    Args:
+        file_name (str): Path to the explanations file.
+        resume (bool, optional): Keeps the explanations already in the file
+        (dropping an incomplete last line). Otherwise the file is cleaned.
+        The default value is False.
+    """
+    clean_appended_file(file_name, resume)
+
+    def save_explanations():
+        """Generator object which receives the explanations and append them to the file."""
+        with open(
+            file_name, "a", encoding="utf8", buffering=EXPLANATIONS_BUFFER
+        ) as file:
+            while True:
+                method, i, j, label, steps, symbols = yield None
+                record = {
+                    "method": method,
+                    "i": int(i),
+                    "j": int(j),
+                    "label": label,
+                    "steps": [asarray(step).tolist() for step in steps],
+                    "symbols": list(symbols),
+                }
+                file.write(dumps(record) + "\n")
+
+    f = save_explanations()
+    f.send(None)
+    return f
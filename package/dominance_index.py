@@ -0,0 +1,148 @@
+"""Functions building the incremental dominance index, which receives new candidates
+one at a time and returns the new pairs of :
+    - Restricted Lorenz dominances
+    - Generalized Lorenz dominances
+    - robust redistributive OWA dominances (without the Lorenz dominances)
+comparing only the new candidate with the candidates of the index.
+"""
+from numpy import argsort, empty, flatnonzero, float64, int_, stack, zeros
+from numpy import all as npall
+from numpy import asarray, concatenate, full
+from package.generalized_lorenz import lorenz_vector
+from package.robust_owa import build_lpmodel, feasible_owa_weights
+
+INDEX_CAPACITY = 1 << 10
+
+
+def ordered_pairs(new: int, loosers, winners):
+    """Returns the array of pairs (i,new) for the candidates i dominated by the new
+    candidate and (new,i) for the candidates i dominating it, ordered by i with (i,new)
+    before (new,i), as in the batch computation of the relations.
+
+    Args:
+        new (int): Index of the new candidate.
+        loosers (NDArray): Indexes of the candidates dominated by the new candidate.
+        winners (NDArray): Indexes of the candidates dominating the new candidate.
+    """
+    pairs = concatenate(
+        [
+            stack((loosers, full(loosers.shape, new)), axis=1),
+            stack((full(winners.shape, new), winners), axis=1),
+        ]
+    ).astype(int_)
+    return pairs[argsort(concatenate([2 * loosers, 2 * winners + 1]), kind="stable")]
+
+
+def dominance_index_factory(
+    nb_var: int, pi_statements=None, ndigits: int = 0, data=None
+):
+    """Builds the incremental dominance index and returns a generator object which
+    receives a new candidate and returns the arrays of the new pairs (i,j), such that j
+    dominates i, of the Restricted Lorenz, Generalized Lorenz and robust redistributive
+    OWA dominances (the new candidate has the next index).
+    Only the candidates whose first and last Lorenz values are compatible with a
+    dominance are compared with the new candidate, and the linear programs of the
+    robust dominance are only solved for the pairs dominating with feasible weights
+    (see feasible_owa_weights).
+
+    Args:
+        nb_var (int): Number of criteria.
+        pi_statements (NDArray, optional): Preferential information statements of the
+        robust redistributive OWA. Defaults to no robust dominance.
+        ndigits (int, optional): Precision (number of digit after the coma).
+        The default value is 0.
+        data (NDArray, optional): Candidates inserted in the index at its creation,
+        without returning their pairs. Defaults to an empty index.
+    """
+    robust = pi_statements is not None and len(pi_statements) > 0
+    if robust:
+        robust_redistributive_owa_dominance = build_lpmodel(
+            pi_statements, nb_var, ndigits
+        )
+        weights = feasible_owa_weights(pi_statements, nb_var, ndigits)
+        tolerance = 10 ** (-ndigits - 2)
+    no_pairs = zeros((0, 2), dtype=int_)
+
+    def dominance_index():
+        """Generator object which receives candidates and returns their new pairs."""
+        candidates = empty((INDEX_CAPACITY, nb_var), dtype=float64)
+        lorenz = empty((INDEX_CAPACITY, nb_var), dtype=float64)
+        scores = empty(INDEX_CAPACITY, dtype=float64)
+
+        def insert(candidate, k):
+            """Inserts the candidate at index k and returns its new pairs."""
+            nonlocal candidates, lorenz, scores
+            if k == candidates.shape[0]:
+                candidates = concatenate([candidates, empty(candidates.shape)])
+                lorenz = concatenate([lorenz, empty(lorenz.shape)])
+                scores = concatenate([scores, empty(scores.shape)])
+            candidates[k] = candidate
+            lorenz[k] = lorenz_vector(candidate)
+            # The first and last values of the Lorenz vectors prune the candidates
+            # which can not be compared with the new candidate
+            ends = lorenz[:k][:, [0, -1]]
+            below = flatnonzero(npall(ends <= lorenz[k, [0, -1]], axis=1))
+            above = flatnonzero(npall(ends >= lorenz[k, [0, -1]], axis=1))
+            loosers = below[npall(lorenz[below] <= lorenz[k], axis=1)]
+            winners = above[npall(lorenz[above] >= lorenz[k], axis=1)]
+            total = lorenz[k, -1]
+            restricted = ordered_pairs(
+                k,
+                loosers[lorenz[loosers, -1] == total],
+                winners[lorenz[winners, -1] == total],
+            )
+            generalized = ordered_pairs(
+                k,
+                loosers[lorenz[loosers, -1] < total],
+                winners[lorenz[winners, -1] > total],
+            )
+            if not robust:
+                return restricted, generalized, no_pairs
+
+            scores[k] = candidate @ weights
+            lorenz_loosers = zeros(k, dtype=bool)
+            lorenz_loosers[loosers] = True
+            lorenz_winners = zeros(k, dtype=bool)
+            lorenz_winners[winners] = True
+            # Dominating with feasible weights is necessary for the robust dominance
+            loosers = flatnonzero(
+                ~lorenz_loosers & (scores[k] - scores[:k] >= -tolerance)
+            )
+            winners = flatnonzero(
+                ~lorenz_winners & (scores[:k] - scores[k] >= -tolerance)
+            )
+            loosers = loosers[
+                [
+                    robust_redistributive_owa_dominance(candidates[i], candidate)
+                    for i in loosers
+                ]
+            ]
+            winners = winners[
+                [
+                    robust_redistributive_owa_dominance(candidate, candidates[i])
+                    for i in winners
+                ]
+            ]
+            # Pairs (i,k) come before the pairs (k,i) in the batch computation
+            rowa = concatenate(
+                [
+                    stack((loosers, full(loosers.shape, k)), axis=1),
+                    stack((full(winners.shape, k), winners), axis=1),
+                ]
+            ).astype(int_)
+            return restricted, generalized, rowa
+
+        nb_cand = 0
+        if data is not None:
+            for candidate in asarray(data, dtype=float64):
+                insert(candidate, nb_cand)
+                nb_cand += 1
+        new_pairs = None
+        while True:
+            candidate = asarray((yield new_pairs), dtype=float64)
+            new_pairs = insert(candidate, nb_cand)
+            nb_cand += 1
+
+    f = dominance_index()
+    f.send(None)
+    return f
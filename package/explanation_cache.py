@@ -0,0 +1,182 @@
+"""Functions managing the cache of the explanation methods, disabled by default :
+    - enabling the cache (in memory with LRU eviction, optionally on disk),
+    disabling, checking and clearing it
+    - computing the content-addressed key of a call (method and canonical arguments:
+    candidates, bounds, precision, preferential information statements)
+    - decorating the explanation methods so that they consult the cache
+The results are stored pickled, so that the callers can modify the results returned.
+"""
+from collections import Counter, OrderedDict
+from functools import wraps
+from hashlib import blake2b
+from inspect import signature
+from os import getpid, makedirs, replace
+from os.path import exists as pathexists
+from os.path import join
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from typing import Optional
+from numpy import ascontiguousarray, floor, float64, generic, int64, isfinite, ndarray
+from numpy import all as npall
+
+EXPLANATION_CACHE_SIZE = 1 << 14
+
+CACHE_ENABLED = False
+CACHE_MAX_ENTRIES = EXPLANATION_CACHE_SIZE
+CACHE_PATH: Optional[str] = None
+
+CACHE_ENTRIES: OrderedDict = OrderedDict()
+# hits (in memory), disk_hits and misses of the cache
+CACHE_COUNTS: Counter = Counter()
+
+
+def enable_explanation_cache(
+    max_entries: int = EXPLANATION_CACHE_SIZE, path: Optional[str] = None
+):
+    """Enables the cache of the explanation methods.
+
+    Args:
+        max_entries (int, optional): Number of results kept in memory, the least
+        recently used results being evicted. The default value is EXPLANATION_CACHE_SIZE.
+        path (str, optional): Folder of the on-disk cache, shared by the processes and
+        the runs. Defaults to a cache in memory only.
+    """
+    global CACHE_ENABLED, CACHE_MAX_ENTRIES, CACHE_PATH
+    if path is not None and not pathexists(path):
+        makedirs(path)
+    CACHE_ENABLED = True
+    CACHE_MAX_ENTRIES = max_entries
+    CACHE_PATH = path
+
+
+def disable_explanation_cache():
+    """Disables the cache of the explanation methods (the results are kept)."""
+    global CACHE_ENABLED
+    CACHE_ENABLED = False
+
+
+def explanation_cache_enabled() -> bool:
+    """Returns true if the cache of the explanation methods is enabled."""
+    return CACHE_ENABLED
+
+
+def clear_explanation_cache():
+    """Empties the cache in memory and its counts (the on-disk cache is kept)."""
+    CACHE_ENTRIES.clear()
+    CACHE_COUNTS.clear()
+
+
+def canonical_argument(argument) -> bytes:
+    """Returns the bytes identifying an argument of an explanation method: the shape
+    and values of numeric arrays (candidates, statements), as integers when they are
+    all integral whatever the type of the array (e.g. candidates loaded from the
+    bundle or from the csv files), the type, shape and values of the other arrays,
+    and the representation otherwise (numpy scalars as Python numbers, integral floats
+    as integers).
+
+    Args:
+        argument (Any): Argument of the method.
+    """
+    if isinstance(argument, (list, tuple)):
+        return b"(" + b",".join(canonical_argument(a) for a in argument) + b")"
+    if isinstance(argument, ndarray):
+        array = ascontiguousarray(argument)
+        if array.dtype.kind in "biuf":
+            integral = array.dtype.kind != "f" or (
+                npall(isfinite(array)) and npall(array == floor(array))
+            )
+            array = array.astype(int64 if integral else float64)
+        return f"{array.dtype.str}{array.shape}".encode() + array.tobytes()
+    if isinstance(argument, generic):
+        argument = argument.item()
+    if isinstance(argument, float) and argument.is_integer():
+        argument = int(argument)
+    return repr(argument).encode()
+
+
+def explanation_key(name: str, arguments) -> str:
+    """Returns the key of a call of an explanation method.
+
+    Args:
+        name (str): Qualified name of the method.
+        arguments (Dict): Arguments of the call by parameter name, bound to the
+        signature of the method with the default values applied, so that positional
+        and keyword calls give the same key.
+    """
+    digest = blake2b(name.encode(), digest_size=20)
+    for parameter, argument in arguments.items():
+        digest.update(f";{parameter}=".encode() + canonical_argument(argument))
+    return digest.hexdigest()
+
+
+def cached_result(key: str) -> Optional[bytes]:
+    """Returns the pickled result of the key, from memory or from disk, None if the
+    result is not in the cache.
+
+    Args:
+        key (str): Key of the call (see explanation_key).
+    """
+    if key in CACHE_ENTRIES:
+        CACHE_ENTRIES.move_to_end(key)
+        CACHE_COUNTS["hits"] += 1
+        return CACHE_ENTRIES[key]
+    if CACHE_PATH is not None and pathexists(join(CACHE_PATH, f"{key}.pkl")):
+        with open(join(CACHE_PATH, f"{key}.pkl"), "rb") as f:
+            result = f.read()
+        CACHE_COUNTS["disk_hits"] += 1
+        store_result(key, result, on_disk=False)
+        return result
+    CACHE_COUNTS["misses"] += 1
+    return None
+
+
+def store_result(key: str, result: bytes, on_disk: bool = True):
+    """Stores the pickled result of the key in memory, evicting the least recently used
+    results, and on disk when the on-disk cache is enabled.
+
+    Args:
+        key (str): Key of the call (see explanation_key).
+        result (bytes): Pickled result.
+        on_disk (bool, optional): Also writes the result on disk. The default value
+        is True.
+    """
+    CACHE_ENTRIES[key] = result
+    CACHE_ENTRIES.move_to_end(key)
+    while len(CACHE_ENTRIES) > CACHE_MAX_ENTRIES:
+        CACHE_ENTRIES.popitem(last=False)
+    if on_disk and CACHE_PATH is not None:
+        # Written then renamed, so that concurrent processes never read partial files
+        temporary = join(CACHE_PATH, f"{key}.{getpid()}.tmp")
+        with open(temporary, "wb") as f:
+            f.write(result)
+        replace(temporary, join(CACHE_PATH, f"{key}.pkl"))
+
+
+def cached_explanation(item):
+    """Decorates an explanation method so that it consults the cache when enabled.
+    The absence of explanation (StopIteration) is cached, calls raising other
+    exceptions (e.g. timeouts) are not."""
+    name = f"{item.__module__}.{item.__qualname__}"
+    parameters = signature(item)
+
+    @wraps(item)
+    def func_wrapper(*args, **kwargs):
+        """Closure for function."""
+        if not CACHE_ENABLED:
+            return item(*args, **kwargs)
+        arguments = parameters.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        key = explanation_key(name, arguments.arguments)
+        result = cached_result(key)
+        if result is None:
+            try:
+                value = item(*args, **kwargs)
+            except StopIteration as no_explanation:
+                value = no_explanation
+            result = dumps(value, protocol=HIGHEST_PROTOCOL)
+            store_result(key, result)
+        value = loads(result)
+        if isinstance(value, StopIteration):
+            raise value
+        return value
+
+    return func_wrapper
@@ -2,11 +2,12 @@
 our contribution algorithm first and a unique gift afterwards"""
 from package.restricted_lorenz import contribution_heuristics
 from package.plot import GIFT
-from package import timeout_decorator
+from package import cached_explanation, timeout_decorator
 
-FILE_NAME = "Generalized\\after_contrib.csv"
+FILE_NAME = "Generalized/after_contrib.csv"
 
 
+@cached_explanation
 @timeout_decorator
 def gift_after_contribution_heuristics(looser, winner, ndigits: int = 0):
     """Builds the explanation for generalized Lorenz dominance between two
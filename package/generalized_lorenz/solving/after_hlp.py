@@ -2,11 +2,12 @@
 the [Hardy, Littlewood,Poly;1934] algorithm first and a unique gift afterwards"""
 from package.plot import GIFT
 from package.restricted_lorenz import hardy_littlewood_polya
-from package import timeout_decorator
+from package import cached_explanation, timeout_decorator
 
-FILE_NAME = "Generalized\\after_hlp.csv"
+FILE_NAME = "Generalized/after_hlp.csv"
 
 
+@cached_explanation
 @timeout_decorator
 def gift_after_hardy_littlewood_polya(looser, winner, ndigits: int = 0):
     """Builds the explanation for generalized Lorenz dominance between two
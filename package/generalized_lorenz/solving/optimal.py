@@ -18,11 +18,18 @@ from package.restricted_lorenz.solving import (
     add_ordered_candidate_constraint_factory,
     add_redistributive_constraints_factory,
 )
-from package import timeout_decorator
+from package import (
+    cached_explanation,
+    timeout_decorator,
+    phase_lap_factory,
+    log_solve,
+    apply_solver_profile,
+)
 
-FILE_NAME = "Generalized\\optim.csv"
+FILE_NAME = "Generalized/optim.csv"
 
 
+@cached_explanation
 @timeout_decorator
 def generalized_optimum(looser, winner, low, high, ndigits):
     """Builds the shortest explanation for restricted Lorenz dominance between
@@ -37,6 +44,7 @@ def generalized_optimum(looser, winner, low, high, ndigits):
         len(positive_negative_modification_indexes(looser, winner, ndigits)[0]) + 1
     )
     k = minimum_k
+    phase_lap = phase_lap_factory()
     model_generator = build_generalized_base_model(
         looser, winner, minimum_k, low, high, ndigits
     )
@@ -45,8 +53,11 @@ def generalized_optimum(looser, winner, low, high, ndigits):
 
     while not found:
         m.update()
+        phase_lap("build")
         m.optimize()
-        m.display()
+        phase_lap("solve")
+        log_solve(m, "generalized_optimum", k)
+        phase_lap("io")
         if m.Status == GRB.TIME_LIMIT:
             raise TimedOut
         if m.status == GRB.OPTIMAL:
@@ -77,6 +88,7 @@ def generalized_optimum(looser, winner, low, high, ndigits):
                     if m.getVarByName(f"g{step}").X != 0.0
                     else REDISTRIBUTIVE_TRANSFER
                 )
+            phase_lap("extract")
             found = True
         else:
             m = next(model_generator)
@@ -114,6 +126,7 @@ def build_generalized_base_model(
         m.Params.FeasibilityTol = 10 ** (-ndigits - 2)
 
     nb_var: int = winner.shape[0]
+    apply_solver_profile(m, "generalized_optimum", nb_var, ndigits)
     nb_redistributive_transfers: int = (nb_var * nb_var - nb_var) // 2
     big_m_1: int = ceil(npsum(winner) + npsum(looser))
 
@@ -1,2 +1,3 @@
 from .types import *
+from .streaming_statistics import *
 from .expermiment_comparisons import *
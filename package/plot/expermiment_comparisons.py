@@ -1,45 +1,23 @@
-from os import makedirs
-from os.path import exists as pathexists
 from collections import Counter
-from itertools import tee, chain
-from typing import List, Any, Dict
-from statistics import quantiles, fmean, StatisticsError
+from itertools import chain
+from math import fsum, isnan
+from pathlib import PurePosixPath
+from typing import List, Any, Tuple
+from numpy import argsort as npargsort
+from numpy import concatenate as npconcatenate
+from numpy import cumsum as npcumsum
+from numpy import sort as npsort
+from numpy import split as npsplit
+from numpy import unique as npunique
+from numpy import where as npwhere
+from package.data.layout import ExperimentLayout
 from package.data.save import save_data_analysis, save_data
 from package.data.load import (
-    load_meta_data,
-    load_experiment_results,
+    load_cached_meta_data,
+    load_cached_experiment_results,
 )
-
-
-def lambda_factory(i: int):
-    """Auxilary function returning the filter to apply to data according
-    to the future row index of the file.
-
-    Args:
-        i (int): Value of the index
-    """
-    if i < 4:
-        return lambda x: x[0] != 0
-    if i < 8:
-        return lambda x: x[0] == -2
-    if i < 12:
-        return lambda x: x[0] == -1
-    return lambda x: x[0] > 0
-
-
-def function_selector(i):
-    """Auxilary function returning the method to be applyed according to index value.
-
-    Args:
-        i (int): Value of the index
-    """
-    if i % 4 == 0:
-        return fmean
-    if i % 4 == 1:
-        return min
-    if i % 4 == 2:
-        return quantiles
-    return max
+from package.timing import PHASES
+from .streaming_statistics import StreamingStatistics, quartile_positions
 
 
 def experiment_comparison(exp_path: str, file_name: str, include_timeout: bool = False):
@@ -49,291 +27,275 @@ def experiment_comparison(exp_path: str, file_name: str, include_timeout: bool =
         when the method failed, when it worked overall and detailed by number of PI used)
         - distribution of explanation lengths (overall, when Farkas failed,
         when the method failed, when it worked overall and detailed by number of PI used)
+        - distribution of the duration of each phase of the computation
+        (setup, build, solve, extract, io)
 
     Args:
         exp_path (str): Path to the experiment's csv folder.
         file_name (str): Explanation function file path and name.
     """
     nb_exp, nb_pi = [
-        int(k) for i, k in enumerate(load_meta_data(exp_path)) if i in [0, 2]
+        int(k) for i, k in enumerate(load_cached_meta_data(exp_path)) if i in [0, 2]
     ]
 
-    readers = tee(
-        chain.from_iterable(
-            load_experiment_results(f"{exp_path}\\{fold}", file_name)
-            for fold in range(nb_exp)
-        ),
-        21 + 9 * nb_pi,
-    )
-
-    counts: List[Counter] = [Counter() for _ in range(nb_pi + 1)]
-    time_computations: List[Any] = list(0 for _ in range(16 + nb_pi * 4))
-    length_computations: List[Any] = list(0 for _ in range(4 + nb_pi * 4))
-
-    counts[0].update((x for (x, _, _) in readers[0]))
-    for i in range(1, nb_pi + 1):
-        counts[i].update((x for (x, _, z) in readers[i] if z == i))
-
-    it = 1 + nb_pi
-    for i in range(16):
-        try:
-            time_computations[i] = function_selector(i)(
-                (y for (x, y, _) in readers[it + i] if include_timeout or x > -3)
-            )
-        except StatisticsError:
-            time_computations[i] = "NaN"
-        except ValueError:
-            time_computations[i] = "NaN"
-
-    it += 16
-    for i in range(nb_pi):
-        for j in range(4):
-            try:
-                time_computations[16 + i * 4 + j] = function_selector(j)(
-                    (y for (_, y, z) in readers[it + i * 4 + j] if z == i + 1)
-                )
-            except StatisticsError:
-                time_computations[16 + i * 4 + j] = "NaN"
-            except ValueError:
-                time_computations[16 + i * 4 + j] = "NaN"
-
-    # Length computations
-    it += 4 * nb_pi
-    for i in range(4):
-        try:
-            length_computations[i] = function_selector(i)(
-                (x for (x, _, _) in readers[it + i] if x > 0)
-            )
-        except StatisticsError:
-            length_computations[i] = "NaN"
-        except ValueError:
-            length_computations[i] = "NaN"
-
-    it += 4
-    for i in range(nb_pi):
-        for j in range(4):
-            try:
-                length_computations[4 + i * 4 + j] = function_selector(j)(
-                    (x for (x, _, z) in readers[it + i * 4 + j] if z == i + 1)
-                )
-            except StatisticsError:
-                length_computations[4 + i * 4 + j] = "NaN"
-            except ValueError:
-                length_computations[4 + i * 4 + j] = "NaN"
+    counts: Counter = Counter()
+    counts_by_pi: List[int] = [0] * nb_pi
+    time_all = StreamingStatistics()
+    time_by_pi = [StreamingStatistics() for _ in range(nb_pi)]
+    length_found = StreamingStatistics()
+    length_by_pi = [StreamingStatistics() for _ in range(nb_pi)]
+
+    phases_all = [StreamingStatistics() for _ in PHASES]
+    # The arrays of the folds are cached, and shared with the pairwise comparisons
+    for x, y, z, phases in chain.from_iterable(
+        zip(lengths.tolist(), times.tolist(), nb_pis.tolist(), durations.tolist())
+        for lengths, times, nb_pis, durations in load_fold_results(
+            exp_path, nb_exp, file_name
+        )
+    ):
+        counts[x] += 1
+        if include_timeout or x > -3:
+            time_all.update(y)
+            for k, duration in enumerate(phases):
+                if not isnan(duration):
+                    phases_all[k].update(duration)
+        if x > 0:
+            length_found.update(x)
+        if 0 < z <= nb_pi:
+            counts_by_pi[z - 1] += 1
+            time_by_pi[z - 1].update(y)
+            length_by_pi[z - 1].update(x)
 
     # Path creation
-    folder = file_name.split("\\")[0]
-    name = file_name.split("\\")[-1][:-4]
-    file_path = f"{exp_path}\\Analysis\\Individual\\{folder}\\{name}"
-    if not pathexists(file_path):
-        makedirs(file_path)
+    file_path = ExperimentLayout(exp_path).analysis("Individual", file_name)
+    file_path.mkdir(parents=True, exist_ok=True)
 
     # Save time distribution
     header = ["Name", "#Found", "Mean", "Min", "Q1", "Median", "Q3", "Max"]
-    time_data = []
+    nb_found = sum(counts.values()) - counts[-3] - counts[-2] - counts[-1]
     row_starters_time = [
         [
             "All",
-            sum(counts[0].values()) - counts[0][-3]
+            sum(counts.values()) - counts[-3]
             if not include_timeout
-            else sum(counts[0].values()),
-        ],
-        ["No Farkas", counts[0][-2]],
-        ["No explanation", counts[0][-1]],
-        [
-            "Found",
-            sum(counts[0].values()) - counts[0][-3] - counts[0][-2] - counts[0][-1],
+            else sum(counts.values()),
         ],
+        ["No Farkas", counts[-2]],
+        ["No explanation", counts[-1]],
+        ["Found", nb_found],
     ]
-    pi_starters = [[f"{i} PI", sum(counts[i].values())] for i in range(1, nb_pi + 1)]
-
-    deserealize_time = min_quartiles_max_deserialize_factory(time_computations)
+    pi_starters = [[f"{i + 1} PI", counts_by_pi[i]] for i in range(nb_pi)]
 
-    for i in range(4):
-        time_data.append(row_starters_time[i] + [*deserealize_time(4 * i)])
+    # The time dispersion is computed over all the explanations for the first rows
+    time_data = [[*row, *time_all.dispersion()] for row in row_starters_time]
     for i in range(nb_pi):
-        time_data.append([*pi_starters[i], *deserealize_time(16 + 4 * i)])
+        time_data.append([*pi_starters[i], *time_by_pi[i].dispersion()])
 
     save_data_analysis(file_path, "time_distribution", header, time_data)
 
     # Save length counts
-    save_data(file_path, "length_data", list(sorted(counts[0].items())))
+    save_data(file_path, "length_data", list(sorted(counts.items())))
 
     # Save length distributions
-    deserealize_len = min_quartiles_max_deserialize_factory(length_computations)
-    len_data = [
-        [
-            "Found",
-            sum(counts[0].values()) - counts[0][-3] - counts[0][-2] - counts[0][-1],
-            *deserealize_len(0),
-        ]
-    ]
+    len_data = [["Found", nb_found, *length_found.dispersion()]]
     for i in range(nb_pi):
-        len_data.append([*pi_starters[i], *deserealize_len(4 + 4 * i)])
+        len_data.append([*pi_starters[i], *length_by_pi[i].dispersion()])
     save_data_analysis(file_path, "length_distribution", header, len_data)
 
+    # Save phase durations distribution (over the same explanations as the time)
+    phase_data = [
+        [phase, phases_all[k].count, *phases_all[k].dispersion()]
+        for k, phase in enumerate(PHASES)
+    ]
+    phase_header = ["Phase", "#Tasks", *header[2:]]
+    save_data_analysis(file_path, "phase_distribution", phase_header, phase_data)
 
-def min_quartiles_max_deserialize_factory(computations):
-    """Builds the min_quartiles_max_deserialize function
+
+def array_dispersion(values):
+    """Return in the following order :
+        - the mean
+        - the minimum
+        - q1
+        - the median
+        - q3
+        - the maximum
+    of the values (same results as statistics.fmean, min, statistics.quantiles and max)
+    with "NaN" when there is not enough values to compute them.
 
     Args:
-        computations (List): List containing the computations of data dispersion
+        values (NDArray): Values whose dispersion is computed.
     """
+    if len(values) == 0:
+        return "NaN", "NaN", "NaN", "NaN", "NaN", "NaN"
+    data = npsort(values).tolist()
+    if len(data) < 2:
+        quartiles = ["NaN", "NaN", "NaN"]
+    else:
+        quartiles = [
+            (data[j - 1] * (4 - delta) + data[j] * delta) / 4
+            for j, delta in quartile_positions(len(data))
+        ]
+    return fsum(data) / len(data), data[0], *quartiles, data[-1]
 
-    def min_quartiles_max_deserialize(index: int):
-        """Return in the following order :
-            - the mean
-            - the minimum
-            - q1
-            - the median
-            - q3
-            - the maximum
-        starting from the given index.
-
-        Args:
-            index (int): Value of starting index.
-        """
-        quartiles = computations[index + 2]
-        return (
-            computations[index],
-            computations[index + 1],
-            quartiles[0] if quartiles != "NaN" else "NaN",
-            quartiles[1] if quartiles != "NaN" else "NaN",
-            quartiles[2] if quartiles != "NaN" else "NaN",
-            computations[index + 3],
-        )
 
-    return min_quartiles_max_deserialize
+def value_counts(values):
+    """Returns the Counter of the values of the array.
+
+    Args:
+        values (NDArray): Values to count.
+    """
+    observed, counts = npunique(values, return_counts=True)
+    return Counter(dict(zip(observed.tolist(), counts.tolist())))
+
+
+def group_by_length(lengths, *values):
+    """Returns the sorted observed lengths and, for each array of values,
+    the list of its sub-arrays grouped by observed length.
+
+    Args:
+        lengths (NDArray): Lengths used as key of the groups.
+        values (NDArray): Arrays aligned with the lengths to split in groups.
+    """
+    observed, counts = npunique(lengths, return_counts=True)
+    order = npargsort(lengths, kind="stable")
+    bounds = npcumsum(counts)[:-1]
+    return observed.tolist(), [npsplit(v[order], bounds) for v in values]
+
 
+def load_fold_results(exp_path: str, nb_exp: int, file_name: str):
+    """Loads the results of an explanation function for each fold of the experiment
+    (read once in the process while the files are unchanged).
 
-class ExplLength:
-    """Contains the Counter of the difference between the lengths of method 1
-    and method 2, grouped by lengths of method 1."""
+    Args:
+        exp_path (str): Path to the experiment's csv folder.
+        nb_exp (int): Number of folds of the experiment.
+        file_name (str): Explanation function file path and name.
+    """
+    return [
+        load_cached_experiment_results(
+            ExperimentLayout(exp_path).fold(fold).path, file_name
+        )
+        for fold in range(nb_exp)
+    ]
 
-    def __init__(self) -> None:
-        self.d: Dict[int, Counter] = {}
 
-    def update_length(self, length: int, value: int):
-        if length not in self.d:
-            self.d[length] = Counter((value,))
-        else:
-            self.d[length].update((value,))
+def align_fold_results(results_1, results_2):
+    """Returns the lengths and times of method 1 and the lengths and times of method 2
+    over all folds, each fold being truncated to the pairs computed by both methods.
 
-    def sort_by_length(self):
-        self.d = dict(sorted(self.d.items()))
+    Args:
+        results_1 (List[Tuple[NDArray]]): Results of method 1 by fold.
+        results_2 (List[Tuple[NDArray]]): Results of method 2 by fold.
+    """
+    aligned: List[List[Any]] = [[], [], [], []]
+    for (x1, y1, *_), (x2, y2, *_) in zip(results_1, results_2):
+        size = min(len(x1), len(x2))
+        for i, v in enumerate((x1, y1, x2, y2)):
+            aligned[i].append(v[:size])
+    return tuple(npconcatenate(v) for v in aligned)
 
-    def get_keys(self):
-        return self.d.keys()
 
-    def get_lengths(self):
-        return self.d
+def pairwise_selection(x1, y1, x2, y2):
+    """Keeps the pairs explained by both methods.
+    Returns the relative difference of time (in %), the lengths of method 1
+    and the lengths of method 2.
 
+    Args:
+        x1 (NDArray): Lengths of method 1.
+        y1 (NDArray): Compute times of method 1.
+        x2 (NDArray): Lengths of method 2.
+        y2 (NDArray): Compute times of method 2.
+    """
+    kept = (x1 > 0) & (x2 > 0)
+    return (y1[kept] - y2[kept]) / y1[kept] * 100, x1[kept], x2[kept]
 
-def pairwise_generator(exp_path, nb_exp, file_1_name, file_2_name):
-    for fold in range(nb_exp):
-        for (x1, y1, _), (x2, y2, _) in zip(
-            load_experiment_results(f"{exp_path}\\{fold}", file_1_name),
-            load_experiment_results(f"{exp_path}\\{fold}", file_2_name),
-        ):
-            if x1 > 0 and x2 > 0:
-                yield (y1 - y2) / y1 * 100, x1, y1, x2, y2
 
+def pairwise_selection_timedout(x1, y1, x2, y2):
+    """Keeps the pairs explained by both methods or explained by one method while
+    the other one timed out, in which case the found length is used for both methods.
+    Returns the relative difference of time (in %), the lengths of method 1
+    and the lengths of method 2.
 
-def pairwise_generator_timedout(exp_path, nb_exp, file_1_name, file_2_name):
-    for fold in range(nb_exp):
-        for (x1, y1, _), (x2, y2, _) in zip(
-            load_experiment_results(f"{exp_path}\\{fold}", file_1_name),
-            load_experiment_results(f"{exp_path}\\{fold}", file_2_name),
-        ):
-            if x1 == -3 and x2 > 0:
-                yield (y1 - y2) / y1 * 100, x2, y1, x2, y2
-            elif x2 == -3 and x1 > 0:
-                yield (y1 - y2) / y1 * 100, x1, y1, x1, y2
-            elif x1 > 0 and x2 > 0:
-                yield (y1 - y2) / y1 * 100, x1, y1, x2, y2
+    Args:
+        x1 (NDArray): Lengths of method 1.
+        y1 (NDArray): Compute times of method 1.
+        x2 (NDArray): Lengths of method 2.
+        y2 (NDArray): Compute times of method 2.
+    """
+    x1, x2 = npwhere(x1 == -3, x2, x1), npwhere(x2 == -3, x1, x2)
+    return pairwise_selection(x1, y1, x2, y2)
 
 
 def experiment_pairwise_comparison(
-    exp_path: str, file_1_name: str, file_2_name: str, generator=pairwise_generator
+    exp_path: str, file_1_name: str, file_2_name: str, selection=pairwise_selection
 ):
-    nb_exp = int(load_meta_data(exp_path)[0])
-
-    reader = generator(exp_path, nb_exp, file_1_name, file_2_name)
+    """Builds the files comparing two explanation functions (see
+    experiment_pairwise_comparisons).
 
-    expls: Counter = Counter()
-    expls_by_len: ExplLength = ExplLength()
+    Args:
+        exp_path (str): Path to the experiment's csv folder.
+        file_1_name (str): Explanation function 1 file path and name.
+        file_2_name (str): Explanation function 2 file path and name.
+        selection (Callable, optional): Selection of the compared pairs.
+        The default value is pairwise_selection.
+    """
+    experiment_pairwise_comparisons(exp_path, [(file_1_name, file_2_name)], selection)
 
-    for _, x1, y1, x2, _ in reader:
-        expls.update((x1 - x2,))
-        expls_by_len.update_length(x1, x1 - x2)
-        # if x1 > x2:
-        #     print(f"Alerte : {(x1, y1)} in method 1")
 
-    expls_by_len.sort_by_length()
+def experiment_pairwise_comparisons(
+    exp_path: str, method_pairs: List[Tuple[str, str]], selection=pairwise_selection
+):
+    """Builds for each pair of explanation functions the files about:
+        - raw length differences effectives (overall and by length of method 1)
+        - distribution of the relative computation time differences
+        - distribution of the length differences
+    The results of each explanation function are read once for all the pairs.
 
-    observed_1_lengths = expls_by_len.get_keys()
+    Args:
+        exp_path (str): Path to the experiment's csv folder.
+        method_pairs (List[Tuple[str, str]]): Pairs of explanation function file
+        path and name to compare.
+        selection (Callable, optional): Selection of the compared pairs.
+        The default value is pairwise_selection.
+    """
+    nb_exp = int(load_cached_meta_data(exp_path)[0])
+    for file_1_name, file_2_name in method_pairs:
+        results_1 = load_fold_results(exp_path, nb_exp, file_1_name)
+        results_2 = load_fold_results(exp_path, nb_exp, file_2_name)
+        save_pairwise_comparison(
+            exp_path,
+            file_1_name,
+            file_2_name,
+            *selection(*align_fold_results(results_1, results_2)),
+        )
 
-    readers = tee(
-        generator(exp_path, nb_exp, file_1_name, file_2_name),
-        8 + 8 * len(observed_1_lengths),
-    )
-    nb_readers_time = 4 + 4 * len(observed_1_lengths)
-    time_computations: List[Any] = list(
-        0 for _ in range(4 + len(observed_1_lengths) * 4)
-    )
-    len_computations: List[Any] = list(
-        0 for _ in range(4 + len(observed_1_lengths) * 4)
-    )
 
-    for i in range(4):
-        try:
-            time_computations[i] = function_selector(i)(
-                (t for t, _, _, _, _ in readers[i])
-            )
-        except StatisticsError:
-            time_computations[i] = "NaN"
-        except ValueError:
-            time_computations[i] = "NaN"
-        try:
-            len_computations[i] = function_selector(i)(
-                (x1 - x2 for _, x1, _, x2, _ in readers[nb_readers_time + i])
-            )
-        except StatisticsError:
-            len_computations[i] = "NaN"
-        except ValueError:
-            len_computations[i] = "NaN"
+def save_pairwise_comparison(
+    exp_path: str, file_1_name: str, file_2_name: str, times, lengths_1, lengths_2
+):
+    """Saves the comparison files of two explanation functions.
 
-    for i, length in enumerate(observed_1_lengths):
-        for j in range(4):
-            try:
-                time_computations[4 + i * 4 + j] = function_selector(j)(
-                    (t for t, x1, _, _, _ in readers[4 + i * 4 + j] if x1 == length)
-                )
-            except StatisticsError:
-                time_computations[4 + i * 4 + j] = "NaN"
-            except ValueError:
-                time_computations[4 + i * 4 + j] = "NaN"
-            try:
-                len_computations[4 + i * 4 + j] = function_selector(j)(
-                    (
-                        x1 - x2
-                        for _, x1, _, x2, _ in readers[nb_readers_time + 4 + i * 4 + j]
-                        if x1 == length
-                    )
-                )
-            except StatisticsError:
-                len_computations[4 + i * 4 + j] = "NaN"
-            except ValueError:
-                len_computations[4 + i * 4 + j] = "NaN"
+    Args:
+        exp_path (str): Path to the experiment's csv folder.
+        file_1_name (str): Explanation function 1 file path and name.
+        file_2_name (str): Explanation function 2 file path and name.
+        times (NDArray): Relative differences of time (in %) of compared pairs.
+        lengths_1 (NDArray): Lengths of method 1 of compared pairs.
+        lengths_2 (NDArray): Lengths of method 2 of compared pairs.
+    """
+    differences = lengths_1 - lengths_2
+    expls = value_counts(differences)
+    observed_1_lengths, (times_by_len, differences_by_len) = group_by_length(
+        lengths_1, times, differences
+    )
+    lengths_counter = [value_counts(d) for d in differences_by_len]
 
     # Path creation
-    folder = file_1_name.split("\\")[0]
     file_name = (
-        file_1_name.split("\\")[-1][:-4] + "_vs_" + file_2_name.split("\\")[-1][:-4]
+        f"{PurePosixPath(file_1_name).stem}_vs_{PurePosixPath(file_2_name).stem}"
     )
-    file_path = f"{exp_path}\\Analysis\\Pairwise\\{folder}\\{file_name}"
-    if not pathexists(file_path):
-        makedirs(file_path)
+    file_path = ExperimentLayout(exp_path).analysis("Pairwise", file_1_name, file_name)
+    file_path.mkdir(parents=True, exist_ok=True)
 
     # Save time distribution
     len_header = [
@@ -350,45 +312,38 @@ def experiment_pairwise_comparison(
         "Max",
     ]
 
-    deserealize_len = min_quartiles_max_deserialize_factory(len_computations)
-    lengths_counter = expls_by_len.get_lengths()
-
     len_data = [
         [
             "All",
             *percentage_equal_better_worse_deserialize(expls),
-            *deserealize_len(0),
+            *array_dispersion(differences),
         ]
     ]
-    for i, length in enumerate(observed_1_lengths):
+    for i in range(len(observed_1_lengths)):
         len_data.append(
             [
                 i,
-                *percentage_equal_better_worse_deserialize(lengths_counter[length]),
-                *deserealize_len(4 + 4 * i),
+                *percentage_equal_better_worse_deserialize(lengths_counter[i]),
+                *array_dispersion(differences_by_len[i]),
             ]
         )
     save_data_analysis(file_path, "length_distribution", len_header, len_data)
 
     time_header = ["Name", "#Found", "Mean", "Min", "Q1", "Median", "Q3", "Max"]
-    deserealize_time = min_quartiles_max_deserialize_factory(time_computations)
-    time_data = [["All", sum(expls.values()), *deserealize_time(0)]]
+    time_data = [["All", len(times), *array_dispersion(times)]]
 
-    for i, length in enumerate(observed_1_lengths):
-        time_data.append(
-            [i, sum(lengths_counter[length].values()), *deserealize_time(4 + 4 * i)]
-        )
+    for i in range(len(observed_1_lengths)):
+        time_data.append([i, len(times_by_len[i]), *array_dispersion(times_by_len[i])])
 
     save_data_analysis(file_path, "time_distribution", time_header, time_data)
 
     save_data(file_path, "length_data", list(sorted(expls.items())))
 
-    if not pathexists(f"{file_path}\\length_data"):
-        makedirs(f"{file_path}\\length_data")
-    for i in observed_1_lengths:
+    (file_path / "length_data").mkdir(exist_ok=True)
+    for i, length in enumerate(observed_1_lengths):
         save_data(
-            f"{file_path}\\length_data",
-            str(i),
+            file_path / "length_data",
+            str(length),
             list(sorted(lengths_counter[i].items())),
         )
 
@@ -0,0 +1,151 @@
+"""Class aggregating in a single pass over a stream of values :
+    - the number of values, the mean, the minimum and the maximum (exact)
+    - the quartiles (exact while the number of distinct values stays under a bound,
+    approximated by compacting the histogram of values afterwards)
+"""
+from collections import Counter
+from math import fsum
+from statistics import StatisticsError
+from typing import List
+
+MAX_DISTINCT_VALUES = 1 << 16
+
+
+def quartile_positions(nb_values: int):
+    """Returns for each quartile the index j and the weight delta such that the
+    quartile is (data[j - 1] * (4 - delta) + data[j] * delta) / 4 in the sorted data,
+    as in statistics.quantiles with the default exclusive method.
+
+    Args:
+        nb_values (int): Number of values (at least 2).
+    """
+    m = nb_values + 1
+    positions = []
+    for i in range(1, 4):
+        j = i * m // 4
+        j = 1 if j < 1 else nb_values - 1 if j > nb_values - 1 else j
+        positions.append((j, i * m - j * 4))
+    return positions
+
+
+class StreamingStatistics:
+    """Single pass accumulator of the dispersion of a stream of values.
+    Memory is bounded by the number of distinct values kept in the histogram."""
+
+    def __init__(self, max_distinct_values: int = MAX_DISTINCT_VALUES) -> None:
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+        self.exact = True
+        self.max_distinct_values = max_distinct_values
+        self.partials: List[float] = []
+        self.histogram: Counter = Counter()
+
+    def update(self, value):
+        """Adds a value to the aggregation.
+
+        Args:
+            value (int | float): Observed value.
+        """
+        self.count += 1
+        if self.count == 1:
+            self.minimum = value
+            self.maximum = value
+        elif value < self.minimum:
+            self.minimum = value
+        elif value > self.maximum:
+            self.maximum = value
+        self.add_partial(value)
+        self.histogram[value] += 1
+        if len(self.histogram) > self.max_distinct_values:
+            self.compact()
+
+    def add_partial(self, value):
+        """Adds the value to the exact partial sums (Shewchuk algorithm) so that
+        the mean is the correctly rounded one returned by statistics.fmean.
+
+        Args:
+            value (int | float): Observed value.
+        """
+        x = float(value)
+        i = 0
+        for y in self.partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)
+            if lo:
+                self.partials[i] = lo
+                i += 1
+            x = hi
+        self.partials[i:] = [x]
+
+    def compact(self):
+        """Halves the histogram by merging consecutive values, keeping the most
+        frequent of the two (alternatively the lower and the upper one on ties
+        to avoid biasing the ranks). The quartiles become approximated."""
+        items = sorted(self.histogram.items())
+        self.histogram = Counter()
+        for k in range(0, len(items) - 1, 2):
+            (v1, c1), (v2, c2) = items[k], items[k + 1]
+            keep_lower = c1 > c2 or (c1 == c2 and k % 4 == 0)
+            self.histogram[v1 if keep_lower else v2] += c1 + c2
+        if len(items) % 2:
+            self.histogram[items[-1][0]] += items[-1][1]
+        self.exact = False
+
+    def order_statistics(self, indexes: List[int]):
+        """Returns the values at the given (sorted) indexes of the sorted stream.
+
+        Args:
+            indexes (List[int]): Increasing indexes in the sorted stream.
+        """
+        values = []
+        it = iter(indexes)
+        index = next(it, None)
+        cumulated = 0
+        for value, count in sorted(self.histogram.items()):
+            cumulated += count
+            while index is not None and index < cumulated:
+                values.append(value)
+                index = next(it, None)
+            if index is None:
+                break
+        return values
+
+    def mean(self):
+        """Returns the mean of the values, as statistics.fmean does."""
+        if self.count == 0:
+            raise StatisticsError("fmean requires at least one data point")
+        return fsum(self.partials) / self.count
+
+    def quartiles(self):
+        """Returns the quartiles of the values, as statistics.quantiles does
+        with the default exclusive method."""
+        if self.count < 2:
+            raise StatisticsError("must have at least two data points")
+        positions = quartile_positions(self.count)
+        indexes = sorted({k for j, _ in positions for k in (j - 1, j)})
+        data = dict(zip(indexes, self.order_statistics(indexes)))
+        return [
+            (data[j - 1] * (4 - delta) + data[j] * delta) / 4 for j, delta in positions
+        ]
+
+    def dispersion(self):
+        """Return in the following order :
+            - the mean
+            - the minimum
+            - q1
+            - the median
+            - q3
+            - the maximum
+        with "NaN" when there is not enough values to compute them.
+        """
+        mean = self.mean() if self.count > 0 else "NaN"
+        try:
+            q1, q2, q3 = self.quartiles()
+        except StatisticsError:
+            q1, q2, q3 = "NaN", "NaN", "NaN"
+        if self.count == 0:
+            return mean, "NaN", q1, q2, q3, "NaN"
+        return mean, self.minimum, q1, q2, q3, self.maximum
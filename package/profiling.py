@@ -0,0 +1,77 @@
+"""Functions profiling the steps of the explanation algorithms, disabled by default :
+    - enabling, disabling and resetting the profile
+    - counting events and accumulating the duration of sections of the algorithms
+    (only a flag check when the profile is disabled)
+    - summarizing the profile (count, total and mean duration of each section)
+"""
+from collections import Counter, defaultdict
+from time import perf_counter
+from typing import Dict, List, Optional
+
+PROFILE_HEADER = ["Name", "Count", "Total", "Mean"]
+
+PROFILE_ENABLED = False
+
+PROFILE_COUNTS: Counter = Counter()
+PROFILE_TIMES: Dict[str, float] = defaultdict(float)
+
+
+def enable_profiling():
+    """Enables the profile of the explanation algorithms."""
+    global PROFILE_ENABLED
+    PROFILE_ENABLED = True
+
+
+def disable_profiling():
+    """Disables the profile of the explanation algorithms."""
+    global PROFILE_ENABLED
+    PROFILE_ENABLED = False
+
+
+def reset_profile():
+    """Empties the counts and durations of the profile."""
+    PROFILE_COUNTS.clear()
+    PROFILE_TIMES.clear()
+
+
+def profile_count(name: str, count: int = 1):
+    """Counts events of the given name if the profile is enabled.
+
+    Args:
+        name (str): Name of the event.
+        count (int, optional): Number of events. The default value is 1.
+    """
+    if PROFILE_ENABLED:
+        PROFILE_COUNTS[name] += count
+
+
+def profile_start() -> Optional[float]:
+    """Returns the start time of a profiled section, None if the profile is disabled."""
+    return perf_counter() if PROFILE_ENABLED else None
+
+
+def profile_stop(name: str, start: Optional[float]):
+    """Adds the duration of a section started with profile_start and counts it.
+
+    Args:
+        name (str): Name of the section.
+        start (float, optional): Value returned by profile_start.
+    """
+    if start is not None:
+        PROFILE_TIMES[name] += perf_counter() - start
+        PROFILE_COUNTS[name] += 1
+
+
+def profile_summary() -> List[List]:
+    """Returns for each event and section of the profile (sorted by name) its count,
+    its total duration and its mean duration ("NaN" for events without duration).
+    """
+    return [
+        [
+            name,
+            count,
+            PROFILE_TIMES[name] if name in PROFILE_TIMES else "NaN",
+            PROFILE_TIMES[name] / count if name in PROFILE_TIMES else "NaN",
+        ]
+        for name, count in sorted(PROFILE_COUNTS.items())
+    ]
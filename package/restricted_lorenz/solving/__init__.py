@@ -1,4 +1,5 @@
 from .commons import *
+from .canonical import *
 from .contribution_algo import *
 from .hlp import *
 from .optimum import *
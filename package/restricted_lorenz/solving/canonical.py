@@ -0,0 +1,118 @@
+"""Functions :
+    - building the canonical representative of a pair of integer candidates
+    (common first and last values removed, translated to a minimum of 0)
+    - mapping an explanation of the representative back to the pair
+    - decorating the restricted Lorenz explanation methods so that the cache is
+    consulted with the representative
+The sorted steps of a redistributive transfers explanation have Lorenz vectors
+between the ones of the looser and the winner, so the common first and last values
+never change and the steps remain between the minimum and the maximum of the looser:
+the methods only depend on the differences between the values and the definition
+domain does not constrain the explanation (nor the "Big M" of the MILP, which remains
+greater than the values of the representative).
+"""
+from functools import wraps
+from inspect import signature
+from numpy import concatenate, flatnonzero, integer, issubdtype
+from numpy import asarray
+from numpy import any as npany
+from numpy import cumsum as npcumsum
+from package import explanation_cache_enabled
+
+
+def canonical_pair(looser, winner, low=None, high=None):
+    """Returns the first and last indexes of the values changed by the explanation
+    (common values before and after them removed) and the offset translating the
+    candidates to a minimum of 0, None if the pair has no canonical representative
+    (float candidates, no Lorenz dominance or candidates out of the definition
+    domain).
+
+    Args:
+        looser (ArrayLike): First candidate.
+        winner (ArrayLike): Second candidate.
+        low (int | float, optional): Lower boundary of the definition domain.
+        high (int | float, optional): Upper boundary of the definition domain.
+    """
+    looser, winner = asarray(looser), asarray(winner)
+    if (
+        not (issubdtype(looser.dtype, integer) and issubdtype(winner.dtype, integer))
+        or looser.shape != winner.shape
+    ):
+        return None
+    changed = flatnonzero(looser != winner)
+    if changed.shape[0] == 0 or npany(npcumsum(winner) < npcumsum(looser)):
+        return None
+    for values in (looser, winner):
+        if (low is not None and values.min() < low) or (
+            high is not None and values.max() > high
+        ):
+            return None
+    first, last = changed[0], changed[-1] + 1
+    return first, last, min(looser[first:last].min(), winner[first:last].min())
+
+
+def explanation_from_canonical(explanation, looser, first: int, last: int, offset):
+    """Returns the steps of the explanation of the pair from the steps of the
+    explanation of its canonical representative (see canonical_pair).
+
+    Args:
+        explanation (List[NDArray]): Steps of the explanation of the representative.
+        looser (ArrayLike): First candidate.
+        first (int): First index of the values changed by the explanation.
+        last (int): Index following the last value changed by the explanation.
+        offset (int): Translation of the representative.
+    """
+    return [
+        concatenate([looser[:first], step + offset, looser[last:]]).astype(looser.dtype)
+        for step in explanation
+    ]
+
+
+def canonical_explanation(item):
+    """Decorates a restricted Lorenz explanation method (arguments looser, winner and
+    optionally the bounds low and high of the definition domain, and the number of
+    criteria instance_nb_var of its solver parameter profile) so that, when the
+    cache is enabled, it is computed and cached for the canonical representative of
+    the pair and mapped back to the pair."""
+    parameters = signature(item)
+
+    @wraps(item)
+    def func_wrapper(*args, **kwargs):
+        """Closure for function."""
+        if not explanation_cache_enabled():
+            return item(*args, **kwargs)
+        arguments = parameters.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        looser = asarray(arguments.arguments["looser"])
+        winner = asarray(arguments.arguments["winner"])
+        canonical = canonical_pair(
+            looser,
+            winner,
+            arguments.arguments.get("low"),
+            arguments.arguments.get("high"),
+        )
+        if canonical is None:
+            return item(*args, **kwargs)
+        first, last, offset = canonical
+        # The solver parameter profile remains the one of the class of the pair
+        if "instance_nb_var" in arguments.arguments:
+            arguments.arguments["instance_nb_var"] = (
+                arguments.arguments["instance_nb_var"] or looser.shape[0]
+            )
+        arguments.arguments["looser"] = looser[first:last] - offset
+        arguments.arguments["winner"] = winner[first:last] - offset
+        # The steps remain between the minimum and the maximum of the candidates
+        if arguments.arguments.get("low") is not None:
+            arguments.arguments["low"] = 0
+        if arguments.arguments.get("high") is not None:
+            arguments.arguments["high"] = (
+                max(looser[first:last].max(), winner[first:last].max()) - offset
+            )
+        length, explanation, symbols = item(*arguments.args, **arguments.kwargs)
+        return (
+            length,
+            explanation_from_canonical(explanation, looser, first, last, offset),
+            symbols,
+        )
+
+    return func_wrapper
@@ -2,8 +2,13 @@
     - building the receiving and giving indexes
     - computing the largest redistributive transfer possible between two indexes
     - applying a redistributive transfer on a candidate
+    - splitting a pair at the contact points of the Lorenz curves
+    - assembling the explanation of a pair from the explanations of its blocks
 """
-from numpy import argwhere, ravel
+from numpy import argwhere, flatnonzero, ravel
+from numpy import abs as npabs
+from numpy import any as npany
+from numpy import cumsum as npcumsum
 from numpy import min as npmin
 from package.restricted_lorenz.test_dominance import lorenz_vector
 
@@ -61,3 +66,50 @@ def redistributive_transfer(a, i: int, j: int, epsilon):
     b[i] += epsilon
     b[j] -= epsilon
     return b
+
+
+def contact_blocks(looser, winner, ndigits):
+    """Returns the first index and the index following the last one of each block of
+    criteria changed by the explanation, the blocks being delimited by the contact
+    points of the Lorenz curves (indexes where the cumulative sums are equal).
+    The redistributive transfers keep the Lorenz vectors between the ones of the
+    looser and the winner, so no transfer crosses a contact point and the blocks
+    are independent explanation problems.
+
+    Args:
+        looser (ArrayLike): First candidate.
+        winner (ArrayLike): Second candidate.
+        ndigits (int): Precision (number of digit after the coma).
+    """
+    tolerance = 10 ** (-ndigits - 2)
+    contacts = flatnonzero(npabs(npcumsum(winner) - npcumsum(looser)) <= tolerance)
+    changed = npabs(looser - winner) > tolerance
+    blocks = []
+    first = 0
+    for contact in contacts:
+        if npany(changed[first : contact + 1]):
+            blocks.append((first, contact + 1))
+        first = contact + 1
+    if npany(changed[first:]):
+        blocks.append((first, len(changed)))
+    return blocks
+
+
+def explanation_from_blocks(looser, blocks, explanations):
+    """Returns the steps of the explanation of the pair from the steps of the
+    explanations of its blocks (see contact_blocks), explained one after the other.
+
+    Args:
+        looser (ArrayLike): First candidate.
+        blocks (List[Tuple[int, int]]): First and following the last indexes of
+        each block.
+        explanations (List[List[NDArray]]): Steps of the explanation of each block,
+        starting with the block of the looser.
+    """
+    explanation = [looser]
+    for (first, last), block_explanation in zip(blocks, explanations):
+        for block_step in block_explanation[1:]:
+            step = explanation[-1].copy()
+            step[first:last] = block_step
+            explanation.append(step)
+    return explanation
@@ -1,5 +1,6 @@
-"""Function providing the PT-ATX for restricted Lorenz dominance using 
-our contribution algorithm"""
+"""Functions providing the PT-ATX for restricted Lorenz dominance using 
+our contribution algorithm, on each block between the contact points of the
+Lorenz curves"""
 from functools import reduce
 from numpy import where as npwhere
 from numpy import argwhere as npargwhere
@@ -9,23 +10,62 @@ from numpy import equal as npequal
 from numpy import all as npall
 from numpy import round as npround
 from numpy import array as nparray
-from package import timeout_decorator
+from package import (
+    cached_explanation,
+    timeout_decorator,
+    profile_count,
+    profile_start,
+    profile_stop,
+)
 from package.plot import REDISTRIBUTIVE_TRANSFER
 from .commons import (
     positive_negative_modification_indexes,
+    contact_blocks,
+    explanation_from_blocks,
     redistributive_transfer,
     largest_redistributive_transfer,
 )
+from .canonical import canonical_explanation
 
-FILE_NAME = "Restricted\\contribution_algo.csv"
+FILE_NAME = "Restricted/contribution_algo.csv"
 
 
+@canonical_explanation
+@cached_explanation
 @timeout_decorator
 def contribution_heuristics(looser, winner, ndigits: int = 0, low=None, high=None):
     """Builds the explanation for restricted Lorenz dominance between two
     candidates using our cautious contribution algorithm.
     Returns the length, the explanation and the symbols for display.
 
+    The blocks between the contact points of the Lorenz curves (see contact_blocks)
+    are explained one after the other.
+
+    Args:
+        looser (ArrayLike): First candidate.
+        winner (ArrayLike): Second candidate.
+        ndigits (int, optional): Precision (number of digit after the coma).
+        The default value is 0.
+    """
+    blocks = contact_blocks(looser, winner, ndigits)
+    explanation = explanation_from_blocks(
+        looser,
+        blocks,
+        [
+            block_contribution(looser[first:last], winner[first:last], ndigits)
+            for first, last in blocks
+        ],
+    )
+    expl_len = len(explanation) - 1
+    return expl_len, explanation, [REDISTRIBUTIVE_TRANSFER] * expl_len
+
+
+def block_contribution(looser, winner, ndigits: int = 0):
+    """Builds the explanation for restricted Lorenz dominance between two
+    candidates (or blocks of candidates, see contact_blocks) using our cautious
+    contribution algorithm.
+    Returns the explanation.
+
     Args:
         looser (ArrayLike): First candidate.
         winner (ArrayLike): Second candidate.
@@ -47,7 +87,9 @@ def contribution_heuristics(looser, winner, ndigits: int = 0, low=None, high=Non
         """
         if npall(npequal(a, b)) or len(n) == 0:
             return []
+        profile_count("contribution.steps")
 
+        start = profile_start()
         resolvable_n = nparray(
             [
                 j
@@ -65,26 +107,33 @@ def contribution_heuristics(looser, winner, ndigits: int = 0, low=None, high=Non
                 or (a[i + 1] - a[i] >= b[i] - a[i])
             ]
         )
+        profile_stop("contribution.resolvable_sets", start)
 
         def best_transfer(j):
+            start = profile_start()
             i = npargmax(
                 [
                     largest_redistributive_transfer(a, b, i, j)
                     for i in resolvable_p[npwhere(resolvable_p < j)]
                 ]
             )
-            return (
+            transfer = (
                 resolvable_p[i],
                 j,
                 largest_redistributive_transfer(a, b, resolvable_p[i], j),
             )
+            profile_stop("contribution.largest_transfer", start)
+            return transfer
 
+        start = profile_start()
         i, j, epsilon = reduce(
             lambda t_1, t_2: (t_1[0], t_1[1], t_1[2])
             if t_1[2] - t_2[2] >= 0
             else (t_2[0], t_2[1], t_2[2]),
             (best_transfer(j) for j in resolvable_n),
         )
+        profile_stop("contribution.reduce", start)
+        start = profile_start()
         if ndigits != 0:
             epsilon = round(epsilon, ndigits)
 
@@ -98,15 +147,13 @@ def contribution_heuristics(looser, winner, ndigits: int = 0, low=None, high=Non
             p = npdelete(p, npargwhere(p == i))
         if abs(a[j] - b[j] - epsilon) < threshold:
             n = npdelete(n, npargwhere(n == j))
+        profile_stop("contribution.transfer", start)
         explanation_end = recurcive_contribution(updated_cand, b, n, p)
         explanation_end.append(updated_cand)
         return explanation_end
 
     neg, pos = positive_negative_modification_indexes(looser, winner, ndigits)
     explanation = recurcive_contribution(looser, winner, neg, pos)
-    expl_len = len(explanation)
     explanation.append(looser)
     explanation.reverse()
-    expl_symbols = [REDISTRIBUTIVE_TRANSFER] * expl_len
-
-    return expl_len, explanation, expl_symbols
+    return explanation
@@ -12,11 +12,20 @@ from .commons import (
     redistributive_transfer,
     largest_redistributive_transfer,
 )
-from package import timeout_decorator
+from .canonical import canonical_explanation
+from package import (
+    cached_explanation,
+    timeout_decorator,
+    profile_count,
+    profile_start,
+    profile_stop,
+)
 
-FILE_NAME = "Restricted\\hlp.csv"
+FILE_NAME = "Restricted/hlp.csv"
 
 
+@canonical_explanation
+@cached_explanation
 @timeout_decorator
 def hardy_littlewood_polya(looser, winner, ndigits: int = 0):
     """Builds the explanation for restricted Lorenz dominance between two
@@ -44,16 +53,21 @@ def hardy_littlewood_polya(looser, winner, ndigits: int = 0):
         """
         if npall(npequal(a, b)) or len(n) == 0:
             return []
+        profile_count("hlp.steps")
 
+        start = profile_start()
         j = n[0]
         i = npmax(p[npwhere(p < j)])
         epsilon = largest_redistributive_transfer(a, b, i, j)
+        profile_stop("hlp.largest_transfer", start)
+        start = profile_start()
         updated_cand = redistributive_transfer(a, i, j, epsilon)
 
         if abs(b[i] - a[i] - epsilon) < threshold:
             p = npdelete(p, npargwhere(p == i))
         if abs(a[j] - b[j] - epsilon) < threshold:
             n = npdelete(n, npargwhere(n == j))
+        profile_stop("hlp.transfer", start)
         explanation_end = recurcive_hlp(updated_cand, b, n, p)
         explanation_end.append(updated_cand)
         return explanation_end
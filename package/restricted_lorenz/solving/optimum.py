@@ -1,11 +1,15 @@
 """Functions :
     - providing the shortest PT-ATX for restricted Lorenz dominance using 
-MILP solving
+MILP solving, the blocks between the contact points of the Lorenz curves being
+solved in parallel
+    - providing the shortest PT-ATX of a block
     - yielding the MILP formulation
     - adds new candidate to the MILP
     - adds ordering constraints for candidate in the MILP
     - adds constraints for redistributive transfers in the MILP"""
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil
+from os import cpu_count
 from multiprocessing.context import TimeoutError as TimedOut
 from numpy import sum as npsum
 from numpy import array as nparray
@@ -13,23 +17,112 @@ from numpy import ones as npones
 from numpy import int_, float64
 from scipy.sparse import spmatrix
 from scipy.sparse import diags as spdiags
-from gurobipy import GRB, Model, MVar
-from package import timeout_decorator
+from gurobipy import GRB, Env, Model, MVar
+from package import (
+    cached_explanation,
+    timeout_decorator,
+    phase_lap_factory,
+    phases_propagated,
+    log_solve,
+    apply_solver_profile,
+)
 from package.plot import REDISTRIBUTIVE_TRANSFER
-from .commons import positive_negative_modification_indexes
+from .commons import (
+    positive_negative_modification_indexes,
+    contact_blocks,
+    explanation_from_blocks,
+)
+from .canonical import canonical_explanation
 
-FILE_NAME = "Restricted\\optimum.csv"
+FILE_NAME = "Restricted/optimum.csv"
 
 
+@canonical_explanation
+@cached_explanation
 @timeout_decorator
-def restricted_optimum(looser, winner, low, high, ndigits):
+def restricted_optimum(looser, winner, low, high, ndigits, instance_nb_var=None):
     """Builds the shortest explanation for restricted Lorenz dominance between
     two candidates.
+    The blocks between the contact points of the Lorenz curves (see contact_blocks)
+    are solved independently, in parallel threads with their own Gurobi environment
+    when there are several blocks, at most one thread by core, the cores being
+    shared between the environments of the threads.
     Returns the length, the explanation and the symbols for display.
 
     Args:
         looser (ArrayLike): First candidate.
         winner (ArrayLike): Second candidate.
+        instance_nb_var (int, optional): Number of criteria of the instance, which
+        gives the class of its solver parameter profile (see apply_solver_profile)
+        when the candidates are only a part of it. Defaults to the number of criteria
+        of the candidates.
+    """
+    blocks = contact_blocks(looser, winner, ndigits)
+    instance_nb_var = instance_nb_var or len(looser)
+    nb_cores = cpu_count() or 1
+    nb_workers = min(len(blocks), nb_cores)
+
+    def block_optimum(block):
+        """Solves the block in its own Gurobi environment, with its share of the
+        cores."""
+        first, last = block
+        with Env(
+            params={"OutputFlag": 0, "Threads": max(1, nb_cores // nb_workers)}
+        ) as env:
+            return restricted_block_optimum(
+                looser[first:last],
+                winner[first:last],
+                low,
+                high,
+                ndigits,
+                env,
+                instance_nb_var,
+            )
+
+    if len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=nb_workers) as pool:
+            block_optimum = phases_propagated(block_optimum)
+            futures = [pool.submit(block_optimum, block) for block in blocks]
+            explanations = [future.result() for future in futures]
+    else:
+        explanations = [
+            restricted_block_optimum(
+                looser[first:last],
+                winner[first:last],
+                low,
+                high,
+                ndigits,
+                instance_nb_var=instance_nb_var,
+            )
+            for first, last in blocks
+        ]
+    k = sum(len(explanation) - 1 for explanation in explanations)
+    return (
+        k,
+        explanation_from_blocks(looser, blocks, explanations),
+        [REDISTRIBUTIVE_TRANSFER] * k,
+    )
+
+
+def restricted_block_optimum(
+    looser, winner, low, high, ndigits, env=None, instance_nb_var=None
+):
+    """Builds the shortest explanation for restricted Lorenz dominance between
+    two candidates (or blocks of candidates, see contact_blocks).
+    Returns the explanation.
+
+    Args:
+        looser (ArrayLike): First candidate.
+        winner (ArrayLike): Second candidate.
+        low (int | float): Lower boundary of the definition domain.
+        high (int | float): Upper boundary of the definition domain.
+        ndigits (int): Precision (number of digit after the coma).
+        env (Env, optional): Gurobi environment of the model. Defaults to the
+        default environment.
+        instance_nb_var (int, optional): Number of criteria of the instance, which
+        gives the class of its solver parameter profile (see apply_solver_profile)
+        when the candidates are only a part of it. Defaults to the number of criteria
+        of the candidates.
     """
     minimum_k = max(
         (
@@ -38,18 +131,22 @@ def restricted_optimum(looser, winner, low, high, ndigits):
         )
     )
     k = minimum_k
+    phase_lap = phase_lap_factory()
     model_generator = build_restricted_base_model(
-        looser, winner, minimum_k, low, high, ndigits
+        looser, winner, minimum_k, low, high, ndigits, env, instance_nb_var
     )
     m = next(model_generator)
     found = False
 
     while not found:
         m.update()
+        phase_lap("build")
         m.optimize()
+        phase_lap("solve")
+        log_solve(m, "restricted_optimum", k)
+        phase_lap("io")
         if m.Status == GRB.TIME_LIMIT:
             raise TimedOut
-        m.display()
         if m.status == GRB.OPTIMAL:
             nb_var = len(looser)
             explanation = []
@@ -63,17 +160,25 @@ def restricted_optimum(looser, winner, low, high, ndigits):
                         dtype=int_ if ndigits == 0 else float64,
                     )
                 )
+            phase_lap("extract")
             found = True
         else:
             m = next(model_generator)
             k += 1
 
     m.dispose()
-    return k, explanation, [REDISTRIBUTIVE_TRANSFER] * k
+    return explanation
 
 
 def build_restricted_base_model(
-    looser, winner, minimum_k: int, low, high, ndigits: int = 0
+    looser,
+    winner,
+    minimum_k: int,
+    low,
+    high,
+    ndigits: int = 0,
+    env=None,
+    instance_nb_var=None,
 ):
     """Generator returning the MILP model.
     Updated at each call by adding a new step to the explanation search.
@@ -87,8 +192,14 @@ def build_restricted_base_model(
         high (int | float): Upper boundary of the definition domain.
         ndigits (int, optional): Precision (number of digit after the coma).
         The default value is 0.
+        env (Env, optional): Gurobi environment of the model. Defaults to the
+        default environment.
+        instance_nb_var (int, optional): Number of criteria of the instance, which
+        gives the class of its solver parameter profile (see apply_solver_profile)
+        when the candidates are only a part of it. Defaults to the number of criteria
+        of the candidates.
     """
-    m = Model("ExactKExplanation")
+    m = Model("ExactKExplanation", env=env)
     m.Params.LogToConsole = 0
     m.Params.MIPFocus = 1
     m.Params.TimeLimit = 150
@@ -100,6 +211,7 @@ def build_restricted_base_model(
         m.Params.FeasibilityTol = 10 ** (-ndigits - 2)
 
     nb_var: int = winner.shape[0]
+    apply_solver_profile(m, "restricted_optimum", instance_nb_var or nb_var, ndigits)
     nb_redistributive_transfers: int = (nb_var * nb_var - nb_var) // 2
 
     add_redistributive_constraints = add_redistributive_constraints_factory(
@@ -20,11 +20,18 @@ from package.generalized_lorenz.solving import (
     add_gift_for_step_factory,
     add_gift_use_constraint_factory,
 )
-from package import timeout_decorator
+from package import (
+    cached_explanation,
+    timeout_decorator,
+    phase_lap_factory,
+    log_solve,
+    apply_solver_profile,
+)
 
-FILE_NAME = "RobustOWA\\atx_optim.csv"
+FILE_NAME = "RobustOWA/atx_optim.csv"
 
 
+@cached_explanation
 @timeout_decorator
 def robust_optimum(looser, winner, low, high, ndigits, preferential_information):
     """Builds the shortest explanation for robust redistributive OWA dominance between
@@ -37,6 +44,7 @@ def robust_optimum(looser, winner, low, high, ndigits, preferential_information)
     """
     minimum_k = 1
     k = minimum_k
+    phase_lap = phase_lap_factory()
     model_generator = build_robust_base_model(
         looser, winner, minimum_k, low, high, ndigits, preferential_information
     )
@@ -45,8 +53,11 @@ def robust_optimum(looser, winner, low, high, ndigits, preferential_information)
 
     while not found:
         m.update()
+        phase_lap("build")
         m.optimize()
-        m.display()
+        phase_lap("solve")
+        log_solve(m, "robust_optimum", k)
+        phase_lap("io")
         if m.Status == GRB.TIME_LIMIT:
             raise TimedOut
         if m.status == GRB.OPTIMAL:
@@ -96,6 +107,7 @@ def robust_optimum(looser, winner, low, high, ndigits, preferential_information)
                         symbols.append(PREFERENTIAL_INFORMATION)
                     else:
                         symbols.append(REDISTRIBUTIVE_TRANSFER)
+            phase_lap("extract")
             found = True
         else:
             m = next(model_generator)
@@ -136,6 +148,7 @@ def build_robust_base_model(
         m.Params.IntegralityFocus = 1
 
     nb_var: int = winner.shape[0]
+    apply_solver_profile(m, "robust_optimum", nb_var, ndigits)
     nb_pi: int = preferential_information.shape[0]
     preferential_information_transpose = transpose(preferential_information)
     nb_redistributive_transfers: int = (nb_var * nb_var - nb_var) // 2
@@ -5,7 +5,7 @@
 from numpy import sum as npsum
 from numpy import zeros as npzeros
 from package.plot.types import GIFT, PREFERENTIAL_INFORMATION
-from package import timeout_decorator
+from package import timeout_decorator, profile_start, profile_stop
 
 
 def compute_deltas(nb_var, pi_statements, nu_minus, nu_plus, mu, lmbd):
@@ -63,14 +63,21 @@ def ctx_from_farkas_factory(
             lmbd (ArrayLike): Magnitude of the PI statements used in the farkas certificate.
         """
         nb_var = len(looser)
+        start = profile_start()
         delta_plus, delta_minus = compute_deltas(
             nb_var, pi_statements, nu_minus, nu_plus, mu, lmbd
         )
+        profile_stop("ctx.deltas", start)
+        start = profile_start()
         c = reduction_factor_computation(
             looser, winner, delta_plus, delta_minus, low, high
         )
+        profile_stop("ctx.reduction_factor", start)
+        start = profile_start()
         x, y = congruence_computation(looser, winner, c, delta_plus, delta_minus, low)
+        profile_stop("ctx.congruence", start)
 
+        start = profile_start()
         explanation = [x.copy()]
         explanation_len = 0
         explanation_symbols = []
@@ -86,11 +93,13 @@ def ctx_from_farkas_factory(
                 explanation.append(x.copy())
                 explanation_len += 1
                 explanation_symbols.append(PREFERENTIAL_INFORMATION)
+        profile_stop("ctx.gift_and_pi_steps", start)
 
         if npsum(nu_minus) > 10 ** (-ndigits - 2):
             # print(x)
             # print(y)
             # print(y - x)
+            start = profile_start()
             length, expl, symbols = redistributive_transfer_computation(
                 looser=x,
                 winner=y,
@@ -98,6 +107,7 @@ def ctx_from_farkas_factory(
                 high=high,
                 ndigits=ndigits + 3,
             )
+            profile_stop("ctx.redistributive_transfers", start)
             explanation_len += length
             explanation += expl[1:]
             explanation_symbols += symbols
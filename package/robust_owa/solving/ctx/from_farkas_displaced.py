@@ -8,6 +8,7 @@ from numpy import zeros as npzeros
 from numpy import float64
 from package.restricted_lorenz.solving import restricted_optimum
 from package.robust_owa.solving.ctx.commons import ctx_from_farkas_factory
+from package import cached_explanation
 
 
 def file_name(farkas_name: str):
@@ -16,7 +17,7 @@ def file_name(farkas_name: str):
     Args:
         farkas_name (str): Farkas certificate function name.
     """
-    return f"RobustOWA\\{farkas_name}_ctx_displaced.csv"
+    return f"RobustOWA/{farkas_name}_ctx_displaced.csv"
 
 
 def alternatives_displaced(looser, winner, c, delta_plus, delta_minus, low):
@@ -80,6 +81,7 @@ def compute_reduction_factor_displaced(
     return c
 
 
+@cached_explanation
 def ctx_from_farkas_displaced(
     looser, winner, pi_statements, low, high, ndigits, nu_minus, nu_plus, mu, lmbd
 ):
@@ -6,11 +6,18 @@ from numpy import int_, float64, transpose
 from scipy.sparse import spmatrix
 from scipy.sparse import diags as spdiags
 from gurobipy import GRB, Model, MVar
-from package import timeout_decorator
+from package import (
+    cached_explanation,
+    timeout_decorator,
+    phase_lap_factory,
+    log_solve,
+    apply_solver_profile,
+)
 
 FARKAS_NAME = "first_farkas"
 
 
+@cached_explanation
 @timeout_decorator
 def first_farkas(looser, winner, ndigits: int, preferential_information):
     """Builds a Farkas lemma of the robust OWA dominance between first
@@ -23,6 +30,7 @@ def first_farkas(looser, winner, ndigits: int, preferential_information):
         preferential_information (NDArray): Matrix containing the preferential information
         statements. Each row contains one statement.
     """
+    phase_lap = phase_lap_factory()
     m = Model("FirstFarkas")
     m.Params.LogToConsole = 0
     m.Params.TimeLimit = 150
@@ -37,6 +45,7 @@ def first_farkas(looser, winner, ndigits: int, preferential_information):
     m.Params.FeasibilityTol = 10 ** (-ndigits - 3)
     m.Params.IntFeasTol = 10 ** (-ndigits - 3)
     m.Params.IntegralityFocus = 1
+    apply_solver_profile(m, FARKAS_NAME, nb_var, ndigits)
     mu = m.addMVar(shape=nb_var, vtype=GRB.CONTINUOUS, lb=0.0, name="mu")
     nu = m.addMVar(shape=nb_var, vtype=GRB.CONTINUOUS, lb=0.0, name="nu")
 
@@ -60,7 +69,11 @@ def first_farkas(looser, winner, ndigits: int, preferential_information):
     #         )
     #     )
 
+    phase_lap("build")
     m.optimize()
+    phase_lap("solve")
+    log_solve(m, FARKAS_NAME)
+    phase_lap("io")
     if m.Status == GRB.TIME_LIMIT:
         raise TimedOut
 
@@ -75,4 +88,5 @@ def first_farkas(looser, winner, ndigits: int, preferential_information):
         [x if x < 0 else 0 for x in fuzed_nu], dtype=float64 if ndigits else int_
     )
 
+    phase_lap("extract")
     return farkas_nu_minus, farkas_nu_plus, farkas_mu, farkas_lmbd
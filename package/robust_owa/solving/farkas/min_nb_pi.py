@@ -8,11 +8,18 @@ from numpy import array as nparray
 from numpy import ones as npones
 from numpy import float64, transpose, zeros
 from gurobipy import GRB, Model, MVar, Var
-from package import timeout_decorator
+from package import (
+    cached_explanation,
+    timeout_decorator,
+    phase_lap_factory,
+    log_solve,
+    apply_solver_profile,
+)
 
 FARKAS_NAME = "min_farkas"
 
 
+@cached_explanation
 @timeout_decorator
 def minimum_length_farkas(
     looser, winner, ndigits: int, preferential_information
@@ -27,6 +34,7 @@ def minimum_length_farkas(
         statements. Each row contains one statement.
         ndigits (int, optional): Precision (number of digit after the coma).
     """
+    phase_lap = phase_lap_factory()
     m = Model("MinLengthFarkas")
     m.Params.LogToConsole = 0
     m.Params.TimeLimit = 150
@@ -36,6 +44,7 @@ def minimum_length_farkas(
     m.Params.IntFeasTol = 10 ** (-ndigits - 3)
     m.Params.IntegralityFocus = 1
     nb_var: int = winner.shape[0]
+    apply_solver_profile(m, FARKAS_NAME, nb_var, ndigits)
     nb_pi: int = preferential_information.shape[0]
     nb_redistributive_transfers: int = (nb_var * nb_var - nb_var) // 2
     big_m_rt = ceil(npsum(winner) + npsum(looser))
@@ -83,7 +92,11 @@ def minimum_length_farkas(
     m.setObjective(
         npones((1, nb_pi)) @ lmbd_norm + transfer_norm + mu_norm, GRB.MINIMIZE
     )
+    phase_lap("build")
     m.optimize()
+    phase_lap("solve")
+    log_solve(m, FARKAS_NAME)
+    phase_lap("io")
     if m.Status == GRB.TIME_LIMIT:
         raise TimedOut
 
@@ -102,4 +115,5 @@ def minimum_length_farkas(
     # print(lmbd_norm.X)
     # print(transfer_norm.X)
     # print(mu_norm.X)
+    phase_lap("extract")
     return farkas_nu_minus, farkas_nu_plus, farkas_mu, farkas_lmbd
@@ -1,13 +1,16 @@
 """Functions building :
     - the function checking the robust redistributive OWA dominance
-    - the Guroby Linear Model of the robust redistributive OWA
-    - the set of robust redistributive OWA dominances
+    - the Guroby Linear Model of the robust redistributive OWA and feasible weights
+    - the set of robust redistributive OWA dominances, by chunks of pairs
 """
+from tempfile import TemporaryFile
 from typing import List, Tuple
-from itertools import permutations
 from gurobipy import Model, GRB
 from multiprocessing.context import TimeoutError as TimedOut
+from numpy import asarray, int_, memmap, searchsorted
 from numpy import ones as npones
+from numpy import zeros as npzeros
+from numpy import array as nparray
 from scipy.sparse import diags as spdiags
 
 
@@ -40,18 +43,20 @@ def robust_redistributive_owa_dominance_factory(lpmodel, w):
     return robust_redistributive_owa_dominance
 
 
-def build_lpmodel(pi_statements, nb_var: int, ndigits: int):
-    """Builds the LP Guroby model of the robust redistributive OWA and returns
-    the dominance checking function associated
+def owa_weights_model(pi_statements, nb_var: int, ndigits: int, name: str):
+    """Builds the LP Guroby model of the weights of the robust redistributive OWA
+    (non negative, decreasing and compatible with the preferential information).
+    Returns the model and its weights variable.
 
     Args:
         pi_statements (NDArray): Preferential information statements to apply as
         constraints in the robust redistributive OWA.
         nb_var (int): Number of criteria.
         ndigits (int): Precision (number of digit after the coma).
+        name (str): Name of the model.
     """
     nb_pi = pi_statements.shape[0] if len(pi_statements) > 0 else 0
-    lpmodel = Model("Dominance")
+    lpmodel = Model(name)
     lpmodel.Params.LogToConsole = 0
     lpmodel.Params.TimeLimit = 150
     if ndigits != 0:
@@ -65,10 +70,114 @@ def build_lpmodel(pi_statements, nb_var: int, ndigits: int):
         spdiags([npones(nb_var), -npones(nb_var - 1)], [0, 1]) @ w >= 0,
         name="BalancedOWA",
     )
+    return lpmodel, w
 
+
+def build_lpmodel(pi_statements, nb_var: int, ndigits: int):
+    """Builds the LP Guroby model of the robust redistributive OWA and returns
+    the dominance checking function associated
+
+    Args:
+        pi_statements (NDArray): Preferential information statements to apply as
+        constraints in the robust redistributive OWA.
+        nb_var (int): Number of criteria.
+        ndigits (int): Precision (number of digit after the coma).
+    """
+    lpmodel, w = owa_weights_model(pi_statements, nb_var, ndigits, "Dominance")
     return robust_redistributive_owa_dominance_factory(lpmodel, w)
 
 
+def feasible_owa_weights(pi_statements, nb_var: int, ndigits: int):
+    """Returns weights of the robust redistributive OWA (summing to 1). Dominating a
+    candidate with these weights is a necessary condition of the robust dominance.
+
+    Args:
+        pi_statements (NDArray): Preferential information statements to apply as
+        constraints in the robust redistributive OWA.
+        nb_var (int): Number of criteria.
+        ndigits (int): Precision (number of digit after the coma).
+    """
+    lpmodel, w = owa_weights_model(pi_statements, nb_var, ndigits, "FeasibleWeights")
+    lpmodel.addConstr(w.sum() == 1, name="Normalization")
+    lpmodel.optimize()
+    return w.X
+
+
+def dominance_keys(nb_cand: int, *relations, chunk_rows: int = 1 << 16):
+    """Returns the sorted keys i * nb_cand + j of the pairs (i,j) belonging to one of
+    the relations, memory-mapped on a temporary file, the relations being read
+    by chunks of rows (e.g. memory-mapped relations).
+
+    Args:
+        nb_cand (int): Number of candidates.
+        relations (ArrayLike): Pairs of candidates indexes.
+        chunk_rows (int, optional): Number of pairs read at once.
+        The default value is 2**16.
+    """
+    relations = [
+        asarray(relation, dtype=int_).reshape((-1, 2)) for relation in relations
+    ]
+    nb_pairs = sum(pairs.shape[0] for pairs in relations)
+    if nb_pairs == 0:
+        return npzeros(0, dtype=int_)
+    keys = memmap(TemporaryFile(), dtype=int_, mode="w+", shape=(nb_pairs,))
+    filled = 0
+    for pairs in relations:
+        for start in range(0, pairs.shape[0], chunk_rows):
+            chunk = pairs[start : start + chunk_rows]
+            keys[filled : filled + chunk.shape[0]] = chunk[:, 0] * nb_cand + chunk[:, 1]
+            filled += chunk.shape[0]
+    keys.sort()
+    return keys
+
+
+def dominance_row(keys, nb_cand: int, i: int):
+    """Returns the boolean vector whose cell j is true if the key of the pair (i,j)
+    is one of the sorted keys (see dominance_keys).
+
+    Args:
+        keys (NDArray): Sorted keys of the pairs.
+        nb_cand (int): Number of candidates.
+        i (int): Index of the first candidate of the pairs.
+    """
+    first, last = searchsorted(keys, [i * nb_cand, (i + 1) * nb_cand])
+    row = npzeros(nb_cand, dtype=bool)
+    row[asarray(keys[first:last]) - i * nb_cand] = True
+    return row
+
+
+def redistributive_owa_dominance_chunks(
+    data, pi_statements, ndigits: int, restricted_dom, generalized_dom
+):
+    """Yields for each candidate i the array of pairs (i,j) such that j dominates i in
+    the robust redistributive OWA obtained from the preferential information statements
+    and not in the Lorenz dominances (order of compute_redistributive_owa_dominance).
+
+    Args:
+        data (NDArray): Dataset of candidates.
+        pi_statements (NDArray): Preferential information statements to apply as
+        constraints in the robust redistributive OWA.
+        ndigits (int): Precision (number of digit after the coma).
+        restricted_dom (ArrayLike): Pairs of Restricted Lorenz statements in data.
+        generalized_dom (ArrayLike): Pairs of Generalized Lorenz statements in data.
+    """
+    nb_cand, nb_var = data.shape
+    if len(pi_statements) == 0:
+        return
+    robust_redistributive_owa_dominance = build_lpmodel(pi_statements, nb_var, ndigits)
+    lorenz = dominance_keys(nb_cand, restricted_dom, generalized_dom)
+    for a in range(nb_cand):
+        lorenz_row = dominance_row(lorenz, nb_cand, a)
+        dom = [
+            (a, b)
+            for b in range(nb_cand)
+            if b != a
+            and not lorenz_row[b]
+            and robust_redistributive_owa_dominance(data[a], data[b])
+        ]
+        yield nparray(dom, dtype=int_).reshape((-1, 2))
+
+
 def compute_redistributive_owa_dominance(
     data,
     pi_statements,
@@ -88,17 +197,10 @@ def compute_redistributive_owa_dominance(
         generalized_dom (List[Tuple[int,int]]): List of Generalized Lorenz statements in data.
         Allows to return robust redistributive OWA only dominances.
     """
-    nb_cand, nb_var = data.shape
-    dom = []
-    if len(pi_statements) > 0:
-        robust_redistributive_owa_dominance = build_lpmodel(
-            pi_statements, nb_var, ndigits
+    return [
+        (a, b)
+        for pairs in redistributive_owa_dominance_chunks(
+            data, pi_statements, ndigits, restricted_dom, generalized_dom
         )
-        for a, b in permutations(range(nb_cand), 2):
-            if (
-                (a, b) not in restricted_dom
-                and (a, b) not in generalized_dom
-                and robust_redistributive_owa_dominance(data[a], data[b])
-            ):
-                dom.append((a, b))
-    return dom
+        for a, b in pairs.tolist()
+    ]
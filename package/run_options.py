@@ -0,0 +1,87 @@
+"""Functions managing the process-wide options of an explanation run, disabled by
+default :
+    - enabling the options (profile of the explanation algorithms, cache of the
+    explanation methods, solver parameter profiles) and disabling them
+    - enabling the options for the duration of a run, even if it is interrupted
+"""
+from contextlib import contextmanager
+from typing import Optional
+from .profiling import enable_profiling, disable_profiling
+from .explanation_cache import enable_explanation_cache, disable_explanation_cache
+from .solver_profiles import use_solver_profiles, disable_solver_profiles
+
+
+def enable_run_options(
+    profile: bool = False,
+    cache: bool = False,
+    cache_path: Optional[str] = None,
+    solver_profiles: Optional[str] = None,
+):
+    """Enables the options of an explanation run.
+
+    Args:
+        profile (bool, optional): Enables the profile of the explanation algorithms
+        (see enable_profiling). The default value is False.
+        cache (bool, optional): Enables the cache of the explanation methods
+        (see enable_explanation_cache). The default value is False.
+        cache_path (str, optional): Folder of the on-disk cache (enables the cache).
+        Defaults to a cache in memory only.
+        solver_profiles (str, optional): Folder of the solver parameter profiles
+        (see use_solver_profiles). Defaults to the parameters of the model builders.
+    """
+    if profile:
+        enable_profiling()
+    if cache or cache_path is not None:
+        enable_explanation_cache(path=cache_path)
+    if solver_profiles is not None:
+        use_solver_profiles(solver_profiles)
+
+
+def disable_run_options(
+    profile: bool = False,
+    cache: bool = False,
+    cache_path: Optional[str] = None,
+    solver_profiles: Optional[str] = None,
+):
+    """Disables the options enabled by enable_run_options with the same arguments.
+
+    Args:
+        profile (bool, optional): Disables the profile. The default value is False.
+        cache (bool, optional): Disables the cache. The default value is False.
+        cache_path (str, optional): Disables the cache. Defaults to none.
+        solver_profiles (str, optional): Disables the solver parameter profiles.
+        Defaults to none.
+    """
+    if profile:
+        disable_profiling()
+    if cache or cache_path is not None:
+        disable_explanation_cache()
+    if solver_profiles is not None:
+        disable_solver_profiles()
+
+
+@contextmanager
+def run_options(
+    profile: bool = False,
+    cache: bool = False,
+    cache_path: Optional[str] = None,
+    solver_profiles: Optional[str] = None,
+):
+    """Context manager enabling the options of an explanation run (see
+    enable_run_options) and disabling them when the run ends or is interrupted.
+    Yields the options as arguments of enable_run_options.
+
+    Args:
+        profile (bool, optional): Enables the profile. The default value is False.
+        cache (bool, optional): Enables the cache. The default value is False.
+        cache_path (str, optional): Folder of the on-disk cache (enables the cache).
+        Defaults to a cache in memory only.
+        solver_profiles (str, optional): Folder of the solver parameter profiles.
+        Defaults to the parameters of the model builders.
+    """
+    options = (profile, cache, cache_path, solver_profiles)
+    enable_run_options(*options)
+    try:
+        yield options
+    finally:
+        disable_run_options(*options)
@@ -0,0 +1,116 @@
+"""Functions :
+    - estimating the cost of an explanation task from cheap features
+    - ordering tasks by longest expected job first
+    - assigning tasks to workers (longest processing time list scheduling)
+    - submitting tasks to a pool of workers in longest expected job first order
+    - running tasks in a process pool in longest expected job first order
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from heapq import heapify, heapreplace
+from typing import Callable, List, Optional, Sequence, Tuple
+from package.restricted_lorenz.solving.commons import (
+    positive_negative_modification_indexes,
+)
+
+
+def expected_cost(
+    looser, winner, ndigits: int, nb_pi: int = 0, heuristic_length: Optional[int] = None
+) -> float:
+    """Returns the expected (relative) cost of explaining the dominance of winner over
+    looser with an exact method. The exact methods solve a MILP for each length from
+    the lower bound given by the number of giving and receiving indexes up to the
+    length of the explanation, each with about length * nb_var^2 binary variables
+    and one constraint set by preferential information statement.
+
+    Args:
+        looser (ArrayLike): First candidate.
+        winner (ArrayLike): Second candidate.
+        ndigits (int): Precision (number of digit after the coma).
+        nb_pi (int, optional): Number of preferential information statements.
+        The default value is 0.
+        heuristic_length (int, optional): Length of a heuristic explanation, upper bound
+        of the optimal length. Defaults to the lower bound.
+    """
+    neg, pos = positive_negative_modification_indexes(looser, winner, ndigits)
+    nb_var = len(looser)
+    minimum_k = max(len(neg), len(pos), 1)
+    maximum_k = max(minimum_k, heuristic_length or minimum_k)
+    nb_models = maximum_k - minimum_k + 1
+    return nb_models * (minimum_k + maximum_k) / 2 * nb_var**2 * (1 + nb_pi)
+
+
+def longest_expected_job_first(costs: Sequence[float]) -> List[int]:
+    """Returns the indexes of the tasks by decreasing expected cost
+    (ties keep the order of the tasks).
+
+    Args:
+        costs (Sequence[float]): Expected cost of each task.
+    """
+    return sorted(range(len(costs)), key=lambda k: -costs[k])
+
+
+def assign_workers(costs: Sequence[float], nb_workers: int):
+    """Assigns the tasks, by decreasing expected cost, to the least loaded worker.
+    Returns the indexes of the tasks of each worker and the expected makespan.
+
+    Args:
+        costs (Sequence[float]): Expected cost of each task.
+        nb_workers (int): Number of workers.
+    """
+    assignment: List[List[int]] = [[] for _ in range(nb_workers)]
+    loads = [(0.0, w) for w in range(nb_workers)]
+    heapify(loads)
+    for k in longest_expected_job_first(costs):
+        load, w = loads[0]
+        assignment[w].append(k)
+        heapreplace(loads, (load + costs[k], w))
+    return assignment, max(load for load, _ in loads)
+
+
+def longest_expected_job_first_results(
+    pool, function: Callable, tasks_args: Sequence, costs: Sequence[float]
+):
+    """Submits function(*args) for each task to the pool by decreasing expected cost,
+    so that idle workers always take the longest remaining task. Yields the index of
+    each task and its result as soon as it is completed.
+
+    Args:
+        pool (Executor): Pool of workers.
+        function (Callable): Picklable function computing a task.
+        tasks_args (Sequence): Arguments of each task.
+        costs (Sequence[float]): Expected cost of each task.
+    """
+    futures = {
+        pool.submit(function, *tasks_args[k]): k
+        for k in longest_expected_job_first(costs)
+    }
+    for future in as_completed(futures):
+        yield futures[future], future.result()
+
+
+def run_longest_expected_job_first(
+    function: Callable,
+    tasks_args: Sequence,
+    costs: Sequence[float],
+    nb_process: int,
+    initializer: Optional[Callable] = None,
+    initargs: Tuple = (),
+):
+    """Runs function(*args) for each task in a process pool, submitting the tasks by
+    decreasing expected cost (see longest_expected_job_first_results).
+    Yields the index of each task and its result as soon as it is completed.
+
+    Args:
+        function (Callable): Picklable function computing a task.
+        tasks_args (Sequence): Arguments of each task.
+        costs (Sequence[float]): Expected cost of each task.
+        nb_process (int): Number of worker processes.
+        initializer (Callable, optional): Picklable function called with initargs
+        at the start of each worker process (e.g. enable_run_options, the process-wide
+        options not being inherited under spawn). Defaults to none.
+        initargs (Tuple, optional): Arguments of the initializer. Defaults to none.
+    """
+    with ProcessPoolExecutor(
+        max_workers=nb_process, initializer=initializer, initargs=initargs
+    ) as pool:
+        yield from longest_expected_job_first_results(pool, function, tasks_args, costs)
@@ -0,0 +1,111 @@
+"""Functions managing the structured log of the solver, disabled by default :
+    - enabling the log (JSON lines file) and disabling it
+    - logging the statistics of a solved model (method, k, status, runtime, nodes,
+    gap, number of variables and constraints), only when the log is enabled
+    - adding and removing hooks called with each solved model (e.g. collecting the
+    models to tune, see solver_profiles)
+"""
+from json import dumps
+from math import isfinite
+from logging import DEBUG, FileHandler, Formatter, getLogger
+from typing import Callable, List
+
+SOLVER_LOGGER = getLogger("package.solver")
+
+# Gurobi attribute -> name in the log
+SOLVER_STATISTICS = {
+    "Status": "status",
+    "Runtime": "runtime",
+    "NodeCount": "nodes",
+    "IterCount": "iterations",
+    "MIPGap": "gap",
+    "NumVars": "nb_vars",
+    "NumBinVars": "nb_bin_vars",
+    "NumConstrs": "nb_constrs",
+}
+
+
+# Functions called with each solved model, its method and k (see log_solve)
+SOLVE_HOOKS: List[Callable] = []
+
+
+def enable_solver_log(file_name: str):
+    """Enables the solver log, appending one JSON line by solved model to the file.
+    Returns the handler of the log (see disable_solver_log).
+
+    Args:
+        file_name (str): Path to the log file.
+    """
+    handler = FileHandler(file_name, encoding="utf8")
+    handler.setFormatter(Formatter("%(message)s"))
+    SOLVER_LOGGER.addHandler(handler)
+    SOLVER_LOGGER.setLevel(DEBUG)
+    return handler
+
+
+def disable_solver_log(handler=None):
+    """Disables the solver log, closing the handler returned by enable_solver_log.
+
+    Args:
+        handler (Handler, optional): Handler to remove. Defaults to none.
+    """
+    if handler is not None:
+        SOLVER_LOGGER.removeHandler(handler)
+        handler.close()
+    if not SOLVER_LOGGER.handlers:
+        SOLVER_LOGGER.setLevel(0)
+
+
+def solver_statistics(m) -> dict:
+    """Returns the statistics of a solved model (None when not available or not
+    finite, e.g. the gap of a linear program or of an infeasible model).
+
+    Args:
+        m (Model): Gurobi model.
+    """
+    statistics = {}
+    for attribute, name in SOLVER_STATISTICS.items():
+        try:
+            value = getattr(m, attribute)
+        except AttributeError:
+            value = None
+        statistics[name] = value if value is None or isfinite(value) else None
+    return statistics
+
+
+def add_solve_hook(hook: Callable):
+    """Adds a function called with each solved model, its method and k.
+
+    Args:
+        hook (Callable): Function of the model, the method and k.
+    """
+    SOLVE_HOOKS.append(hook)
+
+
+def remove_solve_hook(hook: Callable):
+    """Removes a function added with add_solve_hook.
+
+    Args:
+        hook (Callable): Function to remove.
+    """
+    SOLVE_HOOKS.remove(hook)
+
+
+def log_solve(m, method: str, k=None):
+    """Logs the statistics of a solved model if the solver log is enabled and calls
+    the solve hooks with it.
+
+    Args:
+        m (Model): Gurobi model.
+        method (str): Name of the method solving the model.
+        k (int, optional): Length of the explanation searched by the model.
+        Defaults to none (model without length).
+    """
+    for hook in SOLVE_HOOKS:
+        hook(m, method, k)
+    if SOLVER_LOGGER.isEnabledFor(DEBUG):
+        SOLVER_LOGGER.debug(
+            dumps(
+                {"method": method, "model": m.ModelName, "k": k, **solver_statistics(m)}
+            )
+        )
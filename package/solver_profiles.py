@@ -0,0 +1,256 @@
+"""Functions managing the parameter profiles of the solver, disabled by default :
+    - using the profiles of a folder (one JSON file by method, one profile by class of
+    instances: number of criteria and precision) and no longer using them
+    - applying the profile of its method and class to a model (in the model builders)
+    - collecting the models solved by a method (the last model of each call)
+    - tuning models with the solver and keeping the parameters changed by the tuning
+    - choosing the profile minimizing the total runtime of models and saving it
+"""
+from json import dumps, loads
+from os import makedirs
+from os.path import exists as pathexists
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Lock, get_ident
+from typing import Callable, Dict, List, Optional
+from gurobipy import GRB, Env
+from .solver_log import add_solve_hook, remove_solve_hook
+
+TUNE_TIME_LIMIT = 60
+
+PROFILES_PATH: Optional[str] = None
+# Profiles of each method already read from PROFILES_PATH
+PROFILES: Dict[str, Dict[str, Dict]] = {}
+
+
+def use_solver_profiles(path: str):
+    """Makes the model builders apply the profiles of the folder.
+
+    Args:
+        path (str): Folder of the profiles (see save_solver_profile).
+    """
+    global PROFILES_PATH
+    PROFILES_PATH = path
+    PROFILES.clear()
+
+
+def disable_solver_profiles():
+    """Makes the model builders keep their own parameters."""
+    global PROFILES_PATH
+    PROFILES_PATH = None
+    PROFILES.clear()
+
+
+def profile_class(nb_var: int, ndigits: int) -> str:
+    """Returns the name of the class of instances of a profile.
+
+    Args:
+        nb_var (int): Number of criteria.
+        ndigits (int): Precision (number of digit after the coma).
+    """
+    return f"{int(nb_var)}cri_{int(ndigits)}digits"
+
+
+def load_solver_profiles(path: str, method: str) -> Dict[str, Dict]:
+    """Loads the profiles of a method by class of instances (empty if the method has
+    no profile file).
+
+    Args:
+        path (str): Folder of the profiles.
+        method (str): Name of the method (as in the solver log).
+    """
+    file_name = Path(path) / f"{method}.json"
+    if not pathexists(file_name):
+        return {}
+    return loads(file_name.read_text(encoding="utf8"))
+
+
+def save_solver_profile(
+    path: str, method: str, nb_var: int, ndigits: int, parameters: Dict
+):
+    """Saves the profile of a method for a class of instances in the profile file of
+    the method, keeping the profiles of the other classes.
+
+    Args:
+        path (str): Folder of the profiles.
+        method (str): Name of the method (as in the solver log).
+        nb_var (int): Number of criteria.
+        ndigits (int): Precision (number of digit after the coma).
+        parameters (Dict): Values of the parameters by name.
+    """
+    if not pathexists(path):
+        makedirs(path)
+    profiles = load_solver_profiles(path, method)
+    profiles[profile_class(nb_var, ndigits)] = parameters
+    (Path(path) / f"{method}.json").write_text(
+        dumps(profiles, indent=4, sort_keys=True), encoding="utf8"
+    )
+
+
+def apply_solver_profile(m, method: str, nb_var: int, ndigits: int):
+    """Sets the parameters of the profile of the method and class of the model, if the
+    profiles are used and such a profile exists.
+
+    Args:
+        m (Model): Gurobi model.
+        method (str): Name of the method (as in the solver log).
+        nb_var (int): Number of criteria.
+        ndigits (int): Precision (number of digit after the coma).
+    """
+    if PROFILES_PATH is None:
+        return
+    if method not in PROFILES:
+        PROFILES[method] = load_solver_profiles(PROFILES_PATH, method)
+    for name, value in PROFILES[method].get(profile_class(nb_var, ndigits), {}).items():
+        m.setParam(name, value)
+
+
+def collect_solved_models(
+    function: Callable, instances: List, method: str, env=None
+) -> List:
+    """Calls function(*args) for each instance and returns a copy of the last model
+    of the method solved by each call in each thread (the model of the explanation
+    found, or of each block solved in a parallel thread, see restricted_optimum).
+
+    Args:
+        function (Callable): Explanation method.
+        instances (List[Tuple]): Arguments of each call.
+        method (str): Name of the method (as in the solver log).
+        env (Env, optional): Gurobi environment of the copies, which outlive the
+        environments of the models solved in parallel threads. Defaults to the default
+        environment.
+    """
+    models = []
+    # Last model of the method solved by each thread of the current call
+    solved: Dict[int, object] = {}
+    lock = Lock()
+
+    def collect(m, solved_method, _):
+        """Solve hook keeping a copy of the last model of the method of the thread."""
+        if solved_method == method:
+            copy = m.copy(env=env)
+            with lock:
+                previous = solved.pop(get_ident(), None)
+                solved[get_ident()] = copy
+            if previous is not None:
+                previous.dispose()
+
+    add_solve_hook(collect)
+    try:
+        for args in instances:
+            try:
+                function(*args)
+            except StopIteration:
+                pass
+            with lock:
+                models.extend(solved.values())
+                solved.clear()
+    finally:
+        remove_solve_hook(collect)
+    return models
+
+
+def read_parameters(m) -> Dict:
+    """Returns the parameters of the model which differ from their default value.
+
+    Args:
+        m (Model): Gurobi model.
+    """
+    with TemporaryDirectory() as folder:
+        file_name = Path(folder) / "parameters.prm"
+        m.write(str(file_name))
+        lines = file_name.read_text(encoding="utf8").splitlines()
+    parameters = {}
+    for line in lines:
+        if line and not line.startswith("#"):
+            name, value = line.split()[:2]
+            try:
+                parameters[name] = int(value)
+            except ValueError:
+                parameters[name] = float(value)
+    return parameters
+
+
+def tune_model(m, tune_time_limit: float = TUNE_TIME_LIMIT) -> Dict:
+    """Runs the tuning of the solver on the model and returns the parameters changed
+    by the best result (empty if the tuning found nothing better).
+
+    Args:
+        m (Model): Gurobi model.
+        tune_time_limit (float, optional): Duration of the tuning in seconds.
+        The default value is TUNE_TIME_LIMIT.
+    """
+    before = read_parameters(m)
+    m.Params.TuneTimeLimit = tune_time_limit
+    m.Params.TuneResults = 1
+    m.Params.TuneOutput = 0
+    m.tune()
+    if m.TuneResultCount == 0:
+        return {}
+    m.getTuneResult(0)
+    return {
+        name: value
+        for name, value in read_parameters(m).items()
+        if not name.startswith("Tune") and before.get(name) != value
+    }
+
+
+def total_runtime(models: List, parameters: Dict) -> float:
+    """Returns the total runtime of copies of the models solved with the parameters
+    (the time limit for the models not solved in time).
+
+    Args:
+        models (List[Model]): Gurobi models.
+        parameters (Dict): Values of the parameters by name.
+    """
+    runtime = 0.0
+    for model in models:
+        m = model.copy()
+        for name, value in parameters.items():
+            m.setParam(name, value)
+        m.optimize()
+        runtime += m.Params.TimeLimit if m.Status == GRB.TIME_LIMIT else m.Runtime
+        m.dispose()
+    return runtime
+
+
+def tune_method(
+    function: Callable,
+    instances: List,
+    method: str,
+    nb_var: int,
+    ndigits: int,
+    path: str,
+    tune_time_limit: float = TUNE_TIME_LIMIT,
+) -> Dict:
+    """Tunes the solver for a method on a sample of instances of a class: each model
+    solved by the method is tuned and the profile (the parameters of one tuning, or
+    the parameters of the model builder) with the smallest total runtime over all the
+    models is saved. Returns the profile saved.
+    The cache of the explanation methods must be disabled.
+
+    Args:
+        function (Callable): Explanation method.
+        instances (List[Tuple]): Arguments of each call of the method.
+        method (str): Name of the method (as in the solver log).
+        nb_var (int): Number of criteria.
+        ndigits (int): Precision (number of digit after the coma).
+        path (str): Folder of the profiles.
+        tune_time_limit (float, optional): Duration of the tuning of each model in
+        seconds. The default value is TUNE_TIME_LIMIT.
+    """
+    with Env(params={"OutputFlag": 0}) as env:
+        models = collect_solved_models(function, instances, method, env)
+        candidates = [{}]
+        for m in models:
+            tuned = m.copy()
+            parameters = tune_model(tuned, tune_time_limit)
+            tuned.dispose()
+            if parameters not in candidates:
+                candidates.append(parameters)
+        runtimes = [total_runtime(models, parameters) for parameters in candidates]
+        for m in models:
+            m.dispose()
+    profile = candidates[runtimes.index(min(runtimes))]
+    save_solver_profile(path, method, nb_var, ndigits, profile)
+    return profile
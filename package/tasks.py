@@ -0,0 +1,306 @@
+"""Functions computing the explanation tasks of the experiments, shared by the
+explanation drivers, the distributed workers, the benchmarks and the tuning :
+    - building the results row of an explanation (length, compute time, number
+    of preferential information statements and duration of each phase)
+    - computing an explanation method and saving its results row
+    - computing an explanation method and saving its results row when it requires
+    a Farkas certificate
+    - collecting the results row (and the explanation) of a task
+    - loading the data of an experiment fold
+The methods of each kind of experiment, with the dominances they explain and their
+task arguments, are listed in METHODS and KINDS.
+"""
+from time import perf_counter
+from multiprocessing.context import TimeoutError as TimedOut
+from package.plot.types import PREFERENTIAL_INFORMATION
+from package.timing import start_phases, phase_durations
+from package.data.layout import ExperimentLayout
+from package.data.load import (
+    load_dataset,
+    load_cached_meta_data,
+    load_restricted_lorenz_dominances,
+    load_generalized_lorenz_dominances,
+    load_robust_redistributive_owa_dominances,
+)
+from package.restricted_lorenz import (
+    hardy_littlewood_polya,
+    contribution_heuristics,
+    restricted_optimum,
+)
+from package.restricted_lorenz.solving.hlp import FILE_NAME as hlp_file
+from package.restricted_lorenz.solving.contribution_algo import (
+    FILE_NAME as contrib_file,
+)
+from package.restricted_lorenz.solving.optimum import FILE_NAME as r_optim_file
+from package.generalized_lorenz import (
+    gift_after_hardy_littlewood_polya,
+    gift_after_contribution_heuristics,
+    generalized_optimum,
+)
+from package.generalized_lorenz.solving.after_hlp import FILE_NAME as after_hlp_file
+from package.generalized_lorenz.solving.after_contribution_algo import (
+    FILE_NAME as after_contrib_file,
+)
+from package.generalized_lorenz.solving.optimal import FILE_NAME as g_optim_file
+from package.robust_owa.solving.farkas import (
+    first_farkas,
+    minimum_length_farkas,
+)
+from package.robust_owa.solving.farkas.first_farkas import (
+    FARKAS_NAME as first_farkas_name,
+)
+from package.robust_owa.solving.farkas.min_nb_pi import FARKAS_NAME as min_farkas_name
+from package.robust_owa.solving.atx import robust_optimum
+from package.robust_owa.solving.atx.optimal import FILE_NAME as atx_optim_file
+from package.robust_owa.solving.ctx import (
+    ctx_from_farkas_displaced,
+)
+from package.robust_owa.solving.ctx.from_farkas_displaced import (
+    file_name as ctx_displaced_file,
+)
+
+
+def perf_row(length: int, elapsed: float, nb_pi: int):
+    """Returns the results row of an explanation : its length, its compute time,
+    the number of preferential information statements used and the duration of
+    each phase of the computation (setup, build, solve, extract, io; see PHASES).
+
+    Args:
+        length (int): Length of the explanation (or -1, -2, -3 on failure).
+        elapsed (float): Compute time.
+        nb_pi (int): Number of preferential information statements used.
+    """
+    return [length, elapsed, nb_pi, *phase_durations(elapsed)]
+
+
+def save_with_perf(writer, computation_func, args, sink=None):
+    """Executes the given explanation computation and saves its length, compute time
+    and the duration of its phases (see perf_row).
+
+    Args:
+        writer (Generator): Data saver.
+        computation_func (Callable): Explanation function to compute.
+        args (Tuple): Explanation function arguments.
+        sink (Generator, optional): Receives the explanation (steps, symbols)
+        once the compute time is measured. Defaults to no explanation output.
+    """
+    start_phases()
+    start_compute = perf_counter()
+    try:
+        l, ex, sy = computation_func(*args)
+    except TimedOut:
+        l = -3
+        end_compute = perf_counter()
+        writer.send(perf_row(l, end_compute - start_compute, l))
+        return
+    end_compute = perf_counter()
+    writer.send(
+        perf_row(l, end_compute - start_compute, sy.count(PREFERENTIAL_INFORMATION))
+    )
+    if sink is not None:
+        sink.send((ex, sy))
+
+
+def save_with_perf_farkas(
+    writer,
+    computation_func,
+    farkas_func,
+    args_computation,
+    args_farkas,
+    sink=None,
+):
+    """Executes the given explanation computation and the given farkas certificate
+    computation it requires and saves its length, compute time and the duration
+    of its phases (see perf_row).
+    If the Farkas function did not find a certificate, saves -2 as legnth and
+    if explanation method did not find an explanation, saves -1 as length instead.
+
+    Args:
+        writer (Generator): Data saver.
+        computation_func (Callable): Explanation function to compute.
+        farkas_func (Callable): Farkas certificate function to compute.
+        args_computation (Tuple): Explanation function arguments.
+        args_farkas (Tuple): Farkas certificate function arguments.
+        sink (Generator, optional): Receives the explanation (steps, symbols)
+        once the compute time is measured. Defaults to no explanation output.
+    """
+    start_phases()
+    start_compute = perf_counter()
+    try:
+        nu_minus, nu_plus, mu, lmbd = farkas_func(*args_farkas)
+    except StopIteration:
+        l = -2
+        end_compute = perf_counter()
+        writer.send(perf_row(l, end_compute - start_compute, l))
+        return
+    except TimedOut:
+        l = -3
+        end_compute = perf_counter()
+        writer.send(perf_row(l, end_compute - start_compute, l))
+        return
+    try:
+        l, ex, sy = computation_func(*args_computation, nu_minus, nu_plus, mu, lmbd)
+        end_compute = perf_counter()
+        writer.send(
+            perf_row(l, end_compute - start_compute, sy.count(PREFERENTIAL_INFORMATION))
+        )
+        if sink is not None:
+            sink.send((ex, sy))
+        return
+    except StopIteration:
+        l = -1
+    except TimedOut:
+        l = -3
+    end_compute = perf_counter()
+    writer.send(perf_row(l, end_compute - start_compute, l))
+
+
+def collect_row(save, *args):
+    """Executes save(writer, *args) and returns the row sent to the writer.
+
+    Args:
+        save (Callable): save_with_perf or save_with_perf_farkas.
+        args (Tuple): Arguments of save after the writer.
+    """
+    return collect_explained_row(save, *args)[0]
+
+
+def collect_explained_row(save, *args):
+    """Executes save(writer, *args) with an explanation sink and returns the row sent
+    to the writer and the explanation (steps, symbols) sent to the sink
+    (None if the method did not find an explanation).
+
+    Args:
+        save (Callable): save_with_perf or save_with_perf_farkas.
+        args (Tuple): Arguments of save after the writer.
+    """
+    rows, explanations = [], []
+
+    def collector(received):
+        """Generator object which receives data and keeps it in received."""
+        while True:
+            received.append((yield None))
+
+    writer = collector(rows)
+    writer.send(None)
+    sink = collector(explanations)
+    sink.send(None)
+    save(writer, *args, sink=sink)
+    return rows[0], explanations[0] if explanations else None
+
+
+DOMINANCES = {
+    "restricted": load_restricted_lorenz_dominances,
+    "generalized": load_generalized_lorenz_dominances,
+    "robust": load_robust_redistributive_owa_dominances,
+}
+
+# Method (results file name) -> dominances explained, exact method, task arguments
+METHODS = {
+    hlp_file: (
+        "restricted",
+        False,
+        lambda a, b, pi, low, high, p: (
+            save_with_perf,
+            hardy_littlewood_polya,
+            (a, b, p),
+        ),
+    ),
+    contrib_file: (
+        "restricted",
+        False,
+        lambda a, b, pi, low, high, p: (
+            save_with_perf,
+            contribution_heuristics,
+            (a, b, p),
+        ),
+    ),
+    r_optim_file: (
+        "restricted",
+        True,
+        lambda a, b, pi, low, high, p: (
+            save_with_perf,
+            restricted_optimum,
+            (a, b, low, high, p),
+        ),
+    ),
+    after_hlp_file: (
+        "generalized",
+        False,
+        lambda a, b, pi, low, high, p: (
+            save_with_perf,
+            gift_after_hardy_littlewood_polya,
+            (a, b, p),
+        ),
+    ),
+    after_contrib_file: (
+        "generalized",
+        False,
+        lambda a, b, pi, low, high, p: (
+            save_with_perf,
+            gift_after_contribution_heuristics,
+            (a, b, p),
+        ),
+    ),
+    g_optim_file: (
+        "generalized",
+        True,
+        lambda a, b, pi, low, high, p: (
+            save_with_perf,
+            generalized_optimum,
+            (a, b, low, high, p),
+        ),
+    ),
+    atx_optim_file: (
+        "robust",
+        True,
+        lambda a, b, pi, low, high, p: (
+            save_with_perf,
+            robust_optimum,
+            (a, b, low, high, p, pi),
+        ),
+    ),
+    ctx_displaced_file(min_farkas_name): (
+        "robust",
+        True,
+        lambda a, b, pi, low, high, p: (
+            save_with_perf_farkas,
+            ctx_from_farkas_displaced,
+            minimum_length_farkas,
+            (a, b, pi, low, high, p),
+            (a, b, p, pi),
+        ),
+    ),
+    ctx_displaced_file(first_farkas_name): (
+        "robust",
+        True,
+        lambda a, b, pi, low, high, p: (
+            save_with_perf_farkas,
+            ctx_from_farkas_displaced,
+            first_farkas,
+            (a, b, pi, low, high, p),
+            (a, b, p, pi),
+        ),
+    ),
+}
+
+KINDS = {
+    "int_fixed": ("restricted",),
+    "int": ("restricted", "generalized"),
+    "float": ("restricted", "generalized", "robust"),
+}
+
+
+def load_fold(exp_path: str, fold: int):
+    """Returns the meta data, the candidates and the preferential information
+    statements of a fold.
+
+    Args:
+        exp_path (str): Path to the root of the experiment folder.
+        fold (int): Index of the fold.
+    """
+    meta = load_cached_meta_data(exp_path)
+    data, pi_statements = load_dataset(
+        ExperimentLayout(exp_path).fold(fold).path, meta[9]
+    )
+    return meta, data, pi_statements
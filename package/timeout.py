@@ -1,5 +1,7 @@
 from multiprocessing.pool import ThreadPool
 from functools import wraps
+from time import perf_counter
+from .timing import add_phase, phases_propagated
 
 TIMEOUT = 150
 
@@ -13,11 +15,30 @@ def timeout_decorator(item):
 
     @wraps(item)
     def func_wrapper(*args, **kwargs):
-        """Closure for function."""
-        with ThreadPool(processes=1) as pool:
-            async_result = pool.apply_async(item, args, kwargs)
-            # raises a TimeoutError if execution exceeds max_timeout
-            return async_result.get(TIMEOUT)
+        """Closure for function. The time spent outside the original function
+        (thread pool creation and termination) is counted in the setup phase, the
+        original function being measured within the task of the calling thread."""
+        inside = []
+
+        def timed_item(*args, **kwargs):
+            """Original function, measuring its own duration."""
+            start = perf_counter()
+            try:
+                return item(*args, **kwargs)
+            finally:
+                inside.append(perf_counter() - start)
+
+        start = perf_counter()
+        try:
+            with ThreadPool(processes=1) as pool:
+                async_result = pool.apply_async(
+                    phases_propagated(timed_item), args, kwargs
+                )
+                # raises a TimeoutError if execution exceeds max_timeout
+                return async_result.get(TIMEOUT)
+        finally:
+            if inside:
+                add_phase("setup", perf_counter() - start - inside[0])
 
     return func_wrapper
 
@@ -0,0 +1,135 @@
+"""Functions measuring the phases of an explanation task :
+    - starting the measure of a task
+    - recording the duration of a phase
+    - running a function in another thread within the measure of the current task
+    - building the lap function timing consecutive phases of a computation
+    - reading the duration of each phase of the task
+The phases are the setup (thread pool of the timeout), the model building,
+the solving, the extraction of the explanation and the output (I/O).
+The durations are kept by task, in the thread which started its measure and
+in the threads computing it (see phases_propagated), and the laps recorded after
+the durations were read (e.g. by the thread of a timed out task) are discarded.
+"""
+from functools import wraps
+from threading import Lock, local
+from time import perf_counter
+from typing import Callable, List, Optional
+
+PHASES = ("setup", "build", "solve", "extract", "io")
+
+
+class PhaseDurations:
+    """Durations of the phases of a task, added by the threads computing it
+    until they are read.
+    """
+
+    def __init__(self):
+        self.durations = dict.fromkeys(PHASES, 0.0)
+        self.closed = False
+        self.lock = Lock()
+
+    def add(self, phase: str, duration: float):
+        """Adds a duration to a phase, unless the durations were read.
+
+        Args:
+            phase (str): Name of the phase (see PHASES).
+            duration (float): Duration in seconds.
+        """
+        with self.lock:
+            if not self.closed:
+                self.durations[phase] += duration
+
+    def close(self) -> List[float]:
+        """Returns the duration of each phase, in the order of PHASES, and discards
+        the durations added afterwards.
+        """
+        with self.lock:
+            self.closed = True
+            return [self.durations[phase] for phase in PHASES]
+
+
+# Measure of the task computed by each thread
+CURRENT_TASK = local()
+
+
+def current_phases() -> Optional[PhaseDurations]:
+    """Returns the phase durations of the task computed by the thread
+    (None outside a measured task).
+    """
+    return getattr(CURRENT_TASK, "phases", None)
+
+
+def start_phases() -> PhaseDurations:
+    """Starts the measure of a new task in the thread and returns its phase
+    durations."""
+    CURRENT_TASK.phases = PhaseDurations()
+    return CURRENT_TASK.phases
+
+
+def add_phase(phase: str, duration: float):
+    """Adds a duration to a phase of the task computed by the thread.
+
+    Args:
+        phase (str): Name of the phase (see PHASES).
+        duration (float): Duration in seconds.
+    """
+    phases = current_phases()
+    if phases is not None:
+        phases.add(phase, duration)
+
+
+def phases_propagated(function: Callable) -> Callable:
+    """Returns function, run within the measure of the task computed by the calling
+    thread whatever the thread running it (e.g. a thread of a pool).
+
+    Args:
+        function (Callable): Function to run in another thread.
+    """
+    phases = current_phases()
+
+    @wraps(function)
+    def in_phases(*args, **kwargs):
+        """Function run with the phase durations of the calling thread."""
+        previous = current_phases()
+        CURRENT_TASK.phases = phases
+        try:
+            return function(*args, **kwargs)
+        finally:
+            CURRENT_TASK.phases = previous
+
+    return in_phases
+
+
+def phase_lap_factory():
+    """Builds the phase_lap function, which adds the time elapsed since the previous
+    lap (or since the factory call) to the given phase.
+    """
+    last = [perf_counter()]
+
+    def phase_lap(phase: str):
+        """Adds the time elapsed since the previous lap to the phase.
+
+        Args:
+            phase (str): Name of the phase (see PHASES).
+        """
+        now = perf_counter()
+        add_phase(phase, now - last[0])
+        last[0] = now
+
+    return phase_lap
+
+
+def phase_durations(elapsed: float) -> List[float]:
+    """Returns the duration of each phase of the task computed by the thread, in the
+    order of PHASES, and ends its measure. The part of the elapsed time not covered
+    by any phase (computations that are not instrumented, such as the heuristics)
+    is counted in the solving phase. The phases of blocks solved in parallel threads
+    are summed.
+
+    Args:
+        elapsed (float): Total duration of the task.
+    """
+    phases = current_phases()
+    durations = phases.close() if phases is not None else [0.0] * len(PHASES)
+    durations[PHASES.index("solve")] += max(elapsed - sum(durations), 0.0)
+    return durations
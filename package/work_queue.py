@@ -0,0 +1,232 @@
+"""Functions managing a queue of explanation tasks in a SQLite database
+(on a storage shared by the coordinator and the workers) :
+    - creating the queue
+    - adding tasks (experiment, fold, method, chunk of pairs)
+    - claiming atomically the most expensive pending task (or a task whose worker
+    did not complete it before the lease ended)
+    - renewing the lease of a task while its worker computes it
+    - saving the results of a task
+    - reading the progress of the queue and the results of an experiment fold
+"""
+from contextlib import closing, contextmanager
+from sqlite3 import connect
+from threading import Event, Thread
+from time import time
+from typing import Iterable, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    experiment TEXT NOT NULL,
+    fold INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    stop INTEGER NOT NULL,
+    cost REAL NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    claimed REAL,
+    UNIQUE (experiment, fold, method, start)
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, cost);
+CREATE TABLE IF NOT EXISTS results (
+    experiment TEXT NOT NULL,
+    fold INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    i INTEGER NOT NULL,
+    j INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    time REAL NOT NULL,
+    nb_pi INTEGER NOT NULL,
+    setup REAL,
+    build REAL,
+    solve REAL,
+    extract REAL,
+    io REAL,
+    PRIMARY KEY (experiment, fold, method, i, j)
+);
+"""
+
+LEASE = 3600.0
+HEARTBEAT = LEASE / 6
+
+
+def connect_queue(db_path: str):
+    """Returns a connection to the queue database, in autocommit mode so that
+    transactions are explicitly started, and waiting for locks held by other nodes.
+
+    Args:
+        db_path (str): Path to the SQLite database.
+    """
+    return connect(db_path, timeout=600.0, isolation_level=None)
+
+
+def create_queue(db_path: str):
+    """Creates the tables of the queue if they do not exist.
+
+    Args:
+        db_path (str): Path to the SQLite database.
+    """
+    with closing(connect_queue(db_path)) as connection:
+        connection.executescript(SCHEMA)
+
+
+def add_tasks(db_path: str, tasks: Iterable[Tuple[str, int, str, int, int, float]]):
+    """Adds the tasks (experiment, fold, method, start, stop, cost) to the queue.
+    A task covers the pairs of indexes start to stop (excluded) of the dominance list
+    of the method. Tasks already in the queue are kept as they are.
+
+    Args:
+        db_path (str): Path to the SQLite database.
+        tasks (Iterable[Tuple[str, int, str, int, int, float]]): Tasks to add.
+    """
+    with closing(connect_queue(db_path)) as connection:
+        connection.execute("BEGIN IMMEDIATE")
+        connection.executemany(
+            "INSERT OR IGNORE INTO tasks (experiment, fold, method, start, stop, cost)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            tasks,
+        )
+        connection.execute("COMMIT")
+
+
+def claim_task(connection, worker: str, lease: float = LEASE):
+    """Claims the most expensive pending task, or a running task claimed more than
+    lease seconds ago (its worker is considered dead).
+    Returns (id, experiment, fold, method, start, stop) or None if no task is left.
+
+    Args:
+        connection (Connection): Connection to the queue database.
+        worker (str): Name of the worker.
+        lease (float, optional): Duration in seconds after which a running task can be
+        claimed again. The default value is 3600.
+    """
+    now = time()
+    connection.execute("BEGIN IMMEDIATE")
+    task = connection.execute(
+        "SELECT id, experiment, fold, method, start, stop FROM tasks"
+        " WHERE status = 'pending' OR (status = 'running' AND claimed < ?)"
+        " ORDER BY cost DESC, id LIMIT 1",
+        (now - lease,),
+    ).fetchone()
+    if task is not None:
+        connection.execute(
+            "UPDATE tasks SET status = 'running', worker = ?, claimed = ? WHERE id = ?",
+            (worker, now, task[0]),
+        )
+    connection.execute("COMMIT")
+    return task
+
+
+def renew_lease(connection, task, worker: str):
+    """Renews the lease of a running task still claimed by the worker.
+
+    Args:
+        connection (Connection): Connection to the queue database.
+        task (Tuple): Task returned by claim_task.
+        worker (str): Name of the worker.
+    """
+    connection.execute("BEGIN IMMEDIATE")
+    connection.execute(
+        "UPDATE tasks SET claimed = ?"
+        " WHERE id = ? AND worker = ? AND status = 'running'",
+        (time(), task[0], worker),
+    )
+    connection.execute("COMMIT")
+
+
+@contextmanager
+def lease_heartbeat(db_path: str, task, worker: str, interval: float = HEARTBEAT):
+    """Context manager renewing the lease of the task every interval seconds
+    (see renew_lease) while its worker computes it, so that a task longer than the
+    lease is not claimed again by another worker.
+
+    Args:
+        db_path (str): Path to the SQLite database.
+        task (Tuple): Task returned by claim_task.
+        worker (str): Name of the worker.
+        interval (float, optional): Duration in seconds between two renewals, shorter
+        than the lease. The default value is HEARTBEAT.
+    """
+    stop = Event()
+
+    def beat():
+        """Renews the lease until the task is computed."""
+        with closing(connect_queue(db_path)) as connection:
+            while not stop.wait(interval):
+                renew_lease(connection, task, worker)
+
+    heart = Thread(target=beat, daemon=True)
+    heart.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        heart.join()
+
+
+def complete_task(connection, task, rows: Iterable[Tuple]):
+    """Saves the results (i, j, length, time, nb_pi and the duration of each phase,
+    see PHASES) of the task and marks it done.
+
+    Args:
+        connection (Connection): Connection to the queue database.
+        task (Tuple): Task returned by claim_task.
+        rows (Iterable[Tuple]): Results of each pair.
+    """
+    task_id, experiment, fold, method, _, _ = task
+    connection.execute("BEGIN IMMEDIATE")
+    connection.executemany(
+        "INSERT OR REPLACE INTO results VALUES"
+        " (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        ((experiment, fold, method, *row) for row in rows),
+    )
+    connection.execute("UPDATE tasks SET status = 'done' WHERE id = ?", (task_id,))
+    connection.execute("COMMIT")
+
+
+def queue_progress(db_path: str):
+    """Returns the number of tasks by status.
+
+    Args:
+        db_path (str): Path to the SQLite database.
+    """
+    with closing(connect_queue(db_path)) as connection:
+        return dict(
+            connection.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status")
+        )
+
+
+def queue_methods(db_path: str):
+    """Returns the (experiment, fold, method) of the queue whose tasks are all done.
+
+    Args:
+        db_path (str): Path to the SQLite database.
+    """
+    with closing(connect_queue(db_path)) as connection:
+        return connection.execute(
+            "SELECT experiment, fold, method FROM tasks GROUP BY experiment, fold, method"
+            " HAVING SUM(status != 'done') = 0 ORDER BY experiment, fold, method"
+        ).fetchall()
+
+
+def load_queue_results(db_path: str, experiment: str, fold: int, method: str):
+    """Returns the results of a method on an experiment fold (length, time, nb_pi
+    and the duration of each phase) in a dictionary keyed by pair (i, j).
+
+    Args:
+        db_path (str): Path to the SQLite database.
+        experiment (str): Path to the root of the experiment folder.
+        fold (int): Index of the fold.
+        method (str): Name of the method (its results file name).
+    """
+    with closing(connect_queue(db_path)) as connection:
+        return {
+            (i, j): list(row)
+            for i, j, *row in connection.execute(
+                "SELECT i, j, length, time, nb_pi, setup, build, solve, extract, io"
+                " FROM results"
+                " WHERE experiment = ? AND fold = ? AND method = ?",
+                (experiment, fold, method),
+            )
+        }
@@ -0,0 +1,112 @@
+"""Offline tuning of the solver parameters: for each MILP explanation method, the
+models solved on a sample of dominance pairs of the first fold of each experiment are
+tuned, and the winning parameter profile of the class of the experiment (number of
+criteria and precision) is saved in the profiles folder (see solver_profiles).
+The model builders apply the profiles once use_solver_profiles is called with the
+folder (see the solver_profiles argument of the explanation drivers).
+
+Usage:
+    python tuning.py <profiles> <experiment> [<experiment> ...]
+"""
+from sys import argv, stderr
+from numpy.random import default_rng
+from package.data.layout import ExperimentLayout
+from package.solver_profiles import TUNE_TIME_LIMIT, tune_method
+from package.tasks import (
+    DOMINANCES,
+    load_fold,
+    restricted_optimum,
+    generalized_optimum,
+    robust_optimum,
+    minimum_length_farkas,
+    first_farkas,
+    min_farkas_name,
+    first_farkas_name,
+)
+
+NB_INSTANCES = 5
+
+# Method (name in the solver log) -> dominances explained, method, method arguments
+TUNED_METHODS = {
+    "restricted_optimum": (
+        "restricted",
+        restricted_optimum,
+        lambda a, b, pi, low, high, p: (a, b, low, high, p),
+    ),
+    "generalized_optimum": (
+        "generalized",
+        generalized_optimum,
+        lambda a, b, pi, low, high, p: (a, b, low, high, p),
+    ),
+    "robust_optimum": (
+        "robust",
+        robust_optimum,
+        lambda a, b, pi, low, high, p: (a, b, low, high, p, pi),
+    ),
+    min_farkas_name: (
+        "robust",
+        minimum_length_farkas,
+        lambda a, b, pi, low, high, p: (a, b, p, pi),
+    ),
+    first_farkas_name: (
+        "robust",
+        first_farkas,
+        lambda a, b, pi, low, high, p: (a, b, p, pi),
+    ),
+}
+
+
+def tune_experiment(
+    profiles_path: str,
+    exp_path: str,
+    nb_instances: int = NB_INSTANCES,
+    tune_time_limit: float = TUNE_TIME_LIMIT,
+    seed: int = 404,
+):
+    """Tunes the solver for each MILP explanation method on pairs drawn from the
+    dominances of the first fold of the experiment and saves the profiles of the class
+    of the experiment. Returns the profile saved for each method (methods without
+    pairs to explain are skipped).
+
+    Args:
+        profiles_path (str): Folder of the profiles.
+        exp_path (str): Path to the root of the experiment folder.
+        nb_instances (int, optional): Number of pairs drawn for each method.
+        The default value is NB_INSTANCES.
+        tune_time_limit (float, optional): Duration of the tuning of each model in
+        seconds. The default value is TUNE_TIME_LIMIT.
+        seed (int, optional): Seed value for fixing randomness. The default value is 404.
+    """
+    meta, data, pi_statements = load_fold(exp_path, 0)
+    nb_var, low, high, precision = meta[3], meta[4], meta[5], meta[9]
+    fold_path = ExperimentLayout(exp_path).fold(0).path
+    rng = default_rng(seed)
+    profiles = {}
+    for method, (dominances, function, arguments) in TUNED_METHODS.items():
+        pairs = list(DOMINANCES[dominances](fold_path))
+        if not pairs:
+            continue
+        drawn = rng.choice(len(pairs), min(nb_instances, len(pairs)), replace=False)
+        instances = [
+            arguments(data[i], data[j], pi_statements, low, high, precision)
+            for i, j in (pairs[k] for k in sorted(drawn))
+        ]
+        profiles[method] = tune_method(
+            function,
+            instances,
+            method,
+            nb_var,
+            precision,
+            profiles_path,
+            tune_time_limit,
+        )
+        print(f"{exp_path} {method}: {profiles[method]}", file=stderr)
+    return profiles
+
+
+if __name__ == "__main__":
+    if len(argv) < 3:
+        print(__doc__, file=stderr)
+    else:
+        for experiment in argv[2:]:
+            tune_experiment(argv[1], experiment)